@@ -0,0 +1,59 @@
+"""
+HalfEdgeCanvas repaint time: first paint, cached repaints, edits, pan and zoom.
+"""
+import argparse
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtCore import QPoint, QRect
+from PyQt6.QtGui import QImage, QRegion
+from PyQt6.QtWidgets import QApplication
+
+from src.core.half_edge_ds import Vertex
+from src.visualization.gui import HalfEdgeCanvas
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=410, help='Grid side length')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    arrays = grid_triangulation(args.size, args.size)
+    with timed('to_half_edges'):
+        vertices, edges = arrays.to_half_edges(arrays.make_vertices())
+    print(f"{len(vertices)} vertices, {len(edges)} edges")
+
+    canvas = HalfEdgeCanvas()
+    canvas.resize(800, 800)
+    canvas.set_data(vertices, edges)
+    canvas.fit_view()
+    with timed('index edges (first paint only)'):
+        canvas.edge_scene()
+        canvas.vertex_positions()
+    with timed('build level of detail (first paint only)'):
+        canvas.edge_scene().detail_level(pixel_size=1 / canvas.view.scale)
+    image = QImage(800, 800, QImage.Format.Format_ARGB32_Premultiplied)
+
+    def repaint(label, rect=QRect(0, 0, 800, 800)):
+        with timed(label):
+            canvas.render(image, QPoint(), QRegion(rect))
+
+    repaint('first paint (renders the layer)')
+    repaint('repaint whole view (cached)')
+    canvas.set_selected_edge(edges[len(edges) // 2])
+    repaint('select an edge', canvas._edge_rect(canvas.selected_edge))
+    canvas.add_vertices([Vertex(*canvas.view.invert([(400.5, 400.5)])[0])])
+    repaint('add a vertex')
+    canvas.set_view(canvas.view.panned(40, 0))
+    repaint('pan by 40 pixels')
+    canvas.set_view(canvas.view.zoomed(0.5, (400, 400)))
+    repaint('zoom out 2x')
+    canvas.set_view(canvas.view.zoomed(8, (400, 400)))
+    repaint('zoom in 4x')
+    canvas.set_data(vertices, edges[:len(edges) // 2])
+    repaint('replace the edges (full re-render)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Saving and loading a large mesh with the SQLite Data_base.
+"""
+import argparse
+import os
+import tempfile
+
+from src.utils.database import Data_base
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=578, help='Grid side length (578 -> ~1M edges)')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    print(f"{arrays.n_vertices} vertices, {arrays.n_half_edges // 2} edges")
+    with timed('face_ids'):
+        arrays.face_ids
+    workdir = tempfile.mkdtemp()
+    try:
+        with Data_base(os.path.join(workdir, 'mesh.db')) as base:
+            with timed('save_arrays'):
+                base.save_arrays(arrays)
+            with timed('load_arrays'):
+                base.load_arrays()
+            side = args.size / 16
+            with timed('load_region (1/256 of the area)'):
+                region = base.load_region((side, side, 2 * side, 2 * side))
+            print(f"{'':<40} {region.arrays.n_half_edges // 2} edges")
+    finally:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+
+if __name__ == '__main__':
+    main()
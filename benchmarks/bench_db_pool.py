@@ -0,0 +1,79 @@
+"""
+Concurrent region reads and small writes through ConnectionPool versus one
+shared, lock-protected Data_base connection.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.database import Data_base
+from src.utils.db_pool import ConnectionPool
+from .common import grid_triangulation, timed
+
+
+def random_boxes(count, size, tile, seed=0):
+    rng = random.Random(seed)
+    boxes = []
+    for _ in range(count):
+        x = rng.uniform(0, size - tile)
+        y = rng.uniform(0, size - tile)
+        boxes.append((x, y, x + tile, y + tile))
+    return boxes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200, help='Grid side length')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--queries', type=int, default=400)
+    parser.add_argument('--writes', type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'mesh.db')
+    boxes = random_boxes(args.queries, args.size, tile=10)
+    try:
+        with Data_base(path) as base:
+            base.save_arrays(grid_triangulation(args.size, args.size))
+
+        print(f"{args.threads} threads, {args.queries} region reads, {args.writes} single-row writes")
+        shared = Data_base(path, connection=sqlite3.connect(path, check_same_thread=False))
+        lock = threading.Lock()
+
+        def locked_read(box):
+            with lock:
+                return shared.load_region(box)
+
+        def locked_write(i):
+            with lock:
+                shared.con.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (10 ** 9 + i, -1.0, -1.0))
+                shared.con.commit()
+
+        with ThreadPoolExecutor(args.threads) as ex:
+            with timed('shared connection: reads'):
+                list(ex.map(locked_read, boxes))
+            with timed('shared connection: commit per write'):
+                list(ex.map(locked_write, range(args.writes)))
+        shared.close()
+
+        with ConnectionPool(path) as pool, ThreadPoolExecutor(args.threads) as ex:
+            with timed('pool: per-thread readers'):
+                list(ex.map(lambda box: pool.reader().load_region(box), boxes))
+            with timed('pool: batched writer queue'):
+                futures = list(ex.map(
+                    lambda i: pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (2 * 10 ** 9 + i, -1.0, -1.0)),
+                    range(args.writes)))
+                for future in futures:
+                    future.result()
+    finally:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Nearest-edge picking: uniform grid index versus measuring every edge.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.algorithms.spatial_index import EdgeGrid, segment_distances
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=580, help='Grid side length')
+    parser.add_argument('--queries', type=int, default=1000, help='Number of picks')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    with timed('EdgeGrid.from_arrays'):
+        grid = EdgeGrid.from_arrays(arrays)
+    print(f"{len(grid)} edges in {grid.shape[0]}x{grid.shape[1]} cells")
+
+    rng = np.random.default_rng(0)
+    points = [tuple(p) for p in rng.uniform(0, args.size, (args.queries, 2))]
+    times = []
+    for point in points:
+        start = time.perf_counter()
+        grid.nearest(point, max_distance=10)
+        times.append(time.perf_counter() - start)
+    sizes = [len(grid.candidates(p, grid.cell_size / 2)) for p in points]
+    print(f"{'indexed pick (median / max)':<40} {np.median(times) * 1e3:.3f} / {max(times) * 1e3:.3f} ms")
+    print(f"{'':<40} median {int(np.median(sizes))} candidates")
+    with timed('brute-force pick (10 points)'):
+        for point in points[:10]:
+            segment_distances(point, grid.segments).argmin()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Exporting a large triangulation to OBJ, binary PLY and binary STL.
+
+Compares the write time with a plain copy of a file of the same size, which
+is what "disk-bound" means on this machine.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+
+from src.utils.mesh_export import write_obj, write_ply, write_stl
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1582, help='Grid side length (1582 -> ~5M triangles)')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    with timed('faces (walk face cycles)'):
+        face_sizes = arrays.faces()[1]
+    print(f"{'':<40} {len(face_sizes)} faces")
+
+    workdir = tempfile.mkdtemp()
+    try:
+        for name, writer in (('obj', write_obj), ('ply', write_ply), ('stl', write_stl)):
+            path = os.path.join(workdir, f'grid.{name}')
+            with timed(f'write_{name}'):
+                writer(arrays, path)
+            with timed(f'  copy of the {os.path.getsize(path) / 2**20:.0f} MiB file'):
+                shutil.copyfile(path, path + '.copy')
+            os.remove(path)
+            os.remove(path + '.copy')
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Incremental Delaunay: cost of recording the event log, and of replaying it.
+"""
+import argparse
+
+import numpy as np
+
+from src.algorithms.incremental_delaunay import triangulate
+from src.visualization.playback import TriangulationPlayer
+from .common import timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--points', type=int, default=20000, help='Number of random points')
+    parser.add_argument('--frames', type=int, default=300, help='Frames to replay the log in')
+    args = parser.parse_args()
+
+    coords = np.random.default_rng(0).uniform(0, 1000, (args.points, 2))
+    with timed('triangulate, in input order'):
+        triangulate(coords, sort=False)
+    with timed('triangulate'):
+        triangulate(coords)
+    with timed('triangulate, recording'):
+        arrays, log = triangulate(coords, record=True)
+    print(f"{arrays.n_half_edges // 2} edges, {len(log)} events ({log.events.nbytes / 1e6:.1f} MB)")
+
+    player = TriangulationPlayer(log, events_per_frame=-(-len(log) // args.frames))
+    with timed(f'replay in {args.frames} frames'):
+        for _ in player.frames():
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Drawing a large mesh zoomed out: every edge versus the level of detail.
+"""
+import argparse
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+import numpy as np
+from PyQt6.QtGui import QColor, QImage, QPainter, QPen
+from PyQt6.QtWidgets import QApplication
+
+from src.visualization.gui import _lines_path
+from src.visualization.lod import LevelOfDetail
+from .common import grid_triangulation, timed
+
+
+def draw(image: QImage, segments: np.ndarray) -> None:
+    painter = QPainter(image)
+    painter.setPen(QPen(QColor(0, 0, 255), 1))
+    painter.strokePath(_lines_path(segments), painter.pen())
+    painter.end()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1000, help='Grid side length')
+    parser.add_argument('--pixels', type=int, default=800, help='Screen size of the mesh')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    arrays = grid_triangulation(args.size, args.size)
+    half = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+    coords = arrays.coords * (args.pixels / args.size)
+    segments = np.hstack([coords[arrays.origin[half]], coords[arrays.target[half]]])
+    print(f"{len(segments)} edges on {args.pixels}x{args.pixels} pixels")
+
+    with timed('LevelOfDetail build'):
+        lod = LevelOfDetail(segments)
+    for level in lod.levels:
+        print(f"{'':<40} cell {level.cell_size:6.2f}: {len(level.edges)} edges")
+    image = QImage(args.pixels, args.pixels, QImage.Format.Format_ARGB32_Premultiplied)
+    with timed('draw every edge'):
+        draw(image, segments)
+    for pixel_size in (1.0, 2.0, 8.0):
+        level = lod.select(pixel_size)
+        with timed(f'draw level for {pixel_size:g} units per pixel'):
+            draw(image, segments if level is None else level.segments)
+
+
+if __name__ == '__main__':
+    main()
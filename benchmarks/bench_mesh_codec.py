@@ -0,0 +1,56 @@
+"""
+Size and decode speed of the compressed mesh format.
+
+Compares every compression setting with the OBJ text export and the
+uncompressed binary mesh file of the same triangulation.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from src.utils.mesh_codec import load_compressed, save_compressed
+from src.utils.mesh_export import write_obj
+from src.utils.mesh_file import save_mesh
+from .common import grid_triangulation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=708, help='Grid side length (708 -> ~1M triangles)')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    workdir = tempfile.mkdtemp()
+    try:
+        obj_path = os.path.join(workdir, 'grid.obj')
+        write_obj(arrays, obj_path)
+        obj_size = os.path.getsize(obj_path)
+        mesh_path = os.path.join(workdir, 'grid.hem')
+        save_mesh(arrays, mesh_path)
+        print(f"{'OBJ text':<28} {obj_size / 2**20:8.1f} MiB")
+        print(f"{'binary mesh file':<28} {os.path.getsize(mesh_path) / 2**20:8.1f} MiB")
+        print(f"{'setting':<28} {'size':>8}     {'vs OBJ':>7} {'encode':>9} {'decode':>9} {'decode rate':>12}")
+
+        n_edges = arrays.n_half_edges // 2
+        for bits in (24, None):
+            for compression in ('none', 'zlib', 'lzma'):
+                path = os.path.join(workdir, 'grid.hemz')
+                start = time.perf_counter()
+                save_compressed(arrays, path, bits=bits, compression=compression)
+                encode = time.perf_counter() - start
+                size = os.path.getsize(path)
+                start = time.perf_counter()
+                load_compressed(path)
+                decode = time.perf_counter() - start
+                label = f"{'exact' if bits is None else f'{bits}-bit'} / {compression}"
+                print(f"{label:<28} {size / 2**20:8.1f} MiB {obj_size / size:7.1f}x "
+                      f"{encode * 1000:7.0f}ms {decode * 1000:7.0f}ms "
+                      f"{n_edges / decode / 1e6:6.2f} Medge/s")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Opening a mesh from text OBJ versus the memory-mapped binary format.
+"""
+import argparse
+import os
+import tempfile
+
+from src.utils.data_io import read_obj
+from src.utils.mesh_file import open_mesh, save_mesh
+from .bench_obj_reader import write_grid_obj
+from .common import timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=708, help='Grid side length (708 -> ~1M faces)')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    obj_path = os.path.join(workdir, 'grid.obj')
+    mesh_path = os.path.join(workdir, 'grid.hem')
+    try:
+        write_grid_obj(obj_path, args.size)
+        with timed('read_obj (parse + link)'):
+            arrays = read_obj(obj_path)
+        with timed('save_mesh'):
+            save_mesh(arrays, mesh_path, face_ids=True)
+        print(f"{'':<40} {os.path.getsize(mesh_path) / 2**20:.1f} MiB")
+        with timed('open_mesh (memmap)'):
+            mapped = open_mesh(mesh_path)
+        with timed('first full pass over mapped arrays'):
+            mapped.csr
+        del mapped
+    finally:
+        for path in (obj_path, mesh_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(workdir)
+
+
+if __name__ == '__main__':
+    main()
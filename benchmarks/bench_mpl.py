@@ -0,0 +1,48 @@
+"""
+Matplotlib drawing: one ``plot`` call per edge versus one ``LineCollection``.
+"""
+import argparse
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from src.visualization.mpl_visualizer import MatplotlibVisualizer, mesh_segments
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--small', type=int, default=30, help='Grid side for the per-edge comparison')
+    parser.add_argument('--size', type=int, default=300, help='Grid side for the large mesh')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.small, args.small)
+    segments = mesh_segments(arrays)
+    print(f"{len(segments)} edges")
+    fig, ax = plt.subplots()
+    with timed('plot per edge + draw'):
+        for (x1, y1), (x2, y2) in segments.tolist():
+            ax.plot([x1, x2], [y1, y2], color='tab:blue', linewidth=0.5)
+        fig.canvas.draw()
+    plt.close(fig)
+    vis = MatplotlibVisualizer()
+    with timed('LineCollection + draw'):
+        vis.draw_mesh(arrays)
+        vis.ax.figure.canvas.draw()
+    vis.close()
+
+    arrays = grid_triangulation(args.size, args.size)
+    print(f"{arrays.n_half_edges // 2} edges")
+    vis = MatplotlibVisualizer()
+    with timed('LineCollection + draw'):
+        vis.draw_mesh(arrays)
+        vis.ax.figure.canvas.draw()
+    with timed('with tripcolor faces + draw'):
+        vis.draw_mesh(arrays, face_values=arrays.coords[:, 0])
+        vis.ax.figure.canvas.draw()
+    vis.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+NavMesh (triangle A* + funnel) versus A* along mesh edges.
+
+Both searches run on the same triangulated grid; the report shows query
+time and how much shorter the taut navmesh path is than the edge route.
+``find_path`` is timed from plain points, so locating the start and goal
+triangles is included.
+"""
+import argparse
+import math
+
+import numpy as np
+
+from src.algorithms.navmesh import NavMesh, string_pull
+from src.algorithms.pathfinding import a_star_arrays
+from .common import grid_triangulation, timed
+
+
+def path_length(points):
+    return sum(math.dist(a, b) for a, b in zip(points, points[1:]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=300, help='Grid side length')
+    parser.add_argument('--queries', type=int, default=50, help='Number of random queries')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    print(f"{arrays.n_vertices} vertices, {arrays.n_half_edges} half-edges")
+    with timed('NavMesh construction'):
+        navmesh = NavMesh(arrays)
+
+    rng = np.random.default_rng(2)
+    tri = rng.integers(navmesh.n_triangles, size=(args.queries, 2))
+    centroids = arrays.coords[navmesh.triangles].mean(axis=1)
+
+    a_star_arrays(arrays, 0, 0)  # warm the cached adjacency lists
+    navmesh.find_corridor((0.0, 0.0), (0.0, 0.0), 0, 0)  # and the triangle search lists
+
+    with timed('locate index construction'):
+        navmesh.locate((0.0, 0.0))
+    with timed(f'NavMesh.locate x{2 * args.queries}'):
+        for a, b in tri:
+            navmesh.locate(tuple(centroids[a]))
+            navmesh.locate(tuple(centroids[b]))
+
+    nav_lengths, edge_lengths = [], []
+    with timed(f'NavMesh.find_corridor + funnel x{args.queries}'):
+        for a, b in tri:
+            start, goal = tuple(centroids[a]), tuple(centroids[b])
+            corridor = navmesh.find_corridor(start, goal, int(a), int(b))
+            portals = navmesh.portals(corridor, start, goal)
+            nav_lengths.append(path_length(string_pull(portals)))
+    with timed(f'NavMesh.find_path from points x{args.queries}'):
+        for a, b in tri:
+            navmesh.find_path(tuple(centroids[a]), tuple(centroids[b]))
+    with timed(f'edge A* x{args.queries}'):
+        for a, b in tri:
+            source, target = int(navmesh.triangles[a, 0]), int(navmesh.triangles[b, 0])
+            edge_lengths.append(a_star_arrays(arrays, source, target).distance[target])
+
+    ratio = np.mean(np.array(nav_lengths) / np.maximum(np.array(edge_lengths), 1e-12))
+    print(f"mean navmesh / edge path length: {ratio:.3f}")
+
+
+if __name__ == '__main__':
+    main()
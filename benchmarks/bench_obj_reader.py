@@ -0,0 +1,51 @@
+"""
+Streaming OBJ reader on a large triangulated grid.
+"""
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from src.utils.data_io import parse_obj, read_obj
+from .common import timed
+
+
+def write_grid_obj(path: str, n: int) -> int:
+    """Write an n x n vertex grid split into triangles; return the face count."""
+    gx, gy = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+    idx = np.arange(1, n * n + 1).reshape(n, n)
+    a, b = idx[:-1, :-1].ravel(), idx[:-1, 1:].ravel()
+    c, d = idx[1:, :-1].ravel(), idx[1:, 1:].ravel()
+    faces = np.vstack([np.column_stack([a, d, b]), np.column_stack([a, c, d])])
+    with open(path, 'w') as f:
+        np.savetxt(f, np.column_stack([gx.ravel(), gy.ravel()]), fmt='v %.6f %.6f')
+        np.savetxt(f, faces, fmt='f %d %d %d')
+    return len(faces)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=708, help='Grid side length (708 -> ~1M faces)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Parser processes to compare')
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.obj')
+    os.close(fd)
+    try:
+        n_faces = write_grid_obj(path, args.size)
+        print(f"{n_faces} faces, {os.path.getsize(path) / 2**20:.1f} MiB")
+        with timed('parse_obj'):
+            parse_obj(path)
+        if args.processes > 1:
+            with timed(f'parse_obj ({args.processes} processes)'):
+                parse_obj(path, processes=args.processes)
+        with timed('read_obj'):
+            arrays = read_obj(path, processes=args.processes)
+        print(f"{'':<40} {arrays.n_vertices} vertices, {arrays.n_half_edges} half-edges")
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Speedup of ParallelPathExecutor over a single process.
+
+Computes a distance matrix for a batch of sources on a triangulated grid with
+an increasing number of worker processes.
+"""
+import argparse
+import os
+
+import numpy as np
+
+from src.algorithms.parallel_paths import ParallelPathExecutor
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=300, help='Grid side length')
+    parser.add_argument('--sources', type=int, default=256, help='Number of source vertices')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    sources = np.random.default_rng(1).choice(arrays.n_vertices, args.sources, replace=False)
+    print(f"{arrays.n_vertices} vertices, {arrays.n_half_edges} half-edges, {len(sources)} sources")
+
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, *[p for p in (2, 4, 8, 16, 32, 64) if p <= cpus], cpus})
+    times = []
+    reference = None
+    for processes in counts:
+        with ParallelPathExecutor(arrays, processes=processes) as executor:
+            with timed(f"processes={processes}", times):
+                dist = executor.distance_matrix(sources)
+        if reference is None:
+            reference = dist
+        assert np.allclose(dist, reference)
+        print(f"{'':<40} speedup x{times[0] / times[-1]:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Headless PNG rendering of a large mesh with ``render_mesh``.
+"""
+import argparse
+
+from src.visualization.raster import render_mesh
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=580, help='Grid side length (580: about 1M edges)')
+    parser.add_argument('--pixels', type=int, nargs='+', default=[256, 1024, 2048], help='Image sizes')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    print(f"{arrays.n_half_edges // 2} edges, {arrays.n_vertices} vertices")
+    for pixels in args.pixels:
+        with timed(f'edges on {pixels}x{pixels}'):
+            image = render_mesh(arrays, pixels)
+        with timed(f'edges and faces on {pixels}x{pixels}'):
+            image = render_mesh(arrays, pixels, face_color=(220, 220, 220))
+        with timed(f'encode {pixels}x{pixels} PNG'):
+            image.to_png()
+
+
+if __name__ == '__main__':
+    main()
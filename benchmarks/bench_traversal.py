@@ -0,0 +1,31 @@
+"""
+Level-synchronous BFS and connected components on large meshes.
+"""
+import argparse
+
+from src.algorithms.traversal import bfs_layers, connected_components
+from .common import grid_triangulation, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1000, help='Grid side length')
+    args = parser.parse_args()
+
+    arrays = grid_triangulation(args.size, args.size)
+    print(f"{arrays.n_vertices} vertices, {arrays.n_half_edges} half-edges")
+    with timed('CSR adjacency'):
+        arrays.csr
+    with timed('bfs_layers from one corner'):
+        result = bfs_layers(arrays, 0)
+    print(f"{'':<40} {len(result.layers)} layers")
+    with timed('path_to opposite corner'):
+        path = result.path_to(arrays.n_vertices - 1)
+    print(f"{'':<40} {len(path)} vertices on path")
+    with timed('connected_components'):
+        count, _ = connected_components(arrays)
+    print(f"{'':<40} {count} component(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run benchmarks from the repository root, e.g.::
+
+    python -m benchmarks.bench_parallel_paths
+"""
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import numpy as np
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+
+
+def grid_triangulation(nx: int, ny: int, jitter: float = 0.25, seed: int = 0) -> HalfEdgeArrays:
+    """Triangulated nx x ny grid with slightly jittered vertices.
+
+    Every grid cell is split by one diagonal, so the result is a valid
+    triangulation with ``2 * (nx - 1) * (ny - 1)`` triangles.
+    """
+    rng = np.random.default_rng(seed)
+    gx, gy = np.meshgrid(np.arange(nx, dtype=float), np.arange(ny, dtype=float))
+    coords = np.column_stack([gx.ravel(), gy.ravel()])
+    coords += rng.uniform(-jitter, jitter, coords.shape)
+
+    idx = np.arange(nx * ny).reshape(ny, nx)
+    horizontal = np.column_stack([idx[:, :-1].ravel(), idx[:, 1:].ravel()])
+    vertical = np.column_stack([idx[:-1, :].ravel(), idx[1:, :].ravel()])
+    diagonal = np.column_stack([idx[:-1, :-1].ravel(), idx[1:, 1:].ravel()])
+    return HalfEdgeArrays.from_edge_list(coords, np.vstack([horizontal, vertical, diagonal]))
+
+
+@contextmanager
+def timed(label: str, results: List[float] = None) -> Iterator[None]:
+    """Print (and optionally collect) the wall time of a block."""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    if results is not None:
+        results.append(elapsed)
+    print(f"{label:<40} {elapsed * 1000:10.1f} ms")
@@ -2,7 +2,7 @@
 Example usage of the Half-Edge visualization.
 """
 from src.core.half_edge import Vertex, HalfEdge
-from src.visualization.main import run_visualization
+from src.visualization.gui import run_visualization
 
 def main():
     # Create some example vertices
@@ -8,7 +8,7 @@ setup(
         "numpy>=1.21.0",
         "scipy>=1.7.0",
         "matplotlib>=3.4.0",
-        "PyQt6>=6.2.0",
+        "PyQt6>=6.2.0,<7",  # gui._lines_path relies on the Qt 6 QPainterPath stream layout
     ],
     author="Your Name",
     author_email="your.email@example.com",
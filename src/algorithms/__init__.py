@@ -1,6 +1,18 @@
 """
 Algorithms for Half-Edge data structures.
 """
-from .pathfinding import dijkstra, a_star, reconstruct_path
+from .pathfinding import (dijkstra, a_star, reconstruct_path, dijkstra_arrays,
+                          a_star_arrays, edge_costs, PathResult, SearchResult)
+from .weights import EdgeWeights, weights_for
+from .parallel_paths import ParallelPathExecutor
+from .navmesh import NavMesh, string_pull
+from .traversal import BFSResult, bfs_layers, connected_components
+from .spatial_index import EdgeGrid, segment_distances
+from .incremental_delaunay import EventKind, EventLog, IncrementalDelaunay, spatial_order, triangulate
 
-__all__ = ['dijkstra', 'a_star', 'reconstruct_path']
+__all__ = ['dijkstra', 'a_star', 'reconstruct_path', 'dijkstra_arrays', 'a_star_arrays',
+           'edge_costs', 'PathResult', 'SearchResult', 'EdgeWeights', 'weights_for',
+           'ParallelPathExecutor', 'NavMesh', 'string_pull',
+           'BFSResult', 'bfs_layers', 'connected_components',
+           'EdgeGrid', 'segment_distances',
+           'EventKind', 'EventLog', 'IncrementalDelaunay', 'spatial_order', 'triangulate']
@@ -4,7 +4,6 @@ Delaunay triangulation implementation for Half-Edge data structures.
 import numpy as np
 from scipy.spatial import Delaunay
 import pandas as pd
-import matplotlib.pyplot as plt
 import turtle
 import tkinter
 import logging
@@ -261,20 +260,29 @@ def ReturnVertex(v):
 
 
 def DrawDT(drawing_points):
+    # Function for drawing the whole DT: every edge and vertex label once,
+    # with tracing off and a single screen update at the end
     t._tracer(0)
-    # Function for drawing the whole DT
+    t.hideturtle()
+    drawn = set()
+    labelled = set()
     for vert in drawing_points:
         for i in neighbours(vert):
+            if id(i) in drawn or id(i.S) in drawn:
+                continue
+            drawn.add(id(i))
             logger.debug(f"DrawDT: Drawing edge from {i.V.Vertex_id} to {i.S.V.Vertex_id}")
-            turtle.penup()
-            turtle.goto(i.V.getxy()[0] + 15, i.V.getxy()[1])
-            turtle.write(i.V.Vertex_id)
-            turtle.goto(i.V.getxy())
-            turtle.pendown()
-            turtle.goto(i.Sym().V.getxy())
-            turtle.penup()
-            turtle.goto(i.Sym().V.getxy()[0] + 15, i.Sym().V.getxy()[1])
-            turtle.write(i.Sym().V.Vertex_id)
+            t.penup()
+            t.goto(i.V.getxy())
+            t.pendown()
+            t.goto(i.S.V.getxy())
+            t.penup()
+            for v in (i.V, i.S.V):
+                if v.Vertex_id not in labelled:
+                    labelled.add(v.Vertex_id)
+                    t.goto(v.getxy()[0] + 15, v.getxy()[1])
+                    t.write(v.Vertex_id)
+    t.getscreen().update()
 
 
 def DeletingLine():
@@ -0,0 +1,414 @@
+"""
+Incremental Delaunay triangulation with an optional event log.
+
+Points are inserted one at a time into a triangulation of an enclosing
+triangle: the triangle containing the point is found by walking from the
+last created triangle, split into three (or, for a point on an edge, the
+two triangles of that edge into four), and edges that fail the in-circle
+test are flipped (Lawson).  Triangles are kept in flat Python lists of
+vertex and neighbour indices, since every step touches only a few of them.
+
+The corners of the enclosing triangle are symbolic: the orientation and
+in-circle tests treat them as points infinitely far away in three fixed
+directions, taking the limit of the tests as the triangle grows.  A finite
+triangle, however large, would cut off hull triangles of very thin inputs.
+
+With ``record=True`` every step is appended to an ``EventLog`` of fixed-size
+integer rows, so the construction can be replayed later at any speed (see
+``visualization.playback``) without slowing the insertion itself down.
+"""
+import logging
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays
+
+logger = logging.getLogger(__name__)
+
+# Directions of the corners of the enclosing triangle, counter-clockwise
+FAR_DIRECTIONS = ((-2.0, -1.0), (2.0, -1.0), (0.0, 2.0))
+
+# Distance of the corners as stored in ``coords`` (only for drawing them),
+# in bounding box sizes; the geometric tests use FAR_DIRECTIONS
+SUPER_TRIANGLE_SCALE = 4.0
+
+
+class EventKind(IntEnum):
+    """Kinds of triangulation events and the meaning of their vertex columns.
+
+    ``INSERT (p)``: point ``p`` is being inserted.
+    ``SPLIT (p, a, b, c)``: ``p`` split triangle ``abc``: edges ``pa``, ``pb``, ``pc`` appear.
+    ``SPLIT_EDGE (p, a, b, c, d)``: ``p`` lies on edge ``ab`` between apexes
+    ``c`` and ``d``: ``ab`` is replaced by ``pa``, ``pb``, ``pc``, ``pd``.
+    ``FLIP (a, b, c, d)``: edge ``ab`` is replaced by ``cd``.
+    ``REMOVE (a, b)``: edge ``ab`` is removed with the enclosing triangle.
+    """
+    INSERT = 0
+    SPLIT = 1
+    SPLIT_EDGE = 2
+    FLIP = 3
+    REMOVE = 4
+
+
+# kind + up to five vertex indices
+EVENT_COLUMNS = 6
+
+
+class EventLog:
+    """Append-only log of triangulation events, ``EVENT_COLUMNS`` int32 per event.
+
+    Vertex indices refer to ``coords``, whose last three rows are the
+    corners of the enclosing triangle; unused columns hold -1.
+    """
+
+    def __init__(self, coords: np.ndarray):
+        self.coords = coords
+        self._rows = array('i')
+
+    def __len__(self) -> int:
+        return len(self._rows) // EVENT_COLUMNS
+
+    def append(self, kind: EventKind, *vertices: int) -> None:
+        """Record an event."""
+        self._rows.extend((kind, *vertices))
+        self._rows.extend((-1,) * (EVENT_COLUMNS - 1 - len(vertices)))
+
+    @property
+    def n_points(self) -> int:
+        """Number of input points (without the enclosing triangle)."""
+        return len(self.coords) - 3
+
+    @property
+    def events(self) -> np.ndarray:
+        """(n_events, EVENT_COLUMNS) view of the log."""
+        return np.frombuffer(self._rows, dtype=np.int32).reshape(-1, EVENT_COLUMNS)
+
+
+@dataclass
+class _Location:
+    """Location of a point: inside triangle ``t``, or on its edge opposite corner ``edge``."""
+    t: int
+    edge: int = -1
+
+
+class IncrementalDelaunay:
+    """Delaunay triangulation built by inserting points one by one.
+
+    Example:
+        >>> dt = IncrementalDelaunay(coords, record=True)
+        >>> dt.insert_all()
+        >>> arrays = dt.to_arrays()
+        >>> TriangulationPlayer(dt.log).frames()
+    """
+
+    def __init__(self, coords: np.ndarray, record: bool = False):
+        """
+        Set up the enclosing triangle.
+
+        Args:
+            coords: (n, 2) points to triangulate
+            record: Keep an ``EventLog`` of the construction in ``log``
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        n = len(coords)
+        lo = coords.min(axis=0) if n else np.zeros(2)
+        hi = coords.max(axis=0) if n else np.zeros(2)
+        center = (lo + hi) / 2
+        size = max(float((hi - lo).max()), 1.0) * SUPER_TRIANGLE_SCALE
+        corners = center + size * np.array(FAR_DIRECTIONS)
+        #: Points followed by the three corners of the enclosing triangle
+        self.coords = np.vstack([coords, corners])
+        self.n_points = n
+        self._xy: List[Tuple[float, float]] = [tuple(p) for p in self.coords.tolist()]
+        self._center: Tuple[float, float] = tuple(center.tolist())
+        # Corners of triangle t are _v[3t:3t + 3], counter-clockwise; _n[3t + i]
+        # is the triangle across the edge opposite corner i, or -1
+        self._v: List[int] = [n, n + 1, n + 2]
+        self._n: List[int] = [-1, -1, -1]
+        self._last = 0
+        self._inserted = 0
+        self.log: Optional[EventLog] = EventLog(self.coords) if record else None
+
+    def _orient(self, a: int, b: int, c: int) -> float:
+        """Positive if ``abc`` turns counter-clockwise, zero if collinear."""
+        n = self.n_points
+        if a >= n or b >= n or c >= n:
+            return self._orient_far(a, b, c)
+        (ax, ay), (bx, by), (cx, cy) = self._xy[a], self._xy[b], self._xy[c]
+        return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+    def _orient_far(self, a: int, b: int, c: int) -> float:
+        """``_orient`` with corners of the enclosing triangle at ``center + R * direction``, R -> inf."""
+        n = self.n_points
+        far = (a >= n) + (b >= n) + (c >= n)
+        if far == 3:
+            return 1.0 if (a, b, c) in ((n, n + 1, n + 2), (n + 1, n + 2, n), (n + 2, n, n + 1)) else -1.0
+        # Rotating keeps the sign; bring the finite vertices first
+        while a >= n or (far == 1 and b >= n):
+            a, b, c = b, c, a
+        if far == 2:
+            (ux, uy), (vx, vy) = FAR_DIRECTIONS[b - n], FAR_DIRECTIONS[c - n]
+            return ux * vy - uy * vx
+        (ax, ay), (bx, by) = self._xy[a], self._xy[b]
+        dx, dy = FAR_DIRECTIONS[c - n]
+        leading = (bx - ax) * dy - (by - ay) * dx
+        if leading:
+            return leading
+        cx, cy = self._center
+        return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+    def _in_circle(self, a: int, b: int, c: int, d: int) -> bool:
+        """Whether ``d`` is strictly inside the circumcircle of counter-clockwise ``abc``; ``a`` is an input point."""
+        n = self.n_points
+        if b >= n or c >= n or d >= n:
+            return self._in_circle_far(a, b, c, d)
+        dx, dy = self._xy[d]
+        ax, ay = self._xy[a][0] - dx, self._xy[a][1] - dy
+        bx, by = self._xy[b][0] - dx, self._xy[b][1] - dy
+        cx, cy = self._xy[c][0] - dx, self._xy[c][1] - dy
+        return ((ax * ax + ay * ay) * (bx * cy - cx * by)
+                - (bx * bx + by * by) * (ax * cy - cx * ay)
+                + (cx * cx + cy * cy) * (ax * by - bx * ay)) > 0
+
+    def _in_circle_far(self, a: int, b: int, c: int, d: int) -> bool:
+        """``_in_circle`` in the limit where the enclosing triangle grows without bound."""
+        n = self.n_points
+        if b >= n and c >= n:
+            if d >= n:
+                return False
+            # The circle through a and two far points becomes its tangent
+            # at a: d is inside if it lies towards the circle's center
+            (ux, uy), (vx, vy) = FAR_DIRECTIONS[b - n], FAR_DIRECTIONS[c - n]
+            uu, vv = ux * ux + uy * uy, vx * vx + vy * vy
+            ox, oy = vy * uu - uy * vv, ux * vv - vx * uu  # center of (0, u, v), times 2 * (u x v) > 0
+            (px, py), (qx, qy) = self._xy[a], self._xy[d]
+            return (qx - px) * ox + (qy - py) * oy > 0
+        if b < n and c < n:
+            # A circle through three input points holds no far point
+            return False
+        # One far corner: the circle becomes the line through the finite
+        # edge e -> f, and the disk the side of it holding the far corner
+        e, f, far = (a, b, c) if c >= n else (c, a, b)
+        (ex, ey), (fx, fy) = self._xy[e], self._xy[f]
+        tx, ty = fx - ex, fy - ey
+        if d >= n:
+            # Both far: compare the far points on the circle tangent to the
+            # edge line through the far corner
+            (ux, uy), (vx, vy) = FAR_DIRECTIONS[far - n], FAR_DIRECTIONS[d - n]
+            return (vx * vx + vy * vy) * (tx * uy - ty * ux) < (ux * ux + uy * uy) * (tx * vy - ty * vx)
+        qx, qy = self._xy[d]
+        side = tx * (qy - ey) - ty * (qx - ex)
+        if side:
+            return side > 0
+        # On the line: inside exactly when on the chord between e and f
+        along = (qx - ex) * tx + (qy - ey) * ty
+        return 0 < along < tx * tx + ty * ty
+
+    def _set(self, t: int, a: int, b: int, c: int, na: int, nb: int, nc: int) -> None:
+        k = 3 * t
+        self._v[k:k + 3] = (a, b, c)
+        self._n[k:k + 3] = (na, nb, nc)
+
+    def _new(self) -> int:
+        self._v.extend((-1, -1, -1))
+        self._n.extend((-1, -1, -1))
+        return len(self._v) // 3 - 1
+
+    def _relink(self, t: int, old: int, new: int) -> None:
+        """Point the neighbour link of ``t`` that refers to ``old`` at ``new``."""
+        if t >= 0:
+            k = 3 * t
+            self._n[k + self._n[k:k + 3].index(old)] = new
+
+    def _locate(self, p: int) -> Optional[_Location]:
+        """Walk to the triangle containing ``p``; None if ``p`` repeats a vertex."""
+        v, nb = self._v, self._n
+        t = self._last
+        start = 0
+        while True:
+            k = 3 * t
+            on_edge = []
+            for step in range(3):
+                # Rotate the first edge tested so the walk cannot cycle
+                i = (start + step) % 3
+                o = self._orient(v[k + (i + 1) % 3], v[k + (i + 2) % 3], p)
+                if o < 0:
+                    t = nb[k + i]
+                    break
+                if o == 0:
+                    on_edge.append(i)
+            else:
+                if len(on_edge) > 1:
+                    return None
+                return _Location(t, on_edge[0] if on_edge else -1)
+            start = (start + 1) % 3
+
+    def insert(self, p: int) -> bool:
+        """
+        Insert point ``p`` (an index into ``coords``).
+
+        Returns:
+            False if the point coincides with an inserted one and was skipped
+        """
+        where = self._locate(p)
+        if where is None:
+            logger.debug(f"[IncrementalDelaunay] Skipped duplicate point {p}")
+            return False
+        if self.log is not None:
+            self.log.append(EventKind.INSERT, p)
+        if where.edge < 0:
+            stack = self._split(where.t, p)
+        else:
+            stack = self._split_edge(where.t, where.edge, p)
+        while stack:
+            self._legalize(*stack.pop(), stack)
+        self._inserted += 1
+        return True
+
+    def insert_all(self, order: Optional[np.ndarray] = None) -> 'IncrementalDelaunay':
+        """
+        Insert all points.
+
+        Args:
+            order: Point indices in insertion order (default: index order);
+                see ``spatial_order``
+        """
+        for p in (range(self.n_points) if order is None else np.asarray(order).tolist()):
+            self.insert(p)
+        logger.debug(f"[IncrementalDelaunay] Inserted {self._inserted} points into "
+                     f"{len(self._v) // 3} triangles")
+        return self
+
+    def _split(self, t: int, p: int) -> List[Tuple[int, int]]:
+        k = 3 * t
+        a, b, c = self._v[k:k + 3]
+        na, nb, nc = self._n[k:k + 3]
+        t1, t2 = self._new(), self._new()
+        self._set(t, a, b, p, t1, t2, nc)
+        self._set(t1, b, c, p, t2, t, na)
+        self._set(t2, c, a, p, t, t1, nb)
+        self._relink(na, t, t1)
+        self._relink(nb, t, t2)
+        self._last = t
+        if self.log is not None:
+            self.log.append(EventKind.SPLIT, p, a, b, c)
+        return [(t, 2), (t1, 2), (t2, 2)]
+
+    def _split_edge(self, t: int, i: int, p: int) -> List[Tuple[int, int]]:
+        k = 3 * t
+        a, b, c = self._v[k + i], self._v[k + (i + 1) % 3], self._v[k + (i + 2) % 3]
+        n_ca, n_ab = self._n[k + (i + 1) % 3], self._n[k + (i + 2) % 3]
+        u = self._n[k + i]
+        # A point cannot lie on an edge between two far corners, so the
+        # edge it lies on is always shared by two triangles
+        j = self._n[3 * u:3 * u + 3].index(t)
+        d = self._v[3 * u + j]
+        n_bd, n_dc = self._n[3 * u + (j + 1) % 3], self._n[3 * u + (j + 2) % 3]
+        t1, t3 = self._new(), self._new()
+        self._set(t, a, b, p, t3, t1, n_ab)
+        self._set(t1, a, p, c, u, n_ca, t)
+        self._set(u, d, c, p, t1, t3, n_dc)
+        self._set(t3, d, p, b, t, n_bd, u)
+        self._relink(n_ca, t, t1)
+        self._relink(n_bd, u, t3)
+        self._last = t
+        if self.log is not None:
+            self.log.append(EventKind.SPLIT_EDGE, p, b, c, a, d)
+        return [(t, 2), (t1, 1), (u, 2), (t3, 1)]
+
+    def _legalize(self, t: int, i: int, stack: List[Tuple[int, int]]) -> None:
+        """Flip the edge of ``t`` opposite its corner ``i`` if it is not Delaunay."""
+        v, nb = self._v, self._n
+        k = 3 * t
+        u = nb[k + i]
+        if u < 0:
+            return
+        p, x, y = v[k + i], v[k + (i + 1) % 3], v[k + (i + 2) % 3]
+        j = nb[3 * u:3 * u + 3].index(t)
+        d = v[3 * u + j]
+        if not self._in_circle(p, x, y, d):
+            return
+        n_yp, n_px = nb[k + (i + 1) % 3], nb[k + (i + 2) % 3]
+        n_xd, n_dy = nb[3 * u + (j + 1) % 3], nb[3 * u + (j + 2) % 3]
+        self._set(t, p, x, d, n_xd, u, n_px)
+        self._set(u, p, d, y, n_dy, n_yp, t)
+        self._relink(n_xd, u, t)
+        self._relink(n_yp, t, u)
+        if self.log is not None:
+            self.log.append(EventKind.FLIP, x, y, p, d)
+        stack.append((t, 0))
+        stack.append((u, 0))
+
+    def triangles(self) -> np.ndarray:
+        """(n, 3) counter-clockwise triangles that do not touch the enclosing triangle."""
+        tris = np.array(self._v, dtype=np.int64).reshape(-1, 3)
+        return tris[(tris < self.n_points).all(axis=1)]
+
+    def edges(self) -> np.ndarray:
+        """(n, 2) unique edges of ``triangles()``, smaller vertex first."""
+        tris = self.triangles()
+        pairs = np.sort(np.vstack([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]]), axis=1)
+        # np.unique is much slower than a plain sort here
+        keys = np.sort(pairs[:, 0] * (self.n_points + 3) + pairs[:, 1])
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+        return np.column_stack([keys // (self.n_points + 3), keys % (self.n_points + 3)])
+
+    def finish(self) -> None:
+        """Record the removal of the edges to the enclosing triangle."""
+        if self.log is None:
+            return
+        tris = np.array(self._v, dtype=np.int64).reshape(-1, 3)
+        pairs = np.sort(np.vstack([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]]), axis=1)
+        # Every edge is listed from both of its triangles, except the outer ones
+        pairs = pairs[pairs[:, 1] >= self.n_points]
+        for a, b in sorted(set(map(tuple, pairs.tolist()))):
+            self.log.append(EventKind.REMOVE, a, b)
+
+    def to_arrays(self) -> HalfEdgeArrays:
+        """Snapshot of the triangulation of the input points."""
+        return HalfEdgeArrays.from_edge_list(self.coords[:self.n_points], self.edges())
+
+
+def spatial_order(coords: np.ndarray) -> np.ndarray:
+    """
+    Order in which consecutive points are close together.
+
+    Points are bucketed into horizontal strips about two points high and
+    sorted along alternating directions in every strip, so the walk to the
+    next point's triangle is short instead of crossing the whole mesh.
+
+    Returns:
+        Permutation of the point indices
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if len(coords) < 3:
+        return np.arange(len(coords))
+    lo, hi = coords.min(axis=0), coords.max(axis=0)
+    strips = max(int(np.sqrt(len(coords) / 4)), 1)
+    row = np.minimum(((coords[:, 1] - lo[1]) / max(hi[1] - lo[1], 1e-300) * strips).astype(np.int64), strips - 1)
+    x = np.where(row % 2 == 0, coords[:, 0], -coords[:, 0])
+    return np.lexsort((x, row))
+
+
+def triangulate(coords: np.ndarray, record: bool = False,
+                sort: bool = True) -> Tuple[HalfEdgeArrays, Optional[EventLog]]:
+    """
+    Delaunay triangulation of some points.
+
+    Args:
+        coords: (n, 2) points
+        record: Also return the log of the construction
+        sort: Insert in ``spatial_order`` (much faster for many points)
+            instead of index order
+
+    Returns:
+        Tuple of (mesh, event log or None)
+    """
+    dt = IncrementalDelaunay(coords, record=record)
+    dt.insert_all(spatial_order(dt.coords[:dt.n_points]) if sort else None)
+    dt.finish()
+    return dt.to_arrays(), dt.log
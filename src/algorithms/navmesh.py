@@ -0,0 +1,280 @@
+"""
+Navigation-mesh pathfinding over the triangles of a Half-Edge mesh.
+
+``dijkstra``/``a_star`` in ``pathfinding`` only walk along edges, which gives
+zig-zag routes on a triangulation.  ``NavMesh`` instead searches the dual
+graph (triangles connected through shared edges) with A*, then pulls the
+resulting triangle corridor taut with the simple stupid funnel algorithm,
+producing the shortest Euclidean polyline inside the mesh.
+"""
+import heapq
+import logging
+import math
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays, INDEX_DTYPE
+from .spatial_index import EdgeGrid
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[float, float]
+
+
+def _triarea2(a: Point, b: Point, c: Point) -> float:
+    """Twice the signed area of triangle a, b, c (funnel convention)."""
+    ax = b[0] - a[0]
+    ay = b[1] - a[1]
+    bx = c[0] - a[0]
+    by = c[1] - a[1]
+    return bx * ay - ax * by
+
+
+def string_pull(portals: Sequence[Tuple[Point, Point]]) -> List[Point]:
+    """Shortest path through a sequence of portals (simple stupid funnel).
+
+    Args:
+        portals: (left, right) segments to pass through; the first portal is
+            the degenerate (start, start) and the last one (goal, goal)
+
+    Returns:
+        Corner points of the taut path, from start to goal
+    """
+    apex = left = right = portals[0][0]
+    apex_index = left_index = right_index = 0
+    path = [apex]
+
+    i = 1
+    while i < len(portals):
+        new_left, new_right = portals[i]
+
+        # Try to narrow the funnel from the right
+        if _triarea2(apex, right, new_right) <= 0.0:
+            if apex == right or _triarea2(apex, left, new_right) > 0.0:
+                right = new_right
+                right_index = i
+            else:
+                # Right crosses left: left becomes the next corner
+                apex = left
+                apex_index = left_index
+                path.append(apex)
+                left = right = apex
+                left_index = right_index = apex_index
+                i = apex_index + 1
+                continue
+
+        # Try to narrow the funnel from the left
+        if _triarea2(apex, left, new_left) >= 0.0:
+            if apex == left or _triarea2(apex, right, new_left) < 0.0:
+                left = new_left
+                left_index = i
+            else:
+                # Left crosses right: right becomes the next corner
+                apex = right
+                apex_index = right_index
+                path.append(apex)
+                left = right = apex
+                left_index = right_index = apex_index
+                i = apex_index + 1
+                continue
+        i += 1
+
+    goal = portals[-1][0]
+    if path[-1] != goal:
+        path.append(goal)
+    return path
+
+
+class NavMesh:
+    """Triangle navigation mesh built on a ``HalfEdgeArrays`` snapshot.
+
+    Triangles are the face cycles (``HalfEdge.next_in``) of length three whose
+    orientation matches the inner faces of ``HalfEdgeBuilder`` meshes; longer
+    cycles and the outer face are not walkable.
+    """
+
+    def __init__(self, arrays: HalfEdgeArrays):
+        """
+        Initialize the navigation mesh.
+
+        Args:
+            arrays: Triangulated mesh (e.g. a Delaunay triangulation)
+        """
+        self.arrays = arrays
+        fn = arrays.face_next
+        h0 = np.arange(arrays.n_half_edges, dtype=INDEX_DTYPE)
+        h1 = fn[h0]
+        h2 = fn[h1]
+        is_tri = fn[h2] == h0
+
+        p0 = arrays.coords[arrays.origin[h0]]
+        p1 = arrays.coords[arrays.origin[h1]]
+        p2 = arrays.coords[arrays.origin[h2]]
+        area2 = ((p1[:, 0] - p0[:, 0]) * (p2[:, 1] - p0[:, 1])
+                 - (p1[:, 1] - p0[:, 1]) * (p2[:, 0] - p0[:, 0]))
+        # Inner faces of the next-ring ordering are traversed clockwise; one
+        # representative (the smallest index) is kept per triangle
+        rep = is_tri & (area2 < 0) & (h0 < h1) & (h0 < h2)
+
+        #: (n_triangles, 3) half-edges of every triangle
+        self.triangle_edges = np.column_stack([h0[rep], h1[rep], h2[rep]]).astype(INDEX_DTYPE)
+        #: (n_triangles, 3) vertex indices of every triangle
+        self.triangles = arrays.origin[self.triangle_edges]
+        #: triangle index of every half-edge, -1 outside the walkable area
+        self.face_of = np.full(arrays.n_half_edges, -1, dtype=INDEX_DTYPE)
+        self.face_of[self.triangle_edges] = np.arange(len(self.triangle_edges), dtype=INDEX_DTYPE)[:, None]
+        #: (n_triangles, 3) neighbouring triangle across each half-edge, -1 at the border
+        self.neighbours = self.face_of[arrays.twin[self.triangle_edges]]
+        logger.debug(f"[NavMesh] {len(self.triangles)} walkable triangles")
+
+    @property
+    def n_triangles(self) -> int:
+        """Number of walkable triangles."""
+        return len(self.triangles)
+
+    @cached_property
+    def _search_lists(self):
+        # Plain lists are much faster than NumPy scalars in the A* loop
+        segments = np.hstack([self.arrays.coords[self.arrays.origin],
+                              self.arrays.coords[self.arrays.target]])
+        return self.triangle_edges.tolist(), self.neighbours.tolist(), segments.tolist()
+
+    @cached_property
+    def _triangle_grid(self) -> EdgeGrid:
+        # Triangles are bucketed by their bounding boxes, handed to the
+        # grid as the boxes' diagonals
+        pts = self.arrays.coords[self.triangles]
+        return EdgeGrid(np.hstack([pts.min(axis=1), pts.max(axis=1)]))
+
+    def locate(self, point: Point) -> int:
+        """Index of the triangle containing ``point``, or -1.
+
+        Only the triangles whose bounding boxes hold the point, found
+        through a uniform grid built on first use, are tested.
+
+        Args:
+            point: (x, y) position
+
+        Returns:
+            Triangle index
+        """
+        x, y = point
+        candidates = self._triangle_grid.in_rect(x, y, x, y)
+        a = self.arrays.coords[self.triangles[candidates]]
+        b = np.roll(a, -1, axis=1)
+        cross = ((b[..., 0] - a[..., 0]) * (y - a[..., 1])
+                 - (b[..., 1] - a[..., 1]) * (x - a[..., 0]))
+        inside = candidates[(cross <= 1e-12).all(axis=1)]
+        return int(inside[0]) if len(inside) else -1
+
+    def find_corridor(self, start: Point, goal: Point,
+                      start_tri: Optional[int] = None,
+                      goal_tri: Optional[int] = None) -> Optional[List[int]]:
+        """A* over triangles from the one containing ``start`` to ``goal``.
+
+        Each crossed edge is entered where the straight line from the
+        previous entry point towards the goal meets it, so the costs follow
+        the eventual taut path closely.
+
+        Args:
+            start: Start position
+            goal: Goal position
+            start_tri: Triangle containing start (located if omitted)
+            goal_tri: Triangle containing goal (located if omitted)
+
+        Returns:
+            Half-edges crossed along the corridor, or None if unreachable
+        """
+        if start_tri is None:
+            start_tri = self.locate(start)
+        if goal_tri is None:
+            goal_tri = self.locate(goal)
+        if start_tri < 0 or goal_tri < 0:
+            return None
+
+        tri_edges, neighbours, segments = self._search_lists
+        gx, gy = goal
+        g_score = {start_tri: 0.0}
+        position = {start_tri: (start[0], start[1])}
+        came_through = {start_tri: -1}
+        closed = set()
+        # Ties on f are broken towards the larger g, which keeps the search
+        # from flooding regions of equal estimate
+        heap = [(math.hypot(start[0] - gx, start[1] - gy), 0.0, start_tri)]
+
+        while heap:
+            _, neg_g, tri = heapq.heappop(heap)
+            g = -neg_g
+            # The estimate depends on the entry point, so an entry that was
+            # improved on since can come first: position[tri] is no longer its
+            if g > g_score[tri]:
+                continue
+            if tri == goal_tri:
+                break
+            if tri in closed:
+                continue
+            closed.add(tri)
+            px, py = position[tri]
+            dx = gx - px
+            dy = gy - py
+            for he, nb in zip(tri_edges[tri], neighbours[tri]):
+                if nb < 0 or nb in closed:
+                    continue
+                # Cross the portal where the straight line towards the goal
+                # meets it, clamped to the portal's end points
+                ax, ay, bx, by = segments[he]
+                ex = bx - ax
+                ey = by - ay
+                denom = ex * dy - ey * dx
+                t = ((px - ax) * dy - (py - ay) * dx) / denom if denom else 0.5
+                t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+                mx = ax + t * ex
+                my = ay + t * ey
+                cost = g + math.hypot(mx - px, my - py)
+                if cost < g_score.get(nb, math.inf):
+                    g_score[nb] = cost
+                    position[nb] = (mx, my)
+                    came_through[nb] = he
+                    heapq.heappush(heap, (cost + math.hypot(mx - gx, my - gy), -cost, nb))
+        if goal_tri not in came_through:
+            return None
+
+        corridor = []
+        tri = goal_tri
+        while came_through[tri] >= 0:
+            he = came_through[tri]
+            corridor.append(he)
+            tri = int(self.face_of[he])
+        corridor.reverse()
+        return corridor
+
+    def portals(self, corridor: Sequence[int], start: Point, goal: Point) -> List[Tuple[Point, Point]]:
+        """(left, right) portal segments of a corridor, framed by start and goal."""
+        coords = self.arrays.coords
+        start = (float(start[0]), float(start[1]))
+        goal = (float(goal[0]), float(goal[1]))
+        result = [(start, start)]
+        for he in corridor:
+            left = tuple(coords[self.arrays.origin[he]].tolist())
+            right = tuple(coords[self.arrays.target[he]].tolist())
+            result.append((left, right))
+        result.append((goal, goal))
+        return result
+
+    def find_path(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        """Taut shortest path from ``start`` to ``goal`` inside the mesh.
+
+        Args:
+            start: Start position
+            goal: Goal position
+
+        Returns:
+            Path corner points (including start and goal), or None if either
+            point is outside the mesh or unreachable
+        """
+        corridor = self.find_corridor(start, goal)
+        if corridor is None:
+            return None
+        return string_pull(self.portals(corridor, start, goal))
@@ -0,0 +1,170 @@
+"""
+Process-pool execution of batch shortest-path queries.
+
+The mesh is flattened into a ``HalfEdgeArrays`` snapshot and its CSR
+adjacency is copied once into shared memory.  Worker processes attach to the
+shared blocks in their initializer, so a batch of queries never pickles the
+object graph; each task only carries a range of source rows and writes its
+distances straight into a shared result matrix.
+"""
+import logging
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+
+from ..core.half_edge_arrays import HalfEdgeArrays, INDEX_DTYPE
+from .pathfinding import edge_costs
+
+logger = logging.getLogger(__name__)
+
+# (shared memory name, shape, dtype string)
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+_worker_state: Dict[str, object] = {}
+
+
+def _share(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, ArraySpec]:
+    """Copy an array into a new shared memory block."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach(spec: ArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach to a shared block created by ``_share``."""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _graph_from_csr(offsets: np.ndarray, targets: np.ndarray, costs: np.ndarray) -> csr_matrix:
+    n = len(offsets) - 1
+    return csr_matrix((costs, targets, offsets), shape=(n, n), copy=False)
+
+
+def _init_worker(graph_specs: Dict[str, ArraySpec]) -> None:
+    """Pool initializer: attach to the mesh snapshot once per process."""
+    blocks = {key: _attach(spec) for key, spec in graph_specs.items()}
+    _worker_state['blocks'] = [shm for shm, _ in blocks.values()]
+    _worker_state['graph'] = _graph_from_csr(
+        blocks['offsets'][1], blocks['targets'][1], blocks['costs'][1]
+    )
+
+
+def _solve_rows(task: Tuple[ArraySpec, ArraySpec, int, int]) -> int:
+    """Run single-source Dijkstra for ``sources[start:stop]`` in a worker."""
+    sources_spec, out_spec, start, stop = task
+    src_shm, sources = _attach(sources_spec)
+    out_shm, out = _attach(out_spec)
+    try:
+        out[start:stop] = csgraph_dijkstra(
+            _worker_state['graph'], directed=True, indices=sources[start:stop]
+        )
+    finally:
+        del sources, out
+        src_shm.close()
+        out_shm.close()
+    return stop - start
+
+
+class ParallelPathExecutor:
+    """Batch shortest-path queries over a process pool.
+
+    The executor owns the shared memory holding the mesh; use it as a context
+    manager (or call ``close``) to release the pool and the shared blocks.
+
+    Example:
+        >>> with ParallelPathExecutor(HalfEdgeArrays.from_half_edges(edges)) as ex:
+        ...     dist = ex.distance_matrix(range(100))
+    """
+
+    def __init__(self, arrays: HalfEdgeArrays, processes: Optional[int] = None,
+                 costs: Optional[np.ndarray] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            arrays: Mesh snapshot to query
+            processes: Number of worker processes (default: CPU count)
+            costs: Optional per-half-edge costs (default: ``edge_costs(arrays)``)
+        """
+        self.arrays = arrays
+        self.processes = processes or os.cpu_count() or 1
+        offsets, out_edges = arrays.csr
+        if costs is None:
+            costs = edge_costs(arrays)
+        graph = {
+            'offsets': offsets.astype(INDEX_DTYPE),
+            'targets': arrays.target[out_edges].astype(INDEX_DTYPE),
+            'costs': np.asarray(costs, dtype=np.float64)[out_edges],
+        }
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._graph_specs: Dict[str, ArraySpec] = {}
+        for key, array in graph.items():
+            shm, spec = _share(array)
+            self._blocks.append(shm)
+            self._graph_specs[key] = spec
+        self._graph = _graph_from_csr(graph['offsets'], graph['targets'], graph['costs'])
+        self._pool = None
+        if self.processes > 1:
+            self._pool = multiprocessing.get_context().Pool(
+                self.processes, initializer=_init_worker, initargs=(self._graph_specs,)
+            )
+        logger.debug(f"[ParallelPathExecutor] Shared {arrays.n_half_edges} half-edges "
+                     f"with {self.processes} processes")
+
+    def distance_matrix(self, sources: Sequence[int], chunk_size: Optional[int] = None) -> np.ndarray:
+        """Shortest-path distances from each source to every vertex.
+
+        Args:
+            sources: Dense vertex indices (see ``HalfEdgeArrays.vertex_index``)
+            chunk_size: Sources per task (default: spread evenly, 4 tasks per worker)
+
+        Returns:
+            (len(sources), n_vertices) array, ``inf`` where unreachable
+        """
+        sources = np.asarray(sources, dtype=INDEX_DTYPE)
+        n = len(sources)
+        if self._pool is None or n == 0:
+            return csgraph_dijkstra(self._graph, directed=True, indices=sources).reshape(
+                n, self.arrays.n_vertices)
+
+        if chunk_size is None:
+            chunk_size = max(1, -(-n // (self.processes * 4)))
+        src_shm, src_spec = _share(sources)
+        out_shm = shared_memory.SharedMemory(create=True, size=max(n * self.arrays.n_vertices * 8, 1))
+        out_spec: ArraySpec = (out_shm.name, (n, self.arrays.n_vertices), np.dtype(np.float64).str)
+        try:
+            tasks = [(src_spec, out_spec, start, min(start + chunk_size, n))
+                     for start in range(0, n, chunk_size)]
+            solved = sum(self._pool.imap_unordered(_solve_rows, tasks))
+            logger.debug(f"[ParallelPathExecutor] Solved {solved} sources in {len(tasks)} tasks")
+            result = np.ndarray(out_spec[1], dtype=np.float64, buffer=out_shm.buf).copy()
+        finally:
+            for shm in (src_shm, out_shm):
+                shm.close()
+                shm.unlink()
+        return result
+
+    def close(self) -> None:
+        """Stop the worker pool and release the shared mesh snapshot."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> 'ParallelPathExecutor':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
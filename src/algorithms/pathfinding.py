@@ -1,11 +1,20 @@
 """
 Pathfinding algorithms for Half-Edge data structures.
 """
+import heapq
 import math
 import random
-from typing import List, Dict, Optional, Tuple
+import weakref
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Union
 
-from ..core.half_edge_ds import HalfEdge, Vertex, neighbours
+import numpy as np
+
+from ..core.half_edge_ds import HalfEdge, outgoing
+from ..core.half_edge_arrays import HalfEdgeArrays
+from .weights import EdgeWeights, WeightFunction, weights_for
+
+Costs = Union[np.ndarray, EdgeWeights, None]
 
 def sort(edges: List[HalfEdge]) -> List[HalfEdge]:
     """
@@ -71,14 +80,19 @@ def dijkstra(start: HalfEdge, target: HalfEdge) -> Dict[int, Optional[int]]:
         if current.V == target.V:
             break
             
+        if current.V.visited:
+            continue
         current.V.visited = True
         
-        for neighbor in neighbours(current):
-            weight = current.V.distance + neighbor.weight if neighbor.weight else 0
-            if not neighbor.V.visited or weight < neighbor.V.distance:
+        for out_edge in outgoing(current):
+            # Neighbor is the half-edge leaving the adjacent vertex
+            neighbor = out_edge.Sym()
+            if neighbor.V.visited:
+                continue
+            weight = current.V.distance + out_edge.get_cost()
+            if neighbor.V.Vertex_id not in came_from or weight < neighbor.V.distance:
                 neighbor.V.distance = weight
-                if neighbor not in to_visit:
-                    to_visit.append(neighbor)
+                to_visit.append(neighbor)
                 came_from[neighbor.V.Vertex_id] = current.V.Vertex_id
                 
         to_visit = sort(to_visit)
@@ -124,14 +138,19 @@ def a_star(start: HalfEdge, target: HalfEdge) -> Dict[int, Optional[int]]:
         if current.V == target.V:
             break
             
+        if current.V.visited:
+            continue
         current.V.visited = True
         
-        for neighbor in neighbours(current):
-            weight = current.V.distance + neighbor.weight if neighbor.weight else 0
-            if not neighbor.V.visited or weight < neighbor.V.distance:
+        for out_edge in outgoing(current):
+            # Neighbor is the half-edge leaving the adjacent vertex
+            neighbor = out_edge.Sym()
+            if neighbor.V.visited:
+                continue
+            weight = current.V.distance + out_edge.get_cost()
+            if neighbor.V.Vertex_id not in came_from or weight < neighbor.V.distance:
                 neighbor.V.distance = weight
-                if neighbor not in to_visit:
-                    to_visit.append(neighbor)
+                to_visit.append(neighbor)
                 came_from[neighbor.V.Vertex_id] = current.V.Vertex_id
                 
         bubblesort(to_visit, target)
@@ -162,3 +181,204 @@ def reconstruct_path(came_from: Dict[int, Optional[int]],
     path.append(start)
     path.reverse()
     return path
+
+
+def edge_costs(arrays: HalfEdgeArrays) -> np.ndarray:
+    """
+    Traversal cost of every half-edge.
+
+    Explicit weights are used where set, the Euclidean length elsewhere.
+
+    Args:
+        arrays: Mesh snapshot
+
+    Returns:
+        Array of costs indexed by half-edge
+    """
+    return weights_for(arrays).costs()
+
+
+@dataclass(frozen=True)
+class PathResult:
+    """A path through the mesh, with everything needed to draw or measure it.
+
+    Attributes:
+        vertices: Dense vertex indices from source to target
+        half_edges: Half-edges walked, ``half_edges[i]`` leads from
+            ``vertices[i]`` to ``vertices[i + 1]``
+        cost: Cumulative cost at every vertex (``cost[0] == 0``)
+        points: (len(vertices), 2) vertex coordinates
+    """
+    vertices: np.ndarray
+    half_edges: np.ndarray
+    cost: np.ndarray
+    points: np.ndarray
+
+    @property
+    def total_cost(self) -> float:
+        """Cost of the whole path."""
+        return float(self.cost[-1])
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+
+@dataclass
+class SearchResult:
+    """Shortest-path tree recorded by ``dijkstra_arrays``/``a_star_arrays``.
+
+    Attributes:
+        arrays: Searched mesh
+        source: Source vertex index (indices for multi-source searches)
+        distance: Cost from the source per vertex, ``inf`` where not settled
+        pred_edge: Half-edge entering every vertex on its best path, -1 if none
+    """
+    arrays: HalfEdgeArrays
+    source: Union[int, np.ndarray]
+    distance: np.ndarray
+    pred_edge: np.ndarray
+
+    def path_to(self, target: int) -> Optional[PathResult]:
+        """
+        Extract the path to ``target`` in O(path length).
+
+        Args:
+            target: Target vertex index
+
+        Returns:
+            PathResult, or None if the target was not reached
+        """
+        if not np.isfinite(self.distance[target]):
+            return None
+        origin = self.arrays.origin
+        edges = []
+        v = target
+        he = int(self.pred_edge[v])
+        while he >= 0:
+            edges.append(he)
+            v = int(origin[he])
+            he = int(self.pred_edge[v])
+        edges.reverse()
+        half_edges = np.array(edges, dtype=origin.dtype)
+        vertices = np.concatenate([[v], self.arrays.target[half_edges]]).astype(origin.dtype)
+        return PathResult(
+            vertices=vertices,
+            half_edges=half_edges,
+            cost=self.distance[vertices],
+            points=self.arrays.coords[vertices],
+        )
+
+
+_adjacency_cache: "weakref.WeakKeyDictionary[HalfEdgeArrays, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _adjacency(arrays: HalfEdgeArrays) -> Tuple[List[int], List[int], List[int]]:
+    """CSR adjacency of a snapshot as plain lists (cached per snapshot)."""
+    lists = _adjacency_cache.get(arrays)
+    if lists is None:
+        offsets, out_edges = arrays.csr
+        lists = (offsets.tolist(), out_edges.tolist(), arrays.target.tolist())
+        _adjacency_cache[arrays] = lists
+    return lists
+
+
+def _search(arrays: HalfEdgeArrays, source: int, target: Optional[int],
+            costs: Costs, weight_fn: Optional[WeightFunction],
+            use_heuristic: bool) -> SearchResult:
+    if costs is None:
+        costs = weights_for(arrays)
+    offsets, out_edges, targets = _adjacency(arrays)
+    if isinstance(costs, EdgeWeights):
+        cost_list = costs.cost_list(weight_fn)
+    else:
+        costs = np.asarray(costs, dtype=float)
+        cost_list = costs.tolist()
+
+    n = arrays.n_vertices
+    dist = [math.inf] * n
+    pred = [-1] * n
+    settled = [False] * n
+    dist[source] = 0.0
+
+    if use_heuristic and target is not None:
+        # Scale the straight-line estimate by the cheapest cost per unit
+        # length so the heuristic stays admissible for any weights
+        if isinstance(costs, EdgeWeights):
+            scale = costs.min_cost_ratio(weight_fn)
+            coords = costs.coords
+        else:
+            lengths = arrays.lengths
+            ratio = costs[lengths > 0] / lengths[lengths > 0]
+            scale = float(ratio.min()) if len(ratio) else 0.0
+            coords = arrays.coords
+        xs = coords[:, 0].tolist()
+        ys = coords[:, 1].tolist()
+        gx, gy = xs[target], ys[target]
+
+        def estimate(v: int) -> float:
+            return scale * math.hypot(xs[v] - gx, ys[v] - gy)
+    else:
+        def estimate(v: int) -> float:
+            return 0.0
+
+    heap = [(estimate(source), source)]
+    while heap:
+        _, v = heapq.heappop(heap)
+        if settled[v]:
+            continue
+        settled[v] = True
+        if v == target:
+            break
+        d = dist[v]
+        for k in range(offsets[v], offsets[v + 1]):
+            he = out_edges[k]
+            w = targets[he]
+            nd = d + cost_list[he]
+            if nd < dist[w]:
+                dist[w] = nd
+                pred[w] = he
+                heapq.heappush(heap, (nd + estimate(w), w))
+
+    distance = np.array(dist)
+    if target is not None:
+        # Only settled vertices carry final distances
+        distance[~np.array(settled)] = math.inf
+    return SearchResult(arrays, source, distance, np.array(pred, dtype=arrays.origin.dtype))
+
+
+def dijkstra_arrays(arrays: HalfEdgeArrays, source: int, target: Optional[int] = None,
+                    costs: Costs = None,
+                    weight_fn: Optional[WeightFunction] = None) -> SearchResult:
+    """
+    Dijkstra's algorithm over a mesh snapshot.
+
+    Args:
+        arrays: Mesh snapshot
+        source: Source vertex index
+        target: Optional target vertex index; the search stops once it is settled
+        costs: Per-half-edge cost array or EdgeWeights (default: ``weights_for(arrays)``)
+        weight_fn: Optional weight function evaluated through the EdgeWeights cache
+
+    Returns:
+        SearchResult recording distances and predecessor half-edges
+    """
+    return _search(arrays, source, target, costs, weight_fn, use_heuristic=False)
+
+
+def a_star_arrays(arrays: HalfEdgeArrays, source: int, target: int,
+                  costs: Costs = None,
+                  weight_fn: Optional[WeightFunction] = None) -> SearchResult:
+    """
+    A* over a mesh snapshot with a Euclidean heuristic.
+
+    Args:
+        arrays: Mesh snapshot
+        source: Source vertex index
+        target: Target vertex index
+        costs: Per-half-edge cost array or EdgeWeights (default: ``weights_for(arrays)``)
+        weight_fn: Optional weight function evaluated through the EdgeWeights cache
+
+    Returns:
+        SearchResult recording distances and predecessor half-edges
+    """
+    return _search(arrays, source, target, costs, weight_fn, use_heuristic=True)
@@ -0,0 +1,216 @@
+"""
+Uniform-grid spatial index over line segments.
+
+Picking the edge under the mouse by measuring the distance to every edge is
+linear in the mesh size.  ``EdgeGrid`` buckets the edges by the grid cells
+their bounding boxes overlap (stored CSR-style, like ``HalfEdgeArrays.csr``),
+so a query only measures the few edges registered in the cells around the
+query point.
+"""
+import logging
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays, INDEX_DTYPE
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[float, float]
+
+# Segments overlapping more cells are kept out of the grid
+MAX_CELLS_PER_SEGMENT = 64
+
+
+def segment_distances(point: Point, segments: np.ndarray) -> np.ndarray:
+    """Distance from ``point`` to every (x1, y1, x2, y2) segment."""
+    x, y = point
+    x1, y1, x2, y2 = segments.T
+    dx, dy = x2 - x1, y2 - y1
+    len_sq = dx * dx + dy * dy
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(len_sq > 0, ((x - x1) * dx + (y - y1) * dy) / len_sq, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    return np.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+class EdgeGrid:
+    """Static uniform grid of segments for nearest-edge queries.
+
+    Example:
+        >>> grid = EdgeGrid.from_arrays(arrays)
+        >>> edge, distance = grid.nearest((120.0, 45.0), max_distance=10)
+    """
+
+    def __init__(self, segments: np.ndarray, cell_size: Optional[float] = None,
+                 ids: Optional[np.ndarray] = None):
+        """
+        Build the grid.
+
+        Args:
+            segments: (n, 4) segments as (x1, y1, x2, y2)
+            cell_size: Side of a grid cell (default: the mean segment
+                extent, so an edge overlaps few cells)
+            ids: Optional id reported for every segment (default: its index)
+        """
+        self.segments = np.ascontiguousarray(segments, dtype=np.float64).reshape(-1, 4)
+        self.ids = np.arange(len(self.segments)) if ids is None else np.asarray(ids)
+        n = len(self.segments)
+        lo = np.minimum(self.segments[:, :2], self.segments[:, 2:])
+        hi = np.maximum(self.segments[:, :2], self.segments[:, 2:])
+        self.origin = lo.min(axis=0) if n else np.zeros(2)
+        extent = (hi.max(axis=0) - self.origin) if n else np.zeros(2)
+        if cell_size is None:
+            mean_extent = float((hi - lo).max(axis=1).mean()) if n else 0.0
+            # Also bound the cell count for very short edges in a large area
+            cell_size = max(mean_extent, float(extent.max()) / 4096, 1e-9)
+        self.cell_size = cell_size
+        self.shape = tuple(int(s) for s in np.floor(extent / cell_size).astype(np.int64) + 1)
+
+        # Every segment is registered in all cells of its bounding box,
+        # except the few long ones, which every query tests instead
+        #: Bounding box corners of every segment
+        self.lo, self.hi = lo, hi
+        c0 = self._cells(lo)
+        c1 = self._cells(hi)
+        span = c1 - c0 + 1
+        counts = span[:, 0] * span[:, 1]
+        long = counts > MAX_CELLS_PER_SEGMENT
+        #: Segments tested by every query
+        self.long_segments = np.flatnonzero(long).astype(INDEX_DTYPE)
+        counts[long] = 0
+        seg = np.repeat(np.arange(n, dtype=np.int64), counts)
+        k = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = c0[seg, 0] + k % span[seg, 0]
+        cy = c0[seg, 1] + k // span[seg, 0]
+        cell = cy * self.shape[0] + cx
+
+        order = np.argsort(cell, kind='stable')
+        #: Segments of cell ``c`` are ``cell_segments[cell_offsets[c]:cell_offsets[c + 1]]``
+        self.cell_segments = seg[order].astype(INDEX_DTYPE)
+        self.cell_offsets = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell, minlength=self.shape[0] * self.shape[1]), out=self.cell_offsets[1:])
+        logger.debug(f"[EdgeGrid] {n} segments in {self.shape[0]}x{self.shape[1]} cells "
+                     f"of size {cell_size:.3g}")
+
+    @classmethod
+    def from_arrays(cls, arrays: HalfEdgeArrays, cell_size: Optional[float] = None) -> 'EdgeGrid':
+        """Index the edges of a mesh snapshot; queries report half-edge indices."""
+        half = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+        segments = np.hstack([arrays.coords[arrays.origin[half]], arrays.coords[arrays.target[half]]])
+        return cls(segments, cell_size, ids=half)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def _cells(self, points: np.ndarray) -> np.ndarray:
+        cells = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, np.array(self.shape) - 1)
+
+    def _cell_range(self, x0: float, y0: float, x1: float, y1: float) -> Optional[Tuple[int, int, int, int]]:
+        """Clipped cell bounds of a rectangle, or None if it misses the grid."""
+        # Plain floats: this runs on every mouse click
+        ox, oy = self.origin.tolist()
+        nx, ny = self.shape
+        cx0 = math.floor((x0 - ox) / self.cell_size)
+        cx1 = math.floor((x1 - ox) / self.cell_size)
+        cy0 = math.floor((y0 - oy) / self.cell_size)
+        cy1 = math.floor((y1 - oy) / self.cell_size)
+        if cx1 < 0 or cy1 < 0 or cx0 >= nx or cy0 >= ny or not len(self.segments):
+            return None
+        return max(cx0, 0), max(cy0, 0), min(cx1, nx - 1), min(cy1, ny - 1)
+
+    def _gather(self, point: Point, radius: float) -> np.ndarray:
+        """Segments of the cells within ``radius``, possibly repeated."""
+        x, y = point
+        cells = self._cell_range(x - radius, y - radius, x + radius, y + radius)
+        return self.long_segments if cells is None else self._collect(cells)
+
+    def _collect(self, cells: Tuple[int, int, int, int]) -> np.ndarray:
+        """Long segments plus those registered in a block of cells."""
+        x0, y0, x1, y1 = cells
+        nx = self.shape[0]
+        offsets = self.cell_offsets
+        found = [self.long_segments]
+        for row in range(y0 * nx, (y1 + 1) * nx, nx):
+            found.append(self.cell_segments[offsets[row + x0]:offsets[row + x1 + 1]])
+        return np.concatenate(found)
+
+    def in_rect(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """
+        Segments whose bounding box overlaps a rectangle.
+
+        Small rectangles read the cells they cover; once they cover a large
+        part of the grid, a single pass over all bounding boxes is cheaper.
+
+        Returns:
+            Sorted segment indices
+        """
+        cells = self._cell_range(x0, y0, x1, y1)
+        if cells is None:
+            found = self.long_segments
+        elif (cells[2] - cells[0] + 1) * (cells[3] - cells[1] + 1) * 4 >= self.shape[0] * self.shape[1]:
+            found = None
+        else:
+            found = np.unique(self._collect(cells))
+        lo, hi = (self.lo, self.hi) if found is None else (self.lo[found], self.hi[found])
+        inside = (lo[:, 0] <= x1) & (hi[:, 0] >= x0) & (lo[:, 1] <= y1) & (hi[:, 1] >= y0)
+        return np.flatnonzero(inside) if found is None else found[inside]
+
+    def candidates(self, point: Point, radius: float) -> np.ndarray:
+        """
+        Segments registered in the cells within ``radius`` of ``point``.
+
+        Every segment closer than ``radius`` is included.
+
+        Returns:
+            Unique segment indices
+        """
+        return np.unique(self._gather(point, radius))
+
+    def nearest(self, point: Point, max_distance: float = math.inf) -> Tuple[int, float]:
+        """
+        Segment nearest to ``point``.
+
+        The search radius starts at half a cell and doubles until a segment
+        within the radius is found.
+
+        Args:
+            point: (x, y) query position
+            max_distance: Ignore segments farther than this
+
+        Returns:
+            Tuple of (segment id, distance); (-1, inf) if there is none
+        """
+        if not len(self.segments):
+            return -1, math.inf
+        limit = None
+        radius = min(self.cell_size / 2, max_distance)
+        while True:
+            found = self._gather(point, radius)
+            if len(found):
+                distances = segment_distances(point, self.segments[found])
+                best = int(distances.argmin())
+                # Only a segment within the radius is sure to be the nearest;
+                # past ``limit`` the search square covers the whole grid
+                if distances[best] <= radius or (limit is not None and radius >= limit):
+                    if distances[best] > max_distance:
+                        return -1, math.inf
+                    return int(self.ids[found[best]]), float(distances[best])
+            if limit is None:
+                limit = self._distance_to_grid(point) + self.cell_size * math.hypot(*self.shape)
+            if radius >= max_distance or radius >= limit:
+                return -1, math.inf
+            radius = min(radius * 2, max_distance)
+
+    def _distance_to_grid(self, point: Point) -> float:
+        p = np.asarray(point, dtype=np.float64)
+        hi = self.origin + np.array(self.shape) * self.cell_size
+        gap = np.maximum(np.maximum(self.origin - p, p - hi), 0)
+        return float(np.hypot(*gap))
+
+    @staticmethod
+    def segments_of(edges: Sequence) -> np.ndarray:
+        """(n, 4) segments of ``HalfEdge`` objects, from ``V`` to ``S.V``."""
+        return np.array([e.V.getxy() + e.S.V.getxy() for e in edges], dtype=np.float64).reshape(-1, 4)
@@ -0,0 +1,184 @@
+"""
+Edge-weight model for searches over a Half-Edge mesh snapshot.
+
+A half-edge costs its explicit weight when one is set and its Euclidean
+length otherwise.  Lengths are computed lazily in one vectorized pass and
+cached; custom weight functions are evaluated the same way, and the most
+recently used few stay cached, so every update only recomputes the
+entries it touches.
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays
+
+logger = logging.getLogger(__name__)
+
+# Vectorized weight function: (weights, half-edge indices) -> costs
+WeightFunction = Callable[['EdgeWeights', np.ndarray], np.ndarray]
+
+# Custom weight functions kept cached besides ``default_cost``.  Functions
+# plugged in per query (e.g. lambdas) would otherwise each pin a cost array
+# and be re-evaluated on every later edit.
+MAX_CACHED_FUNCTIONS = 4
+
+
+def default_cost(weights: 'EdgeWeights', half_edges: np.ndarray) -> np.ndarray:
+    """Explicit weight where set, Euclidean length elsewhere."""
+    explicit = weights.explicit[half_edges]
+    return np.where(np.isnan(explicit), weights.lengths[half_edges], explicit)
+
+
+@dataclass
+class _CachedCosts:
+    """Costs of one weight function, with the forms derived from them."""
+    costs: np.ndarray
+    as_list: Optional[List[float]] = None
+    ratio: Optional[float] = None
+
+
+class EdgeWeights:
+    """Cached per-half-edge costs of a ``HalfEdgeArrays`` snapshot.
+
+    The snapshot itself is immutable; vertex moves and weight changes are
+    recorded here and only invalidate the half-edges they affect.
+    """
+
+    def __init__(self, arrays: HalfEdgeArrays, max_cached: int = MAX_CACHED_FUNCTIONS):
+        """
+        Initialize the weight model.
+
+        Args:
+            arrays: Mesh snapshot
+            max_cached: Custom weight functions kept cached (least recently
+                used ones are dropped); ``default_cost`` always is
+        """
+        self.arrays = arrays
+        self.coords = arrays.coords.copy()
+        self.explicit = arrays.weight.copy()
+        self.max_cached = max_cached
+        self._lengths: Optional[np.ndarray] = None
+        self._cache: 'OrderedDict[WeightFunction, _CachedCosts]' = OrderedDict()
+        self._dirty: List[np.ndarray] = []
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Euclidean length of every half-edge (computed on first use)."""
+        self._refresh()
+        if self._lengths is None:
+            d = self.coords[self.arrays.target] - self.coords[self.arrays.origin]
+            self._lengths = np.hypot(d[:, 0], d[:, 1])
+        return self._lengths
+
+    def costs(self, weight_fn: Optional[WeightFunction] = None) -> np.ndarray:
+        """
+        Costs of all half-edges under ``weight_fn``.
+
+        Args:
+            weight_fn: Vectorized weight function (default: ``default_cost``)
+
+        Returns:
+            Read-only array of costs indexed by half-edge
+        """
+        return self._cached(weight_fn).costs
+
+    def cost_list(self, weight_fn: Optional[WeightFunction] = None) -> List[float]:
+        """Costs as a plain list, for tight Python search loops."""
+        entry = self._cached(weight_fn)
+        if entry.as_list is None:
+            entry.as_list = entry.costs.tolist()
+        return entry.as_list
+
+    def min_cost_ratio(self, weight_fn: Optional[WeightFunction] = None) -> float:
+        """Smallest cost per unit length, used to keep A* heuristics admissible."""
+        entry = self._cached(weight_fn)
+        if entry.ratio is None:
+            lengths = self.lengths
+            positive = lengths > 0
+            entry.ratio = float(np.min(entry.costs[positive] / lengths[positive])) if positive.any() else 0.0
+        return entry.ratio
+
+    def _cached(self, weight_fn: Optional[WeightFunction]) -> _CachedCosts:
+        """Cache entry of a weight function, evaluating it on a miss."""
+        self._refresh()
+        fn = weight_fn or default_cost
+        entry = self._cache.get(fn)
+        if entry is not None:
+            self._cache.move_to_end(fn)
+            return entry
+        costs = np.asarray(fn(self, np.arange(self.arrays.n_half_edges)), dtype=float)
+        costs.flags.writeable = False
+        entry = _CachedCosts(costs)
+        self._cache[fn] = entry
+        custom = [f for f in self._cache if f is not default_cost]
+        for old in custom[:max(len(custom) - self.max_cached, 0)]:
+            del self._cache[old]
+        return entry
+
+    def set_weight(self, half_edges: Sequence[int], values, symmetric: bool = True) -> None:
+        """
+        Set explicit weights (NaN clears them back to the length).
+
+        Args:
+            half_edges: Half-edge indices
+            values: Weight or weights to assign
+            symmetric: Also update the twin half-edges
+        """
+        idx = np.asarray(half_edges, dtype=np.int64).reshape(-1)
+        values = np.broadcast_to(np.asarray(values, dtype=float), idx.shape)
+        self.explicit[idx] = values
+        if symmetric:
+            twins = self.arrays.twin[idx]
+            self.explicit[twins] = values
+            idx = np.concatenate([idx, twins])
+        self._dirty.append(idx)
+
+    def move_vertices(self, vertices: Sequence[int], coords) -> None:
+        """
+        Move vertices; only the lengths of their incident half-edges change.
+
+        Args:
+            vertices: Vertex indices
+            coords: New (len(vertices), 2) coordinates
+        """
+        idx = np.asarray(vertices, dtype=np.int64).reshape(-1)
+        self.coords[idx] = np.asarray(coords, dtype=float).reshape(-1, 2)
+        offsets, out_edges = self.arrays.csr
+        outgoing = np.concatenate([out_edges[offsets[v]:offsets[v + 1]] for v in idx]) if len(idx) else idx
+        self._dirty.append(np.concatenate([outgoing, self.arrays.twin[outgoing]]))
+
+    def _refresh(self) -> None:
+        """Recompute dirty entries in every cached array."""
+        if not self._dirty:
+            return
+        idx = np.unique(np.concatenate(self._dirty))
+        self._dirty = []
+        if self._lengths is not None:
+            d = self.coords[self.arrays.target[idx]] - self.coords[self.arrays.origin[idx]]
+            self._lengths[idx] = np.hypot(d[:, 0], d[:, 1])
+        for fn, entry in self._cache.items():
+            updated = np.asarray(fn(self, idx), dtype=float)
+            entry.costs.flags.writeable = True
+            entry.costs[idx] = updated
+            entry.costs.flags.writeable = False
+            entry.ratio = None
+            if entry.as_list is not None:
+                for i, value in zip(idx.tolist(), updated.tolist()):
+                    entry.as_list[i] = value
+        logger.debug(f"[EdgeWeights] Refreshed {len(idx)} half-edges")
+
+
+def weights_for(arrays: HalfEdgeArrays) -> EdgeWeights:
+    """Shared ``EdgeWeights`` of a snapshot, created on first use."""
+    # Stored in the instance dict (like functools.cached_property) so the
+    # model lives exactly as long as its snapshot
+    state = vars(arrays)
+    weights = state.get('_edge_weights')
+    if weights is None:
+        weights = EdgeWeights(arrays)
+        state['_edge_weights'] = weights
+    return weights
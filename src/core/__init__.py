@@ -1,8 +1,9 @@
 """
 Core Half-Edge data structure implementation.
 """
-from .half_edge_ds import HalfEdge, Vertex, Splice, neighbours
+from .half_edge_ds import HalfEdge, Vertex, Splice, neighbours, outgoing
+from .half_edge_arrays import HalfEdgeArrays
 
 __all__ = [
-    'HalfEdge', 'Vertex', 'Splice', 'neighbours'
+    'HalfEdge', 'Vertex', 'Splice', 'neighbours', 'outgoing', 'HalfEdgeArrays'
 ]
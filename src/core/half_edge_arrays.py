@@ -0,0 +1,384 @@
+"""
+Array (structure-of-arrays) snapshot of a Half-Edge data structure.
+
+The object graph built from ``Vertex``/``HalfEdge`` is convenient for editing,
+but every algorithm that touches the whole mesh pays for Python attribute
+chasing.  ``HalfEdgeArrays`` flattens the connectivity into NumPy arrays
+indexed by dense integers, which can be shared between processes, written to
+disk or fed to vectorized code.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .half_edge_ds import HalfEdge, Vertex
+
+INDEX_DTYPE = np.int32
+COORD_DTYPE = np.float64
+
+
+def _reserve_ids(owner: type, n: int) -> np.ndarray:
+    """Take ``n`` consecutive ids from the ``count`` of ``Vertex``/``HalfEdge``."""
+    start = owner.count
+    owner.count += n
+    return np.arange(start, start + n, dtype=np.int64)
+
+
+@dataclass(frozen=True, eq=False)
+class HalfEdgeArrays:
+    """Immutable array view of a Half-Edge data structure.
+
+    Half-edges and vertices are addressed by dense indices.  The pointer
+    arrays follow the conventions of ``half_edge_ds``:
+
+    Attributes:
+        coords: (n_vertices, 2) vertex coordinates
+        origin: (n_half_edges,) index of the origin vertex (``HalfEdge.V``)
+        twin: (n_half_edges,) index of the symmetric half-edge (``HalfEdge.S``)
+        next: (n_half_edges,) next half-edge around the origin (``HalfEdge.Next``)
+        weight: (n_half_edges,) explicit edge weight, NaN where unset
+        vertex_ids: (n_vertices,) ``Vertex.Vertex_id`` of every vertex
+        edge_ids: (n_half_edges,) ``HalfEdge.id`` of every half-edge
+    """
+    coords: np.ndarray
+    origin: np.ndarray
+    twin: np.ndarray
+    next: np.ndarray
+    weight: np.ndarray
+    vertex_ids: np.ndarray
+    edge_ids: np.ndarray
+
+    def __post_init__(self):
+        for name in ('coords', 'origin', 'twin', 'next', 'weight', 'vertex_ids', 'edge_ids'):
+            getattr(self, name).flags.writeable = False
+
+    @property
+    def n_vertices(self) -> int:
+        """Number of vertices."""
+        return len(self.coords)
+
+    @property
+    def n_half_edges(self) -> int:
+        """Number of half-edges (twice the number of edges)."""
+        return len(self.origin)
+
+    @cached_property
+    def target(self) -> np.ndarray:
+        """Index of the destination vertex of every half-edge."""
+        return self.origin[self.twin]
+
+    @cached_property
+    def face_next(self) -> np.ndarray:
+        """Next half-edge along the face cycle (``HalfEdge.next_in``)."""
+        return self.next[self.twin]
+
+    @cached_property
+    def face_ids(self) -> np.ndarray:
+        """Dense index of the face cycle every half-edge belongs to.
+
+        Faces are numbered in the order of their smallest half-edge index.
+        """
+        fn = self.face_next
+        index = np.arange(self.n_half_edges, dtype=INDEX_DTYPE)
+        fn2 = fn[fn]
+        # Cycles of up to three half-edges (triangles, dangling edges) are
+        # labelled directly; only the longer ones need pointer jumping
+        short = (fn2 == index) | (fn2[fn] == index)
+        labels = np.minimum(np.minimum(index, fn), fn2)
+        rest = np.flatnonzero(~short).astype(INDEX_DTYPE)
+        if len(rest):
+            local = np.empty(self.n_half_edges, dtype=INDEX_DTYPE)
+            local[rest] = np.arange(len(rest), dtype=INDEX_DTYPE)
+            sub_fn = local[fn[rest]]
+            sub_labels = rest.copy()
+            jump = sub_fn
+            # Pointer jumping: after k rounds every half-edge holds the
+            # minimum over the next 2**k half-edges of its cycle
+            while np.any(sub_labels != sub_labels[sub_fn]):
+                np.minimum(sub_labels, sub_labels[jump], out=sub_labels)
+                jump = jump[jump]
+            labels[rest] = sub_labels
+        first = labels == index
+        dense = np.cumsum(first, dtype=INDEX_DTYPE) - 1
+        return dense[labels]
+
+    def faces(self, include_outer: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Vertex cycles of the faces, counter-clockwise.
+
+        Each face cycle is walked through ``face_next``.  The outer face of
+        every component runs the other way round and is skipped unless
+        ``include_outer``; cycles enclosing no area are always skipped.
+
+        Args:
+            include_outer: Also return the outer (clockwise) cycles
+
+        Returns:
+            Tuple of (flat vertex indices, vertices per face), the format
+            ``parse_obj`` reads faces into
+        """
+        fid = self.face_ids
+        n_faces = int(fid.max()) + 1 if len(fid) else 0
+        x = self.coords[:, 0][self.origin]
+        y = self.coords[:, 1][self.origin]
+        twin = self.twin
+        # Twice the signed area of every cycle (shoelace formula)
+        area = np.bincount(fid, weights=x * y[twin] - y * x[twin], minlength=n_faces)
+        # Rings turn clockwise around vertices, so inner faces come out clockwise
+        keep = area < 0
+        if include_outer:
+            keep |= area > 0
+
+        sizes = np.bincount(fid, minlength=n_faces)
+        # Faces are numbered in the order of their smallest half-edge, so
+        # every new face id met in index order starts its cycle
+        seen = np.maximum.accumulate(fid)
+        starts = np.flatnonzero(np.r_[len(fid) > 0, seen[1:] > seen[:-1]])[keep]
+        sizes = sizes[keep].astype(INDEX_DTYPE)
+        offsets = np.cumsum(sizes) - sizes
+
+        out = np.empty(int(sizes.sum()), dtype=np.int64)
+        fn = self.face_next
+        # Walk all cycles at once, filling each face from its end so the
+        # clockwise cycles come out counter-clockwise
+        current, position, left = starts, offsets + sizes - 1, sizes
+        while len(current):
+            out[position] = self.origin[current]
+            left = left - 1
+            alive = left > 0
+            current, position, left = fn[current[alive]], position[alive] - 1, left[alive]
+        return out, sizes
+
+    def triangles(self) -> np.ndarray:
+        """Inner faces split into triangles.
+
+        Faces with more than three vertices are split into a fan from their
+        first vertex, which is exact for convex faces.
+
+        Returns:
+            (n, 3) vertex indices of the counter-clockwise triangles
+        """
+        face_vertices, face_sizes = self.faces()
+        offsets = np.cumsum(face_sizes) - face_sizes
+        fans = np.maximum(face_sizes - 2, 0)
+        # Fan triangles (first, k, k + 1) of every face
+        first = np.repeat(offsets, fans)
+        k = np.arange(int(fans.sum())) - np.repeat(np.cumsum(fans) - fans, fans) + 1
+        return face_vertices[np.column_stack([first, first + k, first + k + 1])]
+
+    @cached_property
+    def lengths(self) -> np.ndarray:
+        """Euclidean length of every half-edge."""
+        d = self.coords[self.target] - self.coords[self.origin]
+        return np.hypot(d[:, 0], d[:, 1])
+
+    @cached_property
+    def csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Outgoing half-edges grouped by origin vertex.
+
+        Returns:
+            Tuple ``(offsets, out_edges)``: the half-edges leaving vertex ``v``
+            are ``out_edges[offsets[v]:offsets[v + 1]]``
+        """
+        out_edges = np.argsort(self.origin, kind='stable').astype(INDEX_DTYPE)
+        counts = np.bincount(self.origin, minlength=self.n_vertices)
+        offsets = np.zeros(self.n_vertices + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets, out_edges
+
+    def vertex_index(self) -> Dict[int, int]:
+        """Map ``Vertex.Vertex_id`` to the dense vertex index."""
+        return {vid: i for i, vid in enumerate(self.vertex_ids.tolist())}
+
+    def make_vertices(self, coords: Optional[np.ndarray] = None) -> List[Vertex]:
+        """Create a ``Vertex`` per vertex, with ids from ``vertex_ids``.
+
+        Args:
+            coords: Optional (n_vertices, 2) positions to use instead of
+                ``coords`` (e.g. screen coordinates)
+
+        Returns:
+            List of vertices in index order
+        """
+        coords = self.coords if coords is None else np.asarray(coords)
+        vertices = []
+        for (x, y), vid in zip(coords.tolist(), self.vertex_ids.tolist()):
+            vertex = Vertex(x, y)
+            vertex.Vertex_id = vid
+            vertices.append(vertex)
+        return vertices
+
+    def iter_half_edges(self, vertices: Sequence[Vertex], chunk_size: int = 1 << 16) -> Iterator[List[HalfEdge]]:
+        """Create the Half-Edge objects in chunks.
+
+        Each chunk holds one half-edge per edge, already paired with its
+        twin, so it can be drawn right away.  ``Next``/``Prev`` are linked
+        once the last chunk has been consumed.
+
+        Args:
+            vertices: One vertex per vertex index
+            chunk_size: Edges per chunk
+
+        Yields:
+            Lists of half-edges, like ``HalfEdgeBuilder.build`` returns them
+        """
+        origin = self.origin.tolist()
+        twin = self.twin.tolist()
+        edge_ids = self.edge_ids.tolist()
+        half_edges: List[Optional[HalfEdge]] = [None] * self.n_half_edges
+        chunk: List[HalfEdge] = []
+        for h in range(self.n_half_edges):
+            if half_edges[h] is not None:
+                continue
+            he = HalfEdge(vertices[origin[h]], vertices[origin[twin[h]]])
+            he.id = edge_ids[h]
+            he.S.id = edge_ids[twin[h]]
+            half_edges[h] = he
+            half_edges[twin[h]] = he.S
+            chunk.append(he)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+        for h, (n, w) in enumerate(zip(self.next.tolist(), self.weight.tolist())):
+            he = half_edges[h]
+            he.Next = half_edges[n]
+            half_edges[n].Prev = he
+            if w == w:
+                he.weight = w
+
+    def to_half_edges(self, vertices: Optional[Sequence[Vertex]] = None) -> Tuple[List[Vertex], List[HalfEdge]]:
+        """Rebuild the Half-Edge object graph.
+
+        New objects take their ids from ``vertex_ids`` and ``edge_ids``.
+
+        Args:
+            vertices: Optional existing vertices for the leading vertex indices
+
+        Returns:
+            Tuple of (vertices, one half-edge per edge), like
+            ``HalfEdgeBuilder.build``
+        """
+        vertices = list(vertices) if vertices is not None else []
+        if len(vertices) < self.n_vertices:
+            vertices += self.make_vertices()[len(vertices):]
+        edges: List[HalfEdge] = []
+        for chunk in self.iter_half_edges(vertices):
+            edges.extend(chunk)
+        return vertices, edges
+
+    @classmethod
+    def from_edge_list(cls, coords: np.ndarray, edges: np.ndarray,
+                       weights: Optional[np.ndarray] = None,
+                       vertex_ids: Optional[np.ndarray] = None) -> 'HalfEdgeArrays':
+        """Build the connectivity of undirected edges in one vectorized pass.
+
+        Edge ``i`` becomes half-edges ``2 * i`` (a -> b) and ``2 * i + 1``
+        (b -> a).  The ``next`` ring around every vertex is ordered the same
+        way ``HalfEdgeBuilder`` orders it: by descending ``Azymut``.
+
+        Args:
+            coords: (n_vertices, 2) vertex coordinates
+            edges: (n_edges, 2) vertex index pairs, without duplicates
+            weights: Optional (n_edges,) weights, NaN where unset
+            vertex_ids: Optional vertex ids (default: fresh ``Vertex_id`` s)
+
+        Returns:
+            HalfEdgeArrays describing the edges
+        """
+        coords = np.ascontiguousarray(coords, dtype=COORD_DTYPE).reshape(-1, 2)
+        edges = np.asarray(edges, dtype=INDEX_DTYPE).reshape(-1, 2)
+        n = 2 * len(edges)
+        origin = edges.reshape(-1).copy()
+        twin = np.arange(n, dtype=INDEX_DTYPE) ^ 1
+        target = origin[twin]
+
+        d = coords[target] - coords[origin]
+        azimuth = np.mod(np.arctan2(d[:, 0], d[:, 1]), 2 * np.pi)
+        order = np.lexsort((-azimuth, origin)).astype(INDEX_DTYPE)
+        nxt = np.empty(n, dtype=INDEX_DTYPE)
+        if n:
+            # next of each half-edge is the following one in its origin group,
+            # wrapping to the first of the group
+            grouped = origin[order]
+            following = np.roll(order, -1)
+            last = np.r_[grouped[1:] != grouped[:-1], True]
+            first = np.r_[True, grouped[1:] != grouped[:-1]]
+            following[last] = order[first]
+            nxt[order] = following
+
+        weight = np.full(n, np.nan, dtype=COORD_DTYPE)
+        if weights is not None:
+            weight[:] = np.repeat(np.asarray(weights, dtype=COORD_DTYPE), 2)
+        if vertex_ids is None:
+            vertex_ids = _reserve_ids(Vertex, len(coords))
+        return cls(
+            coords=coords,
+            origin=origin,
+            twin=twin,
+            next=nxt,
+            weight=weight,
+            vertex_ids=np.asarray(vertex_ids, dtype=np.int64),
+            edge_ids=_reserve_ids(HalfEdge, n),
+        )
+
+    @classmethod
+    def from_half_edges(cls, edges: Iterable[HalfEdge],
+                        vertices: Optional[Iterable[Vertex]] = None) -> 'HalfEdgeArrays':
+        """Snapshot a Half-Edge object graph.
+
+        Every half-edge reachable from ``edges`` through ``S`` and ``Next`` is
+        included, so passing one half-edge per edge (as ``HalfEdgeBuilder``
+        returns) is enough.
+
+        Args:
+            edges: Half-edges of the structure
+            vertices: Optional vertex order; isolated vertices are kept
+
+        Returns:
+            HalfEdgeArrays describing the same connectivity
+        """
+        vertex_list: List[Vertex] = list(vertices) if vertices is not None else []
+        v_index: Dict[int, int] = {id(v): i for i, v in enumerate(vertex_list)}
+
+        he_list: List[HalfEdge] = []
+        he_index: Dict[int, int] = {}
+        stack = list(edges)
+        while stack:
+            he = stack.pop()
+            if he is None or id(he) in he_index:
+                continue
+            he_index[id(he)] = len(he_list)
+            he_list.append(he)
+            stack.append(he.Next)
+            stack.append(he.S)
+
+        n = len(he_list)
+        origin = np.empty(n, dtype=INDEX_DTYPE)
+        twin = np.empty(n, dtype=INDEX_DTYPE)
+        nxt = np.empty(n, dtype=INDEX_DTYPE)
+        weight = np.full(n, np.nan, dtype=COORD_DTYPE)
+        for i, he in enumerate(he_list):
+            key = id(he.V)
+            if key not in v_index:
+                v_index[key] = len(vertex_list)
+                vertex_list.append(he.V)
+            origin[i] = v_index[key]
+            twin[i] = he_index[id(he.S)]
+            nxt[i] = he_index[id(he.Next)]
+            if he.weight is not None:
+                weight[i] = he.weight
+
+        coords = np.array([v.getxy() for v in vertex_list], dtype=COORD_DTYPE).reshape(-1, 2)
+        return cls(
+            coords=coords,
+            origin=origin,
+            twin=twin,
+            next=nxt,
+            weight=weight,
+            vertex_ids=np.array([v.Vertex_id for v in vertex_list], dtype=np.int64),
+            edge_ids=np.array([he.id for he in he_list], dtype=np.int64),
+        )
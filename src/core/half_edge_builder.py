@@ -1,10 +1,12 @@
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
+import numpy as np
 from .half_edge_ds import (
     HalfEdge, Vertex, MakeEdge, Splice, Azymut,
     validate_coordinates, validate_vertex_id, validate_edge_connection,
     validate_edge_weight, VertexValidationError, EdgeValidationError
 )
+from .half_edge_arrays import HalfEdgeArrays, COORD_DTYPE, INDEX_DTYPE, _reserve_ids
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,12 @@ class HalfEdgeBuilder:
         self._built_edges: List[HalfEdge] = []
         self._existing_vertex_ids: List[int] = []
         self._existing_edges: List[Tuple[int, int]] = []
+        # Bulk input (add_vertices/add_edges), kept as arrays until built
+        self._bulk_coords: List[np.ndarray] = []
+        self._bulk_vertex_ids: List[np.ndarray] = []
+        self._bulk_edges: List[np.ndarray] = []
+        self._bulk_weights: List[np.ndarray] = []
+        self._n_bulk_vertices = 0
     
     def add_vertex(self, x: float, y: float, z: float = 0) -> 'HalfEdgeBuilder':
         """Add a vertex to the structure.
@@ -88,12 +96,100 @@ class HalfEdgeBuilder:
         self._existing_edges.append((start_vertex.Vertex_id, end_vertex.Vertex_id))
         return self
     
+    def add_vertices(self, coords: np.ndarray) -> 'HalfEdgeBuilder':
+        """Add many vertices at once.
+
+        Bulk vertices are addressed by ``add_edges`` through their index in
+        the order they were added with this method.
+
+        Args:
+            coords: (n, 2) array of x, y coordinates
+
+        Returns:
+            self for method chaining
+
+        Raises:
+            VertexValidationError: If any coordinate is NaN or infinite
+        """
+        coords = np.asarray(coords, dtype=COORD_DTYPE).reshape(-1, 2)
+        if not np.isfinite(coords).all():
+            raise VertexValidationError("Coordinates cannot be NaN or infinite")
+        self._bulk_coords.append(coords)
+        self._bulk_vertex_ids.append(_reserve_ids(Vertex, len(coords)))
+        self._n_bulk_vertices += len(coords)
+        return self
+
+    def add_edges(self, edges: np.ndarray, weights: Optional[np.ndarray] = None) -> 'HalfEdgeBuilder':
+        """Add many edges between bulk vertices at once.
+
+        Args:
+            edges: (n, 2) array of bulk vertex indices
+            weights: Optional (n,) weights, NaN where unset
+
+        Returns:
+            self for method chaining
+
+        Raises:
+            EdgeValidationError: If an edge is a loop, repeats an existing
+                edge, references an unknown vertex or has an invalid weight
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if len(edges) and (edges.min() < 0 or edges.max() >= self._n_bulk_vertices):
+            raise EdgeValidationError("Edge references a vertex that was not added")
+        if np.any(edges[:, 0] == edges[:, 1]):
+            raise EdgeValidationError("Cannot create edge to the same vertex")
+        keys = np.sort(np.concatenate([np.sort(e, axis=1) @ [self._n_bulk_vertices, 1]
+                                       for e in self._bulk_edges + [edges]]))
+        if np.any(keys[1:] == keys[:-1]):
+            raise EdgeValidationError("Duplicate edges between the same vertices")
+
+        if weights is None:
+            weights = np.full(len(edges), np.nan, dtype=COORD_DTYPE)
+        weights = np.asarray(weights, dtype=COORD_DTYPE).reshape(-1)
+        if len(weights) != len(edges):
+            raise EdgeValidationError("Expected one weight per edge")
+        if np.any(weights < 0) or np.isinf(weights).any():
+            raise EdgeValidationError("Edge weight cannot be negative or infinite")
+        self._bulk_edges.append(edges)
+        self._bulk_weights.append(weights)
+        return self
+
+    def build_arrays(self) -> HalfEdgeArrays:
+        """Build the structure as a ``HalfEdgeArrays`` snapshot.
+
+        Vertices added one by one come first, followed by the bulk vertices.
+
+        Returns:
+            HalfEdgeArrays with the same rings ``build`` would create
+        """
+        index = {v.Vertex_id: i for i, v in enumerate(self._vertices)}
+        k = len(self._vertices)
+        coords = np.concatenate([np.array([v.getxy() for v in self._vertices], dtype=COORD_DTYPE).reshape(-1, 2)]
+                                + self._bulk_coords)
+        vertex_ids = np.concatenate([np.array([v.Vertex_id for v in self._vertices], dtype=np.int64)]
+                                    + self._bulk_vertex_ids)
+        edges = np.concatenate(
+            [np.array([(index[e.start_vertex.Vertex_id], index[e.end_vertex.Vertex_id]) for e in self._edges],
+                      dtype=np.int64).reshape(-1, 2)]
+            + [e + k for e in self._bulk_edges])
+        weights = np.concatenate(
+            [np.array([np.nan if e.weight is None else e.weight for e in self._edges], dtype=COORD_DTYPE)]
+            + self._bulk_weights)
+        arrays = HalfEdgeArrays.from_edge_list(coords, edges.astype(INDEX_DTYPE), weights, vertex_ids)
+        logger.debug(f"[HalfEdgeBuilder] Built arrays with {arrays.n_vertices} vertices "
+                     f"and {arrays.n_half_edges} half-edges")
+        return arrays
+
     def build(self) -> Tuple[List[Vertex], List[HalfEdge]]:
         """Build the Half-Edge data structure.
         
         Returns:
             Tuple containing list of vertices and list of half-edges
         """
+        if self._n_bulk_vertices:
+            vertices, self._built_edges = self.build_arrays().to_half_edges(self._vertices)
+            return vertices, self._built_edges
+
         # Create all edges
         for edge_data in self._edges:
             he = MakeEdge(edge_data.start_vertex, edge_data.end_vertex)
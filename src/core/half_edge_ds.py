@@ -184,6 +184,7 @@ class HalfEdge(object):
         self.Prev = None  # Previous edge
         self.taken_edge = False
         self.weight = None
+        self._length = None
         
         if v1 is not None and v2 is not None:
             self.S = HalfEdge(v2, None)
@@ -217,6 +218,18 @@ class HalfEdge(object):
         """Get edge weight."""
         return self.weight
 
+    def length(self) -> float:
+        """Get Euclidean edge length (computed once and cached)."""
+        if self._length is None:
+            x1, y1 = self.V.getxy()
+            x2, y2 = self.S.V.getxy()
+            self._length = math.hypot(x2 - x1, y2 - y1)
+        return self._length
+
+    def get_cost(self) -> float:
+        """Get traversal cost: the weight if set, the Euclidean length otherwise."""
+        return self.weight if self.weight is not None else self.length()
+
 def MakeEdge(V1: Vertex, V2: Vertex) -> HalfEdge:
     """
     Create an edge between two vertices.
@@ -272,6 +285,27 @@ def neighbours(edge: HalfEdge) -> List[HalfEdge]:
             
     return neighbors
 
+def outgoing(edge: HalfEdge) -> List[HalfEdge]:
+    """
+    Get all half-edges leaving the origin vertex of an edge.
+    
+    Args:
+        edge: Half-edge whose origin ring to walk
+        
+    Returns:
+        List of half-edges sharing edge.V as origin
+    """
+    ring = []
+    current = edge
+    
+    while True:
+        ring.append(current)
+        current = current.Next
+        if current == edge:
+            break
+            
+    return ring
+
 def Azymut(e):
     # funciton to count angle betwen two vertex
     # this function return an Angle
@@ -1,171 +1,285 @@
+"""
+Tkinter viewer for editing a Half-Edge mesh by hand.
+
+The canvas items are kept in step with the mesh instead of being redrawn:
+``MeshCanvas`` maps every half-edge id to the line item of its edge and
+every vertex to its dot and label.  After an edit (a new vertex, a
+re-triangulation) only the items of edges that appeared or disappeared are
+touched; freed line items are moved onto new edges with ``coords()`` before
+any new item is created.
+"""
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import List, Optional
-from ..core.half_edge import HalfEdge, Vertex, Face, Fast_splice, verify_connectivity
-from ..algorithms.delaunay import DelaunayTriangulation
+import random
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..core.half_edge_ds import HalfEdge, Vertex
+from ..core.half_edge_arrays import HalfEdgeArrays
+from ..algorithms.incremental_delaunay import IncrementalDelaunay, spatial_order
 
 logger = logging.getLogger(__name__)
 
+VERTEX_RADIUS = 3
+LABEL_OFFSET = 10
+PICK_RADIUS = 8  # pixels within which a click picks a vertex
+
+# Edge identity that survives rebuilding the half-edges: its vertex ids
+EdgeKey = Tuple[int, int]
+
+
+def edge_key(edge: HalfEdge) -> EdgeKey:
+    """Vertex ids of an edge, smaller first (the same for both halves)."""
+    a, b = edge.V.Vertex_id, edge.S.V.Vertex_id
+    return (a, b) if a < b else (b, a)
+
+
+class MeshCanvas:
+    """A mesh drawn on a Tk canvas, with one persistent item per edge and vertex.
+
+    Attributes:
+        vertices: Vertices in insertion order
+        edges: One half-edge per edge
+        edge_items: Half-edge id (both halves) -> line item id
+        vertex_items: Vertex id -> (dot item id, label item id)
+        triangulated: Whether edits re-run the Delaunay triangulation
+    """
+
+    def __init__(self, canvas, edge_color: str = 'blue', vertex_color: str = 'black'):
+        """
+        Initialize an empty mesh.
+
+        Args:
+            canvas: ``tk.Canvas`` (or anything with its item methods)
+            edge_color: Line color of the edges
+            vertex_color: Fill color of the vertices
+        """
+        self.canvas = canvas
+        self.edge_color = edge_color
+        self.vertex_color = vertex_color
+        self.vertices: List[Vertex] = []
+        self.edges: List[HalfEdge] = []
+        self.edge_items: Dict[int, int] = {}
+        self.vertex_items: Dict[int, Tuple[int, int]] = {}
+        self.triangulated = False
+        self._lines: Dict[EdgeKey, int] = {}
+
+    def pairs(self) -> Set[EdgeKey]:
+        """Vertex id pairs of the current edges."""
+        return set(self._lines)
+
+    def add_vertex(self, x: float, y: float) -> Vertex:
+        """
+        Add a vertex, re-triangulating if the mesh is triangulated.
+
+        Args:
+            x: Canvas x coordinate
+            y: Canvas y coordinate
+
+        Returns:
+            The new vertex
+        """
+        vertex = Vertex(x, y)
+        self.vertices.append(vertex)
+        r = VERTEX_RADIUS
+        self.vertex_items[vertex.Vertex_id] = (
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=self.vertex_color),
+            self.canvas.create_text(x + LABEL_OFFSET, y + LABEL_OFFSET, text=str(vertex.Vertex_id)))
+        if self.triangulated:
+            self.triangulate()
+        logger.debug(f"[MeshCanvas] Added vertex {vertex.Vertex_id} at ({x}, {y})")
+        return vertex
+
+    def remove_vertex(self, vertex: Vertex) -> None:
+        """Remove a vertex with its edges, re-triangulating if the mesh is triangulated."""
+        self.vertices.remove(vertex)
+        for item in self.vertex_items.pop(vertex.Vertex_id):
+            self.canvas.delete(item)
+        if self.triangulated:
+            self.triangulate()
+        else:
+            vid = vertex.Vertex_id
+            self.set_edges({key for key in self._lines if vid not in key})
+        logger.debug(f"[MeshCanvas] Removed vertex {vertex.Vertex_id}")
+
+    def vertex_at(self, x: float, y: float, radius: float = PICK_RADIUS) -> Optional[Vertex]:
+        """The vertex nearest to a canvas point, if within ``radius``."""
+        best, best_d2 = None, radius * radius
+        for vertex in self.vertices:
+            vx, vy = vertex.getxy()
+            d2 = (vx - x) ** 2 + (vy - y) ** 2
+            if d2 <= best_d2:
+                best, best_d2 = vertex, d2
+        return best
+
+    def connect_chain(self) -> None:
+        """Connect consecutive vertices, keeping the existing edges."""
+        ids = [v.Vertex_id for v in self.vertices]
+        chain = {(a, b) if a < b else (b, a) for a, b in zip(ids, ids[1:])}
+        self.triangulated = False
+        self.set_edges(self.pairs() | chain)
+
+    def triangulate(self) -> None:
+        """Replace the edges with the Delaunay triangulation of the vertices."""
+        self.triangulated = True
+        coords = np.array([v.getxy() for v in self.vertices], dtype=np.float64).reshape(-1, 2)
+        dt = IncrementalDelaunay(coords).insert_all(spatial_order(coords))
+        ids = [v.Vertex_id for v in self.vertices]
+        self.set_edges({(ids[a], ids[b]) if ids[a] < ids[b] else (ids[b], ids[a])
+                        for a, b in dt.edges().tolist()})
+
+    def set_edges(self, pairs: Set[EdgeKey]) -> None:
+        """
+        Rebuild the half-edges of some vertex id pairs and update the canvas.
+
+        Args:
+            pairs: Vertex id pairs of all edges to keep or create
+        """
+        index = {v.Vertex_id: i for i, v in enumerate(self.vertices)}
+        edges = np.array([(index[a], index[b]) for a, b in sorted(pairs)], dtype=np.int64).reshape(-1, 2)
+        coords = np.array([v.getxy() for v in self.vertices], dtype=np.float64).reshape(-1, 2)
+        arrays = HalfEdgeArrays.from_edge_list(coords, edges, vertex_ids=[v.Vertex_id for v in self.vertices])
+        _, self.edges = arrays.to_half_edges(self.vertices)
+        self.sync()
+
+    def sync(self) -> Tuple[int, int, int]:
+        """
+        Bring the line items in step with ``edges``.
+
+        Lines of kept edges are left alone.  Lines of removed edges are
+        moved onto added edges, and only the rest are created or deleted.
+
+        Returns:
+            Tuple of (created, moved, deleted) item counts
+        """
+        current = {edge_key(edge): edge for edge in self.edges}
+        freed = [self._lines.pop(key) for key in list(self._lines) if key not in current]
+        created = moved = 0
+        for key, edge in current.items():
+            if key in self._lines:
+                continue
+            (x1, y1), (x2, y2) = edge.V.getxy(), edge.S.V.getxy()
+            if freed:
+                item = freed.pop()
+                self.canvas.coords(item, x1, y1, x2, y2)
+                moved += 1
+            else:
+                item = self.canvas.create_line(x1, y1, x2, y2, fill=self.edge_color)
+                created += 1
+            self._lines[key] = item
+        for item in freed:
+            self.canvas.delete(item)
+
+        # The half-edge objects are new after every rebuild
+        self.edge_items = {}
+        for key, edge in current.items():
+            self.edge_items[edge.id] = self.edge_items[edge.S.id] = self._lines[key]
+        logger.debug(f"[MeshCanvas] Synced {len(current)} edges: {created} created, "
+                     f"{moved} moved, {len(freed)} deleted")
+        return created, moved, len(freed)
+
+    def clear(self) -> None:
+        """Remove all vertices, edges and their items."""
+        for item in self._lines.values():
+            self.canvas.delete(item)
+        for items in self.vertex_items.values():
+            for item in items:
+                self.canvas.delete(item)
+        self.vertices, self.edges = [], []
+        self.edge_items, self.vertex_items, self._lines = {}, {}, {}
+        self.triangulated = False
+
+
 class MainWindow:
+    """Tkinter window: click to add vertices, right-click to remove them."""
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Half-Edge Structure Viewer")
         self.setup_ui()
-        
+
     def setup_ui(self):
         # Create main frame
         self.main_frame = ttk.Frame(self.root, padding="10")
         self.main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
+
         # Create canvas for drawing
         self.canvas = tk.Canvas(self.main_frame, width=800, height=600, bg='white')
         self.canvas.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
+        self.mesh = MeshCanvas(self.canvas)
+
         # Create buttons frame
         self.button_frame = ttk.Frame(self.main_frame, padding="5")
         self.button_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E))
-        
+
         # Add buttons
         self.add_vertex_btn = ttk.Button(self.button_frame, text="Add Vertex", command=self.add_vertex)
         self.add_vertex_btn.grid(row=0, column=0, padx=5)
-        
+
         self.connect_edges_btn = ttk.Button(self.button_frame, text="Connect Edges", command=self.connect_edges)
         self.connect_edges_btn.grid(row=0, column=1, padx=5)
-        
-        self.create_face_btn = ttk.Button(self.button_frame, text="Create Face", command=self.create_face)
-        self.create_face_btn.grid(row=0, column=2, padx=5)
-        
+
         self.delaunay_btn = ttk.Button(self.button_frame, text="Delaunay Triangulation", command=self.perform_delaunay)
-        self.delaunay_btn.grid(row=0, column=3, padx=5)
-        
-        # Initialize data structures
-        self.vertices: List[Vertex] = []
-        self.edges: List[HalfEdge] = []
-        self.faces: List[Face] = []
-        
-        # Bind canvas click event
+        self.delaunay_btn.grid(row=0, column=2, padx=5)
+
+        self.clear_btn = ttk.Button(self.button_frame, text="Clear", command=self.mesh.clear)
+        self.clear_btn.grid(row=0, column=3, padx=5)
+
+        # Bind canvas click events
         self.canvas.bind("<Button-1>", self.on_canvas_click)
-        
+        self.canvas.bind("<Button-3>", self.on_canvas_right_click)
+
     def on_canvas_click(self, event):
-        """Handle canvas click events"""
-        x, y = event.x, event.y
-        logger.debug(f"Canvas clicked at ({x}, {y})")
-        self.add_vertex_at(x, y)
-        
-    def add_vertex_at(self, x: float, y: float):
-        """Add a new vertex at the specified coordinates"""
-        vertex = Vertex(x, y)
-        self.vertices.append(vertex)
-        logger.info(f"Added vertex {vertex.id} at ({x}, {y})")
-        self.draw_vertex(vertex)
-        
-    def draw_vertex(self, vertex: Vertex):
-        """Draw a vertex on the canvas"""
-        x, y = vertex.x, vertex.y
-        self.canvas.create_oval(x-3, y-3, x+3, y+3, fill='black')
-        self.canvas.create_text(x+10, y+10, text=str(vertex.id))
-        
+        """Add a vertex where the canvas was clicked."""
+        logger.debug(f"Canvas clicked at ({event.x}, {event.y})")
+        self.add_vertex_at(event.x, event.y)
+
+    def on_canvas_right_click(self, event):
+        """Remove the vertex under the mouse, if any."""
+        vertex = self.mesh.vertex_at(event.x, event.y)
+        if vertex is not None:
+            self.mesh.remove_vertex(vertex)
+
+    def add_vertex_at(self, x: float, y: float) -> Vertex:
+        """Add a new vertex at the specified coordinates."""
+        vertex = self.mesh.add_vertex(x, y)
+        logger.info(f"Added vertex {vertex.Vertex_id} at ({x}, {y})")
+        return vertex
+
     def add_vertex(self):
-        """Add a vertex at a random position"""
-        import random
-        x = random.randint(50, 750)
-        y = random.randint(50, 550)
-        self.add_vertex_at(x, y)
-        
+        """Add a vertex at a random position."""
+        self.add_vertex_at(random.randint(50, 750), random.randint(50, 550))
+
     def connect_edges(self):
-        """Connect selected vertices with edges"""
-        if len(self.vertices) < 2:
+        """Connect consecutive vertices with edges."""
+        if len(self.mesh.vertices) < 2:
             logger.warning("Need at least 2 vertices to create edges")
             return
-            
-        # Create edges between consecutive vertices
-        for i in range(len(self.vertices)-1):
-            edge = HalfEdge(self.vertices[i])
-            twin = HalfEdge(self.vertices[i+1])
-            edge.twin = twin
-            twin.twin = edge
-            self.edges.extend([edge, twin])
-            logger.info(f"Created edge pair {edge.id} <-> {twin.id}")
-            
-        # Connect edges using Fast_splice
-        try:
-            Fast_splice(self.edges)
-            if verify_connectivity(self.edges):
-                logger.info("Edge connectivity verified successfully")
-                self.draw_edges()
-            else:
-                logger.error("Edge connectivity verification failed")
-        except Exception as e:
-            logger.error(f"Error in Fast_splice: {str(e)}")
-            
-    def draw_edges(self):
-        """Draw all edges on the canvas"""
-        for edge in self.edges:
-            start = edge.vertex
-            end = edge.next.vertex if edge.next else edge.twin.vertex
-            self.canvas.create_line(start.x, start.y, end.x, end.y, fill='blue')
-            
-    def create_face(self):
-        """Create a face from the current edge structure"""
-        if not self.edges:
-            logger.warning("No edges available to create face")
-            return
-            
-        try:
-            face = Face()
-            face.edge = self.edges[0]
-            for edge in self.edges:
-                edge.face = face
-            self.faces.append(face)
-            logger.info(f"Created face {face.id}")
-        except Exception as e:
-            logger.error(f"Error creating face: {str(e)}")
-            
+        self.mesh.connect_chain()
+        logger.info(f"Mesh has {len(self.mesh.edges)} edges")
+
     def perform_delaunay(self):
-        """Perform Delaunay triangulation on the current vertices"""
-        if len(self.vertices) < 3:
+        """Triangulate the current vertices; later edits keep the triangulation."""
+        if len(self.mesh.vertices) < 3:
             logger.warning("Need at least 3 vertices for Delaunay triangulation")
             return
-            
-        try:
-            # Create Delaunay triangulation
-            delaunay = DelaunayTriangulation(self.vertices)
-            new_edges = delaunay.triangulate()
-            
-            # Clear existing edges and faces
-            self.edges.clear()
-            self.faces.clear()
-            
-            # Add new edges
-            self.edges.extend(new_edges)
-            
-            # Connect edges using Fast_splice
-            Fast_splice(self.edges)
-            
-            # Verify connectivity
-            if verify_connectivity(self.edges):
-                logger.info("Delaunay triangulation completed successfully")
-                self.canvas.delete("all")  # Clear canvas
-                for vertex in self.vertices:
-                    self.draw_vertex(vertex)
-                self.draw_edges()
-            else:
-                logger.error("Delaunay triangulation connectivity verification failed")
-        except Exception as e:
-            logger.error(f"Error in Delaunay triangulation: {str(e)}")
-            
+        self.mesh.triangulate()
+        logger.info(f"Delaunay triangulation has {len(self.mesh.edges)} edges")
+
     def run(self):
-        """Start the main event loop"""
+        """Start the main event loop."""
         self.root.mainloop()
 
+
 if __name__ == "__main__":
     # Configure logging
     logging.basicConfig(
         level=logging.DEBUG,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     # Create and run the main window
     app = MainWindow()
-    app.run() 
\ No newline at end of file
+    app.run()
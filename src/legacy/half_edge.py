@@ -3,10 +3,12 @@ import random
 import math
 from typing import List, Optional, Dict, Tuple
 import logging
+from collections import deque
 
 from ..utils.database import Data_base
 from .half_edge_ds import HalfEdge, Vertex, Splice, neighbours
-from ..algorithms.pathfinding import dijkstra, a_star, reconstruct_path
+from ..algorithms.pathfinding import dijkstra_arrays, a_star_arrays
+from ..core.half_edge_arrays import HalfEdgeArrays
 from ..utils.data_io import get_data
 
 logger = logging.getLogger(__name__)
@@ -96,14 +98,14 @@ def bfs(start):
     # this i a breadth-first search function
     # i use this to travel in graph and return all Vertex
     explored = []
-    queue = [start]
+    queue = deque([start])
 
     levels = {}
     levels[start] = 0
 
     explored.append(start)
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         node.V.set_visited()
         nb = neighbours(node)
 
@@ -123,9 +125,9 @@ def bfs_edges(start):
     # return 'main' edges in faces in the graph
     # i use the BFS algorithm in this function
     face = []
-    queue = [start]
+    queue = deque([start])
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         node.V.set_visited()
         nb = neighbours(node)
         for neighbour in nb:
@@ -148,18 +150,23 @@ def bfs_edges(start):
 
 def bfs_paths(start, goal):
     # return a path betwen two vertex
-
-    queue = [[start]]
+    # predecessors are stored per edge, the path is rebuilt only once at the end
+    came_from = {id(start): None}
+    queue = deque([start])
     while queue:
-        path = queue.pop(0)
-        node = path[-1]
+        node = queue.popleft()
         if node.V.visited == False:
             for ng in neighbours(node):
-                new_path = list(path)
-                new_path.append(ng)
-                queue.append(new_path)
+                if id(ng) in came_from:
+                    continue
+                came_from[id(ng)] = node
+                queue.append(ng)
                 if ng.V.Vertex_id == goal.V.Vertex_id:
-                    return new_path
+                    path = [ng]
+                    while came_from[id(path[-1])] is not None:
+                        path.append(came_from[id(path[-1])])
+                    path.reverse()
+                    return path
             node.V.set_visited()
     return "nie ma drogi"
 
@@ -167,12 +174,8 @@ def bfs_paths(start, goal):
 
 def reading_base():
     base=Data_base()
-    base.creating_table()
-    for i in V:
-        base.add_vertex(i.getxy()[0],i.getxy()[1])
+    base.save_arrays(HalfEdgeArrays.from_half_edges(edges, V))
     turtle.done()
-    for i in edges:
-        base.adding_edge(i.V.Vertex_id,i.Sym().V.Vertex_id)
 
     base.read_data()
     return V, edges
@@ -188,19 +191,16 @@ def drawing(V):
         turtle.color("red")
         turtle.write(i.distance)
         turtle.color("black")
-def draw_path(x):
-    temp=[]
-    for i in x:
-        for j in V:
-            if j.Vertex_id==i:
-                temp.append(j)
-    for z in range(len(temp)-1):
+def draw_path(path):
+    # path is a PathResult, its points are already in path order
+    points = path.points.tolist()
+    for z in range(len(points)-1):
         turtle.penup()
-        turtle.goto(temp[z].getxy())
+        turtle.goto(points[z])
         turtle.pendown()
         turtle.pensize(5)
         turtle.color("orange")
-        turtle.goto(temp[z+1].getxy())
+        turtle.goto(points[z+1])
 
 
 if __name__ == '__main__':
@@ -211,15 +211,17 @@ if __name__ == '__main__':
 
 
     remove_visited(V)
-    path_d = reconstruct_path(dijkstra(edges[0].Sym(), edges[5]), edges[0].Sym().V.Vertex_id, edges[5].V.Vertex_id)
-    remove_visited(V)
-    path_a = reconstruct_path(a_star( edges[0].Sym(), edges[5]), edges[0].Sym().V.Vertex_id, edges[5].V.Vertex_id)
+    mesh = HalfEdgeArrays.from_half_edges(edges, V)
+    index = mesh.vertex_index()
+    source, goal = index[edges[0].Sym().V.Vertex_id], index[edges[5].V.Vertex_id]
+    path_d = dijkstra_arrays(mesh, source, goal).path_to(goal)
+    path_a = a_star_arrays(mesh, source, goal).path_to(goal)
 
     print (edges[0].Sym().V.Vertex_id)
     print(edges[5].V.Vertex_id)
-    print("Droga algorymem Dijkstry:", path_d)
+    print("Droga algorymem Dijkstry:", mesh.vertex_ids[path_d.vertices])
 
-    print("Droga algorymem A*:" ,path_a)
+    print("Droga algorymem A*:" ,mesh.vertex_ids[path_a.vertices])
 
     turtle.tracer(0)
     for i in edges:
@@ -1,7 +1,12 @@
 """
 Utility functions for Half-Edge data structures.
 """
-from .data_io import get_data
-from .database import Data_base
+from .data_io import get_data, parse_obj, read_obj
+from .database import Data_base, Region
+from .db_pool import ConnectionPool
+from .mesh_codec import load_compressed, save_compressed
+from .mesh_export import export_mesh, write_obj, write_ply, write_stl
+from .mesh_file import open_mesh, save_mesh
 
-__all__ = ['get_data', 'Data_base']
+__all__ = ['get_data', 'parse_obj', 'read_obj', 'Data_base', 'Region', 'ConnectionPool', 'open_mesh', 'save_mesh',
+           'export_mesh', 'write_obj', 'write_ply', 'write_stl', 'load_compressed', 'save_compressed']
@@ -1,73 +1,358 @@
 """
 Data input/output operations for Half-Edge data structures.
 """
-from typing import List, Tuple, Dict
+import logging
+import multiprocessing
+import os
+import re
+import warnings
+from itertools import compress
+from typing import BinaryIO, Iterator, List, Tuple, Union
+
+import numpy as np
+
 from ..core.half_edge_ds import HalfEdge, Vertex
+from ..core.half_edge_arrays import HalfEdgeArrays, INDEX_DTYPE, COORD_DTYPE
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 24  # bytes of text parsed at once
+
+_TEXTURE_NORMAL = re.compile(rb'/\S*')
+
+
+class _GrowableArray:
+    """Preallocated array that doubles its capacity when full."""
+
+    def __init__(self, dtype, width: int = 0, capacity: int = 1 << 16):
+        self._shape_tail = (width,) if width else ()
+        self._data = np.empty((capacity,) + self._shape_tail, dtype=dtype)
+        self._size = 0
+
+    def extend(self, values: np.ndarray) -> None:
+        n = len(values)
+        if self._size + n > len(self._data):
+            capacity = max(2 * len(self._data), self._size + n)
+            grown = np.empty((capacity,) + self._shape_tail, dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:self._size + n] = values
+        self._size += n
+
+    def __len__(self) -> int:
+        return self._size
+
+    def array(self) -> np.ndarray:
+        """Trimmed copy of the filled part."""
+        return self._data[:self._size].copy()
+
+
+def _iter_line_chunks(f: BinaryIO, chunk_size: int, limit: int = -1) -> Iterator[bytes]:
+    """Read ``f`` in large blocks and yield each block's complete lines.
+
+    Reading stops after ``limit`` bytes when it is not negative.
+    """
+    tail = b''
+    while limit:
+        block = f.read(chunk_size if limit < 0 else min(chunk_size, limit))
+        if not block:
+            break
+        if limit > 0:
+            limit -= len(block)
+        block = tail + block
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            tail = block
+            continue
+        tail = block[cut:]
+        yield block[:cut]
+    if tail:
+        yield tail
+
+
+def _line_kinds(block: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Masks of the ``v`` and ``f`` records among ``block.split(b'\\n')``."""
+    # Two bytes of padding keep the prefix lookups of a trailing empty line in range
+    data = np.frombuffer(block + b'\n\n', dtype=np.uint8)
+    starts = np.r_[0, np.flatnonzero(data[:len(block)] == ord('\n')) + 1]
+    first, second = data[starts], data[starts + 1]
+    separated = (second == ord(' ')) | (second == ord('\t'))
+    return (first == ord('v')) & separated, (first == ord('f')) & separated
+
+
+def _fromstring(text: bytes, dtype) -> Union[np.ndarray, None]:
+    """Vectorized whitespace-separated parse; None if any token is malformed."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            return np.fromstring(text, dtype=dtype, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+
+
+def _token_counts(text: bytes) -> np.ndarray:
+    """Whitespace-separated tokens on each line of ``text``."""
+    data = np.frombuffer(text, dtype=np.uint8)
+    # Control bytes count as blanks; np.fromstring rejects any but whitespace
+    blank = data <= ord(' ')
+    starts = np.flatnonzero(blank[:-1] & ~blank[1:]) + 1
+    if len(data) and not blank[0]:
+        starts = np.r_[0, starts]
+    ends = np.r_[np.flatnonzero(data == ord('\n')), len(data)]
+    return np.diff(np.searchsorted(starts, ends), prepend=0).astype(INDEX_DTYPE)
+
+
+def _parse_vertices(records: List[bytes]) -> Tuple[np.ndarray, int]:
+    """Parse the bodies of ``v`` records into (n, 2) coordinates.
+
+    Besides the standard ``v x y [z]`` form, the compact ``v x.y`` form used
+    by the sample data (``v 1.55`` means x=1, y=55) is accepted.
+    """
+    text = b'\n'.join(records)
+    compact = len(records[0].split()) == 1
+    if compact:
+        text = text.replace(b'.', b' ')
+    values = _fromstring(text, COORD_DTYPE)
+    if values is not None and values.size:
+        # Every record must have its own x and y; the widths may differ
+        sizes = _token_counts(text)
+        if values.size == sizes.sum() and sizes.min() >= 2 and not (compact and sizes.max() > 2):
+            first = np.r_[0, np.cumsum(sizes[:-1])]
+            return np.column_stack([values[first], values[first + 1]]), 0
+
+    # Mixed widths or malformed records: parse one by one
+    coords, errors = [], 0
+    for record in records:
+        parts = record.split()
+        if len(parts) == 1:
+            parts = parts[0].split(b'.')
+        try:
+            coords.append((float(parts[0]), float(parts[1])))
+        except (ValueError, IndexError):
+            errors += 1
+    return np.array(coords, dtype=COORD_DTYPE).reshape(-1, 2), errors
+
+
+def _parse_faces(records: List[bytes]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse the bodies of ``f`` records into flat indices and face sizes.
+
+    Returns:
+        Tuple of (flat indices, face sizes, positions in ``records`` of the
+        faces kept)
+    """
+    text = b'\n'.join(records)
+    if b'/' in text:
+        text = _TEXTURE_NORMAL.sub(b'', text)
+    indices = _fromstring(text, np.int64)
+    if indices is not None:
+        sizes = _token_counts(text)
+        if indices.size == sizes.sum() and sizes.min() >= 3:
+            return indices, sizes, np.arange(len(records))
+
+    faces, sizes, kept = [], [], []
+    for i, record in enumerate(records):
+        try:
+            face = [int(p.split(b'/')[0]) for p in record.split()]
+        except ValueError:
+            continue
+        if len(face) < 3:
+            continue
+        faces.extend(face)
+        sizes.append(len(face))
+        kept.append(i)
+    return np.array(faces, dtype=np.int64), np.array(sizes, dtype=INDEX_DTYPE), np.array(kept, dtype=np.int64)
+
+
+def _line_ranges(filename: str, parts: int) -> List[Tuple[int, int]]:
+    """Split a file into up to ``parts`` byte ranges starting at line starts."""
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, 'rb') as f:
+        for k in range(1, parts):
+            # The line holding the byte before the cut ends the range
+            f.seek(max(size * k // parts - 1, bounds[-1]))
+            f.readline()
+            if bounds[-1] < f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _parse_range(task: Tuple[str, int, int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Parse the records in one byte range of an OBJ file.
+
+    Negative face indices are resolved against the vertices of the range
+    read so far; their positions are returned so the caller can shift them
+    by the vertices of the preceding ranges.
+
+    Args:
+        task: (filename, start, stop, chunk_size)
+
+    Returns:
+        Tuple of (coords, 0-based face indices, face sizes, positions of
+        relative indices, malformed record count)
+    """
+    filename, start, stop, chunk_size = task
+    coords = _GrowableArray(COORD_DTYPE, width=2)
+    face_vertices = _GrowableArray(np.int64)
+    face_sizes = _GrowableArray(INDEX_DTYPE)
+    relative = _GrowableArray(np.int64, capacity=16)
+    errors = 0
+
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        for block in _iter_line_chunks(f, chunk_size, stop - start):
+            lines = block.split(b'\n')
+            is_vertex, is_face = _line_kinds(block)
+            # Vertices read before every face record (OBJ indices are
+            # 1-based, negative ones count back from the last vertex read)
+            vertices_before = len(coords) + np.cumsum(is_vertex)[is_face]
+            if is_vertex.any():
+                parsed, bad = _parse_vertices([line[2:] for line in compress(lines, is_vertex)])
+                coords.extend(parsed)
+                errors += bad
+            if is_face.any():
+                f_records = [line[2:] for line in compress(lines, is_face)]
+                indices, sizes, kept = _parse_faces(f_records)
+                errors += len(f_records) - len(kept)
+                negative = indices < 0
+                if negative.any():
+                    relative.extend(len(face_vertices) + np.flatnonzero(negative))
+                    base = np.repeat(vertices_before[kept], sizes)
+                    indices = np.where(negative, base + indices, indices - 1)
+                else:
+                    indices = indices - 1
+                face_vertices.extend(indices)
+                face_sizes.extend(sizes)
+    return coords.array(), face_vertices.array(), face_sizes.array(), relative.array(), errors
+
+
+def parse_obj(filename: str, chunk_size: int = CHUNK_SIZE,
+              processes: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stream vertex and face records of an OBJ file into arrays.
+
+    The file is read in ``chunk_size`` blocks; each block is parsed with
+    vectorized NumPy conversions, so memory stays bounded by the block size
+    plus the output arrays.  With several processes the file is split at
+    line boundaries into one byte range per process, the ranges are parsed
+    in a process pool and the results are concatenated in file order.
+
+    Args:
+        filename: Path to the input file
+        chunk_size: Bytes read per block
+        processes: Number of worker processes (None: CPU count)
+
+    Returns:
+        Tuple containing:
+        - (n_vertices, 2) vertex coordinates
+        - Flat 0-based vertex indices of all faces
+        - Number of vertices of every face
+    """
+    processes = processes or os.cpu_count() or 1
+    ranges = _line_ranges(filename, processes) if processes > 1 else [(0, os.path.getsize(filename))]
+    tasks = [(filename, start, stop, chunk_size) for start, stop in ranges]
+    if len(tasks) > 1:
+        with multiprocessing.get_context().Pool(min(processes, len(tasks))) as pool:
+            results = pool.map(_parse_range, tasks)
+    else:
+        results = [_parse_range(task) for task in tasks]
+
+    # Shift every range's vertex indices by the vertices of the ranges before it
+    vertex_offset = 0
+    errors = 0
+    all_faces = []
+    for coords, face_vertices, face_sizes, relative, bad in results:
+        face_vertices[relative] += vertex_offset
+        vertex_offset += len(coords)
+        all_faces.append(face_vertices)
+        errors += bad
+    if len(results) == 1:
+        coords, face_vertices, face_sizes = results[0][:3]
+    else:
+        coords = np.concatenate([r[0] for r in results])
+        face_vertices = np.concatenate(all_faces)
+        face_sizes = np.concatenate([r[2] for r in results])
+
+    if errors:
+        logger.warning(f"[parse_obj] Skipped {errors} malformed records in {filename}")
+    logger.debug(f"[parse_obj] Parsed {len(ranges)} ranges of {filename}")
+    return coords, face_vertices, face_sizes
+
+
+def faces_to_edges(face_vertices: np.ndarray, face_sizes: np.ndarray, n_vertices: int) -> np.ndarray:
+    """
+    Unique undirected edges of a polygon soup.
+
+    The two sides of an edge shared by neighbouring faces are matched through
+    the integer key ``min * n_vertices + max`` of their vertex pair.
+
+    Args:
+        face_vertices: Flat vertex indices of all faces
+        face_sizes: Number of vertices of every face
+        n_vertices: Number of vertices
+
+    Returns:
+        (n_edges, 2) vertex index pairs, each edge once
+    """
+    ends = np.cumsum(face_sizes)
+    starts = ends - face_sizes
+    successor = np.arange(1, len(face_vertices) + 1)
+    successor[ends - 1] = starts
+    a = face_vertices
+    b = face_vertices[successor]
+
+    valid = (a != b) & (a >= 0) & (b >= 0) & (a < n_vertices) & (b < n_vertices)
+    if not valid.all():
+        logger.warning(f"[faces_to_edges] Ignored {int((~valid).sum())} invalid face sides")
+    lo = np.minimum(a[valid], b[valid]).astype(np.int64)
+    hi = np.maximum(a[valid], b[valid]).astype(np.int64)
+    # Sorting the integer keys groups both sides of every shared edge
+    keys = np.sort(lo * n_vertices + hi)
+    if len(keys):
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    return np.column_stack([keys // n_vertices, keys % n_vertices])
+
+
+def read_obj(filename: str, chunk_size: int = CHUNK_SIZE, processes: int = 1) -> HalfEdgeArrays:
+    """
+    Read an OBJ file into a fully linked half-edge mesh.
+
+    Args:
+        filename: Path to the input file
+        chunk_size: Bytes read per block
+        processes: Number of parsing processes, see ``parse_obj``
+
+    Returns:
+        HalfEdgeArrays with twin and next pointers set
+    """
+    coords, face_vertices, face_sizes = parse_obj(filename, chunk_size, processes)
+    edges = faces_to_edges(face_vertices, face_sizes, len(coords))
+    logger.debug(f"[read_obj] {len(coords)} vertices, {len(face_sizes)} faces, {len(edges)} edges")
+    return HalfEdgeArrays.from_edge_list(coords, edges)
+
 
 def get_data(filename: str) -> Tuple[List[HalfEdge], List[Vertex]]:
     """
     Read data from a file and create a Half-Edge data structure.
-    
+
     Args:
         filename: Path to the input file
-        
+
     Returns:
         Tuple containing:
-        - List of HalfEdge objects
+        - List of HalfEdge objects (one per edge, linked with twins and Next)
         - List of Vertex objects
     """
-    vertices: List[Vertex] = []
-    edges: List[HalfEdge] = []
-    vertex_map: Dict[int, Vertex] = {}
-    
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                    
-                parts = line.split()
-                if not parts:
-                    continue
-                    
-                if parts[0] == 'v':  # Vertex
-                    try:
-                        # Format: v x y where x and y are floats
-                        # Example: v 1.55 70 means x=1.55, y=70
-                        x = float(parts[1])
-                        y = float(parts[2])
-                        
-                        vertex = Vertex(x, y, 0.0)  # z-coordinate is 0
-                        vertex_map[len(vertices)] = vertex
-                        vertices.append(vertex)
-                    except (ValueError, IndexError) as e:
-                        print(f"Error parsing vertex: {line}")
-                        print(f"Error details: {str(e)}")
-                        continue
-                        
-                elif parts[0] == 'f':  # Face
-                    try:
-                        # Format: f v1 v2 v3 ...
-                        # Convert to 0-based indexing
-                        vertex_indices = [int(v) - 1 for v in parts[1:]]
-                        
-                        # Create edges for the face
-                        for i in range(len(vertex_indices)):
-                            v1 = vertex_map[vertex_indices[i]]
-                            v2 = vertex_map[vertex_indices[(i + 1) % len(vertex_indices)]]
-                            edge = HalfEdge(v1, v2)
-                            edges.append(edge)
-                    except (ValueError, IndexError, KeyError) as e:
-                        print(f"Error parsing face: {line}")
-                        print(f"Error details: {str(e)}")
-                        continue
-                        
+        arrays = read_obj(filename)
     except FileNotFoundError:
-        print(f"Error: File {filename} not found")
+        logger.error(f"Error: File {filename} not found")
         return [], []
-    except Exception as e:
-        print(f"Error reading file: {str(e)}")
+    except OSError as e:
+        logger.error(f"Error reading file: {str(e)}")
         return [], []
-        
-    return edges, vertices 
\ No newline at end of file
+
+    vertices, edges = arrays.to_half_edges()
+    return edges, vertices
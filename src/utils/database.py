@@ -1,49 +1,382 @@
+import dataclasses
+import logging
 import sqlite3
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays, INDEX_DTYPE, COORD_DTYPE
+
+logger = logging.getLogger(__name__)
+
+# Applied to every connection: WAL lets readers run next to the single
+# writer, and NORMAL sync is safe in WAL mode while avoiding a fsync per commit
+PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA foreign_keys=OFF',
+)
+
+# Prepared statements kept per connection; every query here is a constant
+# string, so repeated calls reuse the compiled statement
+STATEMENT_CACHE_SIZE = 256
+
+# R*Tree indexes over vertex points and edge bounding boxes
+SPATIAL_INDEX = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS VERTEX_RTREE USING rtree(id, min_x, max_x, min_y, max_y)',
+    'CREATE VIRTUAL TABLE IF NOT EXISTS EDGE_RTREE USING rtree(id, min_x, max_x, min_y, max_y)',
+)
+
+# Bounding box columns of the EDGES rows joined with their two vertices
+_EDGE_BOX = 'min(A.x, B.x), max(A.x, B.x), min(A.y, B.y), max(A.y, B.y)'
+
+# Triggers keeping the indexes in sync with single-row changes to VERTEX/EDGES
+SPATIAL_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS VERTEX_RTREE_INSERT AFTER INSERT ON VERTEX BEGIN
+        INSERT INTO VERTEX_RTREE VALUES (new.id, new.x, new.x, new.y, new.y);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS VERTEX_RTREE_DELETE AFTER DELETE ON VERTEX BEGIN
+        DELETE FROM VERTEX_RTREE WHERE id = old.id;
+    END""",
+    # The edges of a moved vertex are found through the index: their boxes
+    # contain its old position
+    f"""CREATE TRIGGER IF NOT EXISTS VERTEX_RTREE_UPDATE AFTER UPDATE OF x, y ON VERTEX BEGIN
+        UPDATE VERTEX_RTREE SET min_x = new.x, max_x = new.x, min_y = new.y, max_y = new.y
+        WHERE id = new.id;
+        UPDATE EDGE_RTREE SET (min_x, max_x, min_y, max_y) = (
+            SELECT {_EDGE_BOX} FROM EDGES AS E, VERTEX AS A, VERTEX AS B
+            WHERE E.id = EDGE_RTREE.id AND A.id = E.V1 AND B.id = E.V2)
+        WHERE min_x <= old.x AND max_x >= old.x AND min_y <= old.y AND max_y >= old.y
+          AND EXISTS (SELECT 1 FROM EDGES AS E
+                      WHERE E.id = EDGE_RTREE.id AND (E.V1 = new.id OR E.V2 = new.id));
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS EDGE_RTREE_INSERT AFTER INSERT ON EDGES BEGIN
+        INSERT INTO EDGE_RTREE
+        SELECT new.id, {_EDGE_BOX}
+        FROM VERTEX AS A, VERTEX AS B WHERE A.id = new.V1 AND B.id = new.V2;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS EDGE_RTREE_DELETE AFTER DELETE ON EDGES BEGIN
+        DELETE FROM EDGE_RTREE WHERE id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS EDGE_RTREE_UPDATE AFTER UPDATE OF V1, V2 ON EDGES BEGIN
+        DELETE FROM EDGE_RTREE WHERE id = old.id;
+        INSERT INTO EDGE_RTREE
+        SELECT new.id, {_EDGE_BOX}
+        FROM VERTEX AS A, VERTEX AS B WHERE A.id = new.V1 AND B.id = new.V2;
+    END""",
+)
+
+# Fill the indexes of whole tables in one pass (see save_arrays)
+SPATIAL_FILL = (
+    'INSERT INTO VERTEX_RTREE SELECT id, x, x, y, y FROM VERTEX',
+    f"""INSERT INTO EDGE_RTREE
+        SELECT E.id, {_EDGE_BOX}
+        FROM EDGES AS E JOIN VERTEX AS A ON A.id = E.V1 JOIN VERTEX AS B ON B.id = E.V2""",
+)
+
+BBox = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class Region:
+    """Part of a stored mesh returned by ``Data_base.load_region``.
+
+    Attributes:
+        arrays: Sub-mesh of the vertices in the box and the edges crossing it
+        boundary: (n_half_edges,) True where the edge leaves the box
+        bbox: (min_x, min_y, max_x, max_y) that was queried
+    """
+    arrays: HalfEdgeArrays
+    boundary: np.ndarray
+    bbox: BBox
+
 
 class Data_base(object):
+    """SQLite storage of vertices, edges and half-edge topology.
+
+    Single rows can still be added with ``add_vertex``/``adding_edge``; whole
+    meshes are written with ``save_arrays`` and read back with
+    ``load_arrays`` in one transaction each.  R*Tree indexes let
+    ``load_region`` read only the rows around a box.
+    """
+
     # utworzenie połączenia z bazą przechowywaną na dysku
-    def __init__(self):
+    def __init__(self, path: str = 'test.db', connection: Optional[sqlite3.Connection] = None):
+        """
+        Open (or create) a database.
 
-        self.con = sqlite3.connect('test.db')
+        Args:
+            path: Database file, or ':memory:'
+            connection: Existing connection to use instead of opening one
+                (see ``ConnectionPool``); PRAGMAS are then left to its owner
+        """
+        self.path = path
+        if connection is None:
+            connection = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in PRAGMAS:
+                connection.execute(pragma)
+        self.con = connection
         # dostęp do kolumn przez indeksy i przez nazwy
         self.con.row_factory = sqlite3.Row
         self.cur = self.con.cursor()
-    def creating_table(self):
-        self.cur.executescript("""
-            DROP TABLE IF EXISTS VERTEX;
+
+    def creating_table(self, reset: bool = False, triggers: bool = True):
+        """
+        Create the tables if they do not exist.
+
+        Every EDGES row is one edge: the half-edge ``id`` (V1 -> V2) and its
+        twin ``sym_id`` (V2 -> V1), with their Next half-edges, faces and
+        weights.  Edges added with ``adding_edge`` leave the topology NULL.
+
+        Args:
+            reset: Drop existing tables (and their data) first
+            triggers: Also create the triggers maintaining the R*Tree
+                indexes; ``save_arrays`` adds them after its bulk insert
+        """
+        # Statements run one by one: executescript would commit an open
+        # transaction (see save_arrays)
+        if reset:
+            for table in ('EDGE_RTREE', 'VERTEX_RTREE', 'EDGES', 'VERTEX'):
+                self.cur.execute(f'DROP TABLE IF EXISTS {table}')
+        self.cur.execute("""
             CREATE TABLE IF NOT EXISTS VERTEX (
                 id INTEGER PRIMARY KEY ASC,
-                x  INTEGER NOT NULL,
-                y  INTEGER NOT NULL
-                ) """ )
-
-        self.cur.executescript("""
-            DROP TABLE IF EXISTS EDGES;
+                x  REAL NOT NULL,
+                y  REAL NOT NULL
+                )""")
+        self.cur.execute("""
             CREATE TABLE IF NOT EXISTS EDGES (
-                id INTEGER PRIMARY KEY ASC,
-                V1 INTEGER NOT NULL,
-                V2 INTEGER NOT NULL
+                id         INTEGER PRIMARY KEY ASC,
+                V1         INTEGER NOT NULL REFERENCES VERTEX(id),
+                V2         INTEGER NOT NULL REFERENCES VERTEX(id),
+                sym_id     INTEGER,
+                next       INTEGER,
+                sym_next   INTEGER,
+                face       INTEGER,
+                sym_face   INTEGER,
+                weight     REAL,
+                sym_weight REAL
                 )""")
-    def add_vertex(self,x,y):
+        for statement in SPATIAL_INDEX:
+            self.cur.execute(statement)
+        if triggers:
+            for statement in SPATIAL_TRIGGERS:
+                self.cur.execute(statement)
+
+    def add_vertex(self, x, y):
         # wstawiamy jeden rekord danych
-        self.cur.execute('INSERT INTO VERTEX VALUES(NULL, ?, ?);', (x,y))
+        self.cur.execute('INSERT INTO VERTEX VALUES(NULL, ?, ?);', (x, y))
         self.con.commit()
+        return self.cur.lastrowid
 
-        # wykonuje zapytanie SQL, które pobierze id klasy "1A" z tabeli "klasa".
-
-    def adding_edge(self,V1,V2):
-        # wstawiam wiele rekordów
-        self.cur.execute('INSERT INTO EDGES VALUES(NULL, ?, ?);', (V1, V2))
-        self.con.commit()
+    def adding_edge(self, V1, V2):
+        self.cur.execute('INSERT INTO EDGES (id, V1, V2) VALUES(NULL, ?, ?);', (V1, V2))
         # zatwierdzamy zmiany w bazie
+        self.con.commit()
+        return self.cur.lastrowid
+
+    def add_vertices(self, rows: Iterable[Tuple[int, float, float]]) -> None:
+        """Insert (id, x, y) rows in one transaction."""
+        with self.con:
+            self.con.executemany('INSERT INTO VERTEX VALUES(?, ?, ?);', rows)
+
+    def add_edges(self, rows: Iterable[Tuple[int, int, int]]) -> None:
+        """Insert (id, V1, V2) rows in one transaction; ids may be None."""
+        with self.con:
+            self.con.executemany('INSERT INTO EDGES (id, V1, V2) VALUES(?, ?, ?);', rows)
+
     def read_data(self):
         """Funkcja pobiera i wyświetla dane z bazy."""
         self.cur.execute(
             """
-            SELECT EDGES.id,V1,V2 FROM EDGES,VERTEX
-            WHERE EDGES.id=VERTEX.id
+            SELECT EDGES.id, V1, V2 FROM EDGES
+            JOIN VERTEX AS A ON A.id = EDGES.V1
+            JOIN VERTEX AS B ON B.id = EDGES.V2
+            ORDER BY EDGES.id
             """)
         edges = self.cur.fetchall()
         for e in edges:
             print(e['id'], e['V1'], e['V2'])
-        return edges
\ No newline at end of file
+        return edges
+
+    def save_arrays(self, arrays: HalfEdgeArrays) -> None:
+        """
+        Replace the stored mesh with a half-edge snapshot.
+
+        Vertices and half-edges keep their ``Vertex_id``/``HalfEdge.id``.
+        Both tables are rewritten with ``executemany`` inside one
+        transaction, one row per vertex and one per edge.  The R*Tree
+        indexes are filled afterwards by one ``INSERT ... SELECT`` each,
+        which is several times faster than a trigger firing per row.
+
+        Args:
+            arrays: Mesh snapshot
+        """
+        vids = arrays.vertex_ids
+        eids = arrays.edge_ids
+        h = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+        s = arrays.twin[h]
+        weight = arrays.weight.astype(object)
+        weight[np.isnan(arrays.weight)] = None
+        faces = arrays.face_ids
+
+        with self.con:
+            # Explicit BEGIN so the table rewrite is part of the transaction
+            self.con.execute('BEGIN')
+            self.creating_table(reset=True, triggers=False)
+            self.con.executemany(
+                'INSERT INTO VERTEX VALUES(?, ?, ?);',
+                zip(vids.tolist(), arrays.coords[:, 0].tolist(), arrays.coords[:, 1].tolist()))
+            self.con.executemany(
+                'INSERT INTO EDGES VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?);',
+                zip(eids[h].tolist(), vids[arrays.origin[h]].tolist(), vids[arrays.origin[s]].tolist(),
+                    eids[s].tolist(), eids[arrays.next[h]].tolist(), eids[arrays.next[s]].tolist(),
+                    faces[h].tolist(), faces[s].tolist(), weight[h].tolist(), weight[s].tolist()))
+            for statement in SPATIAL_FILL + SPATIAL_TRIGGERS:
+                self.con.execute(statement)
+        logger.debug(f"[Data_base] Saved {arrays.n_vertices} vertices and "
+                     f"{len(h)} edges to {self.path}")
+
+    def load_arrays(self) -> HalfEdgeArrays:
+        """
+        Load a mesh written by ``save_arrays`` as a half-edge snapshot.
+
+        Returns:
+            HalfEdgeArrays in which edge ``i`` is half-edges ``2 * i`` and
+            ``2 * i + 1``
+
+        Raises:
+            ValueError: If some edges were stored without topology
+        """
+        vid, x, y = self._fetch_columns('SELECT id, x, y FROM VERTEX ORDER BY id', 3)
+        (eid, v1, v2, sym_id, nxt, sym_next,
+         face, sym_face, weight, sym_weight) = self._fetch_columns('SELECT * FROM EDGES ORDER BY id', 10)
+        if np.isnan(sym_id).any():
+            raise ValueError("EDGES contains edges without half-edge topology")
+
+        def interleave(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            return np.column_stack([a, b]).reshape(-1)
+
+        vertex_ids = vid.astype(np.int64)
+        edge_ids = interleave(eid, sym_id).astype(np.int64)
+        order = np.argsort(edge_ids)
+
+        def half_edge_index(ids: np.ndarray) -> np.ndarray:
+            return order[np.searchsorted(edge_ids, ids.astype(np.int64), sorter=order)]
+
+        arrays = HalfEdgeArrays(
+            coords=np.column_stack([x, y]).astype(COORD_DTYPE),
+            origin=np.searchsorted(vertex_ids, interleave(v1, v2).astype(np.int64)).astype(INDEX_DTYPE),
+            twin=np.arange(len(edge_ids), dtype=INDEX_DTYPE) ^ 1,
+            next=half_edge_index(interleave(nxt, sym_next)).astype(INDEX_DTYPE),
+            weight=interleave(weight, sym_weight).astype(COORD_DTYPE),
+            vertex_ids=vertex_ids,
+            edge_ids=edge_ids,
+        )
+        vars(arrays)['face_ids'] = interleave(face, sym_face).astype(INDEX_DTYPE)
+        logger.debug(f"[Data_base] Loaded {arrays.n_vertices} vertices and "
+                     f"{len(eid)} edges from {self.path}")
+        return arrays
+
+    def load_region(self, bbox: BBox) -> Region:
+        """
+        Load the part of the stored mesh inside a box.
+
+        Only the R*Tree entries overlapping the box and the rows they point
+        to are read.  The result holds every vertex inside the box and every
+        edge crossing it; edges leaving the box keep their outside end point
+        and are flagged in ``Region.boundary``.  Rings around the vertices
+        are ordered by ``Azymut`` like ``HalfEdgeBuilder`` orders them.
+
+        Args:
+            bbox: (min_x, min_y, max_x, max_y)
+
+        Returns:
+            Region with the sub-mesh; ids are the stored ones
+        """
+        min_x, min_y, max_x, max_y = map(float, bbox)
+        box = {'min_x': min_x, 'min_y': min_y, 'max_x': max_x, 'max_y': max_y}
+        overlap = 'R.min_x <= :max_x AND R.max_x >= :min_x AND R.min_y <= :max_y AND R.max_y >= :min_y'
+        (eid, v1, v2, sym_id, weight, sym_weight) = self._fetch_columns(f"""
+            SELECT E.id, E.V1, E.V2, E.sym_id, E.weight, E.sym_weight
+            FROM EDGE_RTREE AS R JOIN EDGES AS E ON E.id = R.id
+            WHERE {overlap} ORDER BY E.id""", 6, box)
+        vid, x, y = self._fetch_columns(f"""
+            SELECT V.id, V.x, V.y FROM VERTEX AS V WHERE V.id IN (
+                SELECT R.id FROM VERTEX_RTREE AS R WHERE {overlap}
+                UNION SELECT E.V1 FROM EDGE_RTREE AS R JOIN EDGES AS E ON E.id = R.id WHERE {overlap}
+                UNION SELECT E.V2 FROM EDGE_RTREE AS R JOIN EDGES AS E ON E.id = R.id WHERE {overlap})
+            ORDER BY V.id""", 3, box)
+        vertex_ids = vid.astype(np.int64)
+        coords = np.column_stack([x, y]).astype(COORD_DTYPE)
+        edges = np.searchsorted(vertex_ids, np.column_stack([v1, v2]).astype(np.int64))
+
+        # The index stores boxes in single precision and an edge's box may
+        # overlap the query without the segment doing so: test exactly
+        inside = ((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x)
+                  & (coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
+        keep = _segments_cross_box(coords[edges[:, 0]], coords[edges[:, 1]], box)
+        edges = edges[keep]
+        used = inside.copy()
+        used[edges.reshape(-1)] = True
+        new_index = np.cumsum(used) - 1
+        edges = new_index[edges]
+
+        arrays = HalfEdgeArrays.from_edge_list(coords[used], edges, vertex_ids=vertex_ids[used])
+
+        def interleave(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            return np.column_stack([a[keep], b[keep]]).reshape(-1)
+
+        arrays = dataclasses.replace(
+            arrays,
+            weight=interleave(weight, sym_weight).astype(COORD_DTYPE),
+            edge_ids=interleave(eid, sym_id).astype(np.int64),
+        )
+        boundary = np.repeat(~(inside[used][edges[:, 0]] & inside[used][edges[:, 1]]), 2)
+        logger.debug(f"[Data_base] Region {bbox}: {arrays.n_vertices} vertices, "
+                     f"{len(edges)} edges, {int(boundary.sum()) // 2} on the boundary")
+        return Region(arrays=arrays, boundary=boundary, bbox=(min_x, min_y, max_x, max_y))
+
+    def _fetch_columns(self, query: str, n_columns: int, params=()) -> List[np.ndarray]:
+        """Run a query and return its result as one array per column."""
+        cur = self.con.cursor()
+        cur.row_factory = None
+        rows = cur.execute(query, params).fetchall()
+        if not rows:
+            return [np.empty(0) for _ in range(n_columns)]
+        # None (NULL weight) becomes NaN in the float conversion
+        table = np.array(rows, dtype=float)
+        return [table[:, i] for i in range(n_columns)]
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.con.close()
+
+    def __enter__(self) -> 'Data_base':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _segments_cross_box(a: np.ndarray, b: np.ndarray, box: dict) -> np.ndarray:
+    """Vectorized Liang-Barsky test: does segment a-b touch the box?"""
+    d = b - a
+    t0 = np.zeros(len(a))
+    t1 = np.ones(len(a))
+    ok = np.ones(len(a), dtype=bool)
+    for axis, lo, hi in ((0, box['min_x'], box['max_x']), (1, box['min_y'], box['max_y'])):
+        p = d[:, axis]
+        parallel = p == 0
+        ok &= ~(parallel & ((a[:, axis] < lo) | (a[:, axis] > hi)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ta = (lo - a[:, axis]) / p
+            tb = (hi - a[:, axis]) / p
+        enter = np.where(parallel, 0.0, np.minimum(ta, tb))
+        leave = np.where(parallel, 1.0, np.maximum(ta, tb))
+        t0 = np.maximum(t0, enter)
+        t1 = np.minimum(t1, leave)
+    return ok & (t0 <= t1)
@@ -0,0 +1,264 @@
+"""
+Thread-safe access to a ``Data_base`` file.
+
+SQLite connections must not be shared between threads, and a single shared
+connection serializes every query.  ``ConnectionPool`` gives each reader
+thread its own read-only connection (WAL mode lets them run while a write is
+in progress) and funnels all writes through one writer thread, which
+batches queued statements into a single transaction.
+"""
+import logging
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, List, Sequence
+
+from .database import Data_base, STATEMENT_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Pragmas of the read-only connections (journal_mode is set by the writer)
+READER_PRAGMAS = (
+    'PRAGMA query_only=ON',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-16384',
+)
+
+_STOP = object()
+
+
+class _Statement:
+    """Queued ``executemany`` of one statement."""
+
+    def __init__(self, sql: str, rows: Sequence[Sequence[Any]]):
+        self.sql = sql
+        self.rows = rows
+        self.future: Future = Future()
+
+
+class _Task:
+    """Queued callable that gets the writer's ``Data_base`` to itself."""
+
+    def __init__(self, fn: Callable[[Data_base], Any]):
+        self.fn = fn
+        self.future: Future = Future()
+
+
+class ConnectionPool:
+    """Per-thread read-only connections and a single batching writer.
+
+    Example:
+        >>> with ConnectionPool('mesh.db') as pool:
+        ...     pool.submit(lambda db: db.save_arrays(arrays)).result()
+        ...     region = pool.reader().load_region((0, 0, 100, 100))
+    """
+
+    def __init__(self, path: str, batch_size: int = 1024):
+        """
+        Open the pool; the writer creates the tables if needed.
+
+        Args:
+            path: Database file (':memory:' cannot be shared between connections)
+            batch_size: Most queued statements committed in one transaction
+
+        Raises:
+            ValueError: If ``path`` is an in-memory database
+        """
+        if path == ':memory:':
+            raise ValueError("ConnectionPool needs a database file")
+        self.path = path
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        # Guards _closed, so nothing is queued after the writer drained the queue
+        self._state_lock = threading.Lock()
+        self._closed = False
+        ready: Future = Future()
+        self._writer = threading.Thread(target=self._run_writer, args=(ready,),
+                                        name='Data_base-writer', daemon=True)
+        self._writer.start()
+        ready.result()
+
+    def reader(self) -> Data_base:
+        """Read-only ``Data_base`` of the calling thread (created on first use)."""
+        base = getattr(self._local, 'base', None)
+        if base is None:
+            # check_same_thread=False only so close() can close it; the
+            # connection is never used outside its thread
+            con = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, check_same_thread=False,
+                                  cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in READER_PRAGMAS:
+                con.execute(pragma)
+            with self._readers_lock:
+                self._readers.append(con)
+            base = Data_base(self.path, connection=con)
+            self._local.base = base
+            logger.debug(f"[ConnectionPool] Opened reader for {threading.current_thread().name}")
+        return base
+
+    def execute_many(self, sql: str, rows: Iterable[Sequence[Any]]) -> Future:
+        """
+        Queue an ``executemany`` for the writer.
+
+        Statements queued close together are committed in one transaction;
+        each runs in its own savepoint, so a failing statement only fails
+        its own future.
+
+        Args:
+            sql: Statement with ``?`` placeholders
+            rows: Parameter rows
+
+        Returns:
+            Future resolved with the number of changed rows once committed
+
+        Raises:
+            RuntimeError: If the pool is closed
+        """
+        statement = _Statement(sql, list(rows))
+        self._put(statement)
+        return statement.future
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> Future:
+        """Queue a single statement; see ``execute_many``."""
+        return self.execute_many(sql, [params])
+
+    def submit(self, fn: Callable[[Data_base], Any]) -> Future:
+        """
+        Run ``fn(writer_base)`` on the writer thread, outside any batch.
+
+        Use it for operations managing their own transaction, such as
+        ``Data_base.save_arrays``.
+
+        Returns:
+            Future resolved with the return value of ``fn``
+
+        Raises:
+            RuntimeError: If the pool is closed
+        """
+        task = _Task(fn)
+        self._put(task)
+        return task.future
+
+    def _put(self, item: Any) -> None:
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("ConnectionPool is closed")
+            self._queue.put(item)
+
+    def close(self) -> None:
+        """Finish queued writes and close every connection."""
+        with self._state_lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(_STOP)
+        self._writer.join()
+        with self._readers_lock:
+            for con in self._readers:
+                con.close()
+            self._readers = []
+
+    def __enter__(self) -> 'ConnectionPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run_writer(self, ready: Future) -> None:
+        try:
+            base = Data_base(self.path)
+            base.creating_table()
+            base.con.commit()
+        except Exception as e:
+            ready.set_exception(e)
+            return
+        ready.set_result(None)
+
+        pending: List[Any] = []
+        batch: List[Any] = []  # work being run, failed too if the writer dies
+        try:
+            while True:
+                if not pending:
+                    pending.append(self._queue.get())
+                item = pending.pop(0)
+                if item is _STOP:
+                    break
+                if isinstance(item, _Task):
+                    batch = [item]
+                    self._run_task(base, item)
+                    batch = []
+                    continue
+
+                # Gather the statements already waiting into one transaction
+                batch = [item]
+                while len(batch) < self.batch_size:
+                    try:
+                        nxt = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if not isinstance(nxt, _Statement):
+                        pending.append(nxt)
+                        break
+                    batch.append(nxt)
+                self._run_batch(base.con, batch)
+                batch = []
+        except Exception:
+            logger.exception("[ConnectionPool] Writer stopped")
+        finally:
+            self._fail_remaining(batch + pending)
+            base.close()
+
+    def _fail_remaining(self, pending: List[Any]) -> None:
+        """Fail the futures of work the writer will never run."""
+        with self._state_lock:
+            self._closed = True
+        error = RuntimeError("ConnectionPool is closed")
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for item in pending:
+            if item is not _STOP and not item.future.done():
+                item.future.set_exception(error)
+
+    @staticmethod
+    def _run_task(base: Data_base, task: _Task) -> None:
+        try:
+            task.future.set_result(task.fn(base))
+        except Exception as e:
+            if base.con.in_transaction:
+                base.con.rollback()
+            task.future.set_exception(e)
+
+    @staticmethod
+    def _run_batch(con: sqlite3.Connection, batch: List[_Statement]) -> None:
+        results = []
+        try:
+            con.execute('BEGIN')
+            for statement in batch:
+                con.execute('SAVEPOINT statement')
+                try:
+                    changed = con.executemany(statement.sql, statement.rows).rowcount
+                except Exception as e:
+                    # Not only sqlite3.Error: binding a bad value raises e.g. OverflowError
+                    con.execute('ROLLBACK TO statement')
+                    results.append((statement, None, e))
+                else:
+                    results.append((statement, changed, None))
+                con.execute('RELEASE statement')
+            con.commit()
+        except Exception as e:
+            if con.in_transaction:
+                con.rollback()
+            for statement in batch:
+                statement.future.set_exception(e)
+            return
+        for statement, changed, error in results:
+            if error is not None:
+                statement.future.set_exception(error)
+            else:
+                statement.future.set_result(changed)
+        logger.debug(f"[ConnectionPool] Committed {len(batch)} statements in one transaction")
@@ -0,0 +1,349 @@
+"""
+Compressed serialization of half-edge meshes for archival and transfer.
+
+Only what cannot be recomputed is stored: coordinates, the undirected
+edges, ids and explicit weights.  Rings are rebuilt on load the way
+``HalfEdgeArrays.from_edge_list`` builds them.
+
+Encoding steps:
+
+1. Coordinates are quantized to ``bits`` per axis over the bounding box
+   (or kept as float64 with ``bits=None``).
+2. Vertices are reordered along a Morton (Z-order) curve, so vertices close
+   in the plane get close indices.
+3. Edges are stored as (lo, hi) pairs sorted by ``lo``; ``lo`` as deltas and
+   ``hi - lo`` as is, both of which stay small after the reordering.
+4. Integer sequences are delta coded where useful, zigzag mapped and written
+   as LEB128 varints; every section is then optionally compressed with zlib
+   or lzma.
+
+The decoder reads each section in blocks and decodes the varints as they
+are decompressed, so the compressed file is never held in memory whole.
+"""
+import dataclasses
+import logging
+import lzma
+import struct
+import zlib
+from typing import BinaryIO, Iterator, Optional, Union
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays, COORD_DTYPE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'HEMZIP\x00\x01'
+VERSION = 1
+BLOCK_SIZE = 1 << 20  # compressed bytes read at once when decoding
+
+COMPRESSION = {'none': 0, 'zlib': 1, 'lzma': 2}
+
+# magic, version, compression, coordinate bits (0: float64), has weights,
+# vertex count, edge count, quantization origin x/y and step
+_HEADER = struct.Struct('<8sIBBBQQddd')
+# kind, value count, stored byte count
+_SECTION = struct.Struct('<BQQ')
+
+_RAW_F8 = 0     # little-endian float64
+_VARINT = 1     # unsigned varints
+_DELTA = 2      # zigzag varints of successive differences
+
+
+def _zigzag(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.int64)
+    return ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+
+def _unzigzag(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.uint64)
+    return ((values >> np.uint64(1)).view(np.int64)) ^ -((values & np.uint64(1)).view(np.int64))
+
+
+def varint_encode(values: np.ndarray) -> np.ndarray:
+    """
+    LEB128-encode unsigned integers.
+
+    Args:
+        values: Non-negative integers
+
+    Returns:
+        uint8 array of 7 bits per byte, high bit set on all but the last
+        byte of every value
+    """
+    values = np.asarray(values).astype(np.uint64)
+    n_bytes = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        n_bytes += values >= np.uint64(1 << (7 * k))
+    out = np.empty(int(n_bytes.sum()), dtype=np.uint8)
+    position = np.cumsum(n_bytes) - n_bytes
+    rest, left = values, n_bytes
+    while len(rest):
+        out[position] = (rest & np.uint64(0x7f)) | np.where(left > 1, np.uint64(0x80), np.uint64(0))
+        rest, left = rest >> np.uint64(7), left - 1
+        alive = left > 0
+        rest, left, position = rest[alive], left[alive], position[alive] + 1
+    return out
+
+
+def varint_decode(data: np.ndarray) -> np.ndarray:
+    """
+    Decode complete LEB128 varints.
+
+    Args:
+        data: uint8 array ending with the last byte of a value
+
+    Returns:
+        uint64 array of the decoded values
+    """
+    data = np.asarray(data, dtype=np.uint8)
+    if not len(data):
+        return np.empty(0, dtype=np.uint64)
+    last = data < 0x80
+    starts = np.flatnonzero(np.r_[True, last[:-1]])
+    group = np.cumsum(last) - last
+    shift = ((np.arange(len(data)) - starts[group]) * 7).astype(np.uint64)
+    parts = (data & 0x7f).astype(np.uint64) << shift
+    return np.add.reduceat(parts, starts)
+
+
+def _part1by1(values: np.ndarray) -> np.ndarray:
+    """Spread the low 32 bits of ``values`` to the even bits."""
+    x = values.astype(np.uint64) & np.uint64(0xffffffff)
+    for shift, mask in ((16, 0x0000ffff0000ffff), (8, 0x00ff00ff00ff00ff),
+                        (4, 0x0f0f0f0f0f0f0f0f), (2, 0x3333333333333333),
+                        (1, 0x5555555555555555)):
+        x = (x | (x << np.uint64(shift))) & np.uint64(mask)
+    return x
+
+
+def morton_order(coords: np.ndarray, bits: int = 16) -> np.ndarray:
+    """
+    Permutation visiting points along a Z-order curve.
+
+    Args:
+        coords: (n, 2) points
+        bits: Resolution of the curve per axis
+
+    Returns:
+        Indices of ``coords`` in curve order
+    """
+    coords = np.asarray(coords, dtype=COORD_DTYPE).reshape(-1, 2)
+    if not len(coords):
+        return np.empty(0, dtype=np.int64)
+    lo = coords.min(axis=0)
+    extent = max(float((coords.max(axis=0) - lo).max()), np.finfo(float).tiny)
+    grid = np.rint((coords - lo) / extent * ((1 << bits) - 1)).astype(np.uint64)
+    keys = _part1by1(grid[:, 0]) | (_part1by1(grid[:, 1]) << np.uint64(1))
+    return np.argsort(keys, kind='stable')
+
+
+class _SectionWriter:
+    """Writes sections through the chosen compressor."""
+
+    def __init__(self, f: BinaryIO, compression: int, level: Optional[int]):
+        self.f = f
+        self.compression = compression
+        self.level = level
+
+    def write(self, kind: int, values: np.ndarray) -> None:
+        if kind == _RAW_F8:
+            payload = np.ascontiguousarray(values, dtype='<f8').tobytes()
+        elif kind == _VARINT:
+            payload = varint_encode(values).tobytes()
+        else:
+            values = np.asarray(values, dtype=np.int64)
+            payload = varint_encode(_zigzag(np.diff(values, prepend=np.int64(0)))).tobytes()
+
+        if self.compression == COMPRESSION['zlib']:
+            payload = zlib.compress(payload, 6 if self.level is None else self.level)
+        elif self.compression == COMPRESSION['lzma']:
+            payload = lzma.compress(payload, preset=6 if self.level is None else self.level)
+        self.f.write(_SECTION.pack(kind, len(values), len(payload)))
+        self.f.write(payload)
+
+
+class _SectionReader:
+    """Streams sections back, decompressing and decoding block by block."""
+
+    def __init__(self, f: BinaryIO, compression: int, block_size: int):
+        self.f = f
+        self.compression = compression
+        self.block_size = block_size
+
+    def _blocks(self, n_bytes: int) -> Iterator[bytes]:
+        if self.compression == COMPRESSION['zlib']:
+            decompressor = zlib.decompressobj()
+        elif self.compression == COMPRESSION['lzma']:
+            decompressor = lzma.LZMADecompressor()
+        else:
+            decompressor = None
+        left = n_bytes
+        while left:
+            block = self.f.read(min(self.block_size, left))
+            if not block:
+                raise ValueError("Truncated compressed mesh")
+            left -= len(block)
+            yield decompressor.decompress(block) if decompressor is not None else block
+        if decompressor is not None and not decompressor.eof:
+            raise ValueError("Truncated compressed mesh")
+
+    def read(self, expected_kind: int) -> np.ndarray:
+        header = self.f.read(_SECTION.size)
+        if len(header) < _SECTION.size:
+            raise ValueError("Truncated compressed mesh")
+        kind, n_values, n_bytes = _SECTION.unpack(header)
+        if kind != expected_kind:
+            raise ValueError(f"Unexpected section kind {kind}")
+
+        if kind == _RAW_F8:
+            raw = b''.join(self._blocks(n_bytes))
+            values = np.frombuffer(raw, dtype='<f8')
+            if len(values) != n_values:
+                raise ValueError("Corrupt compressed mesh section")
+            return values.astype(COORD_DTYPE)
+
+        out = np.empty(n_values, dtype=np.uint64)
+        filled = 0
+        pending = np.empty(0, dtype=np.uint8)
+        for block in self._blocks(n_bytes):
+            data = np.concatenate([pending, np.frombuffer(block, dtype=np.uint8)])
+            # Decode up to the last complete varint, keep the rest
+            ends = np.flatnonzero(data < 0x80)
+            cut = ends[-1] + 1 if len(ends) else 0
+            decoded = varint_decode(data[:cut])
+            if filled + len(decoded) > n_values:
+                raise ValueError("Corrupt compressed mesh section")
+            out[filled:filled + len(decoded)] = decoded
+            filled += len(decoded)
+            pending = data[cut:]
+        if filled != n_values or len(pending):
+            raise ValueError("Corrupt compressed mesh section")
+        if kind == _DELTA:
+            return np.cumsum(_unzigzag(out))
+        return out.view(np.int64)
+
+
+def save_compressed(arrays: HalfEdgeArrays, target: Union[str, BinaryIO], bits: Optional[int] = 24,
+                    compression: str = 'zlib', level: Optional[int] = None) -> None:
+    """
+    Write a compressed mesh.
+
+    Args:
+        arrays: Mesh to write; every half-edge needs a twin
+        target: Output path or binary file object
+        bits: Quantization bits per axis (at most 31); ``None`` keeps the
+            coordinates exact
+        compression: 'none', 'zlib' or 'lzma'
+        level: Compression level (default: 6 for both compressors)
+
+    Raises:
+        ValueError: If ``bits`` or ``compression`` is not supported
+    """
+    if compression not in COMPRESSION:
+        raise ValueError(f"Unknown compression {compression!r}")
+    if bits is not None and not 1 <= bits <= 31:
+        raise ValueError("bits must be between 1 and 31")
+    if isinstance(target, str):
+        with open(target, 'wb') as f:
+            save_compressed(arrays, f, bits, compression, level)
+        return
+
+    coords = arrays.coords
+    lo = coords.min(axis=0) if len(coords) else np.zeros(2)
+    extent = float((coords.max(axis=0) - lo).max()) if len(coords) else 0.0
+    step = extent / ((1 << bits) - 1) if bits and extent > 0 else 1.0
+
+    order = morton_order(coords)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    # One (lo, hi) record per edge, sorted; ``first`` is the half-edge
+    # going from lo to hi
+    half = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+    a = rank[arrays.origin[half]]
+    b = rank[arrays.target[half]]
+    first = np.where(a < b, half, arrays.twin[half])
+    e_lo, e_hi = np.minimum(a, b), np.maximum(a, b)
+    by_edge = np.lexsort((e_hi, e_lo))
+    e_lo, e_hi, first = e_lo[by_edge], e_hi[by_edge], first[by_edge]
+    halves = np.column_stack([first, arrays.twin[first]]).reshape(-1)
+    weights = arrays.weight[halves]
+    has_weights = not np.isnan(weights).all()
+
+    f = target
+    f.write(_HEADER.pack(MAGIC, VERSION, COMPRESSION[compression], bits or 0, has_weights,
+                         arrays.n_vertices, len(e_lo), float(lo[0]), float(lo[1]), step))
+    writer = _SectionWriter(f, COMPRESSION[compression], level)
+    ordered = coords[order]
+    if bits:
+        q = np.rint((ordered - lo) / step).astype(np.int64)
+        writer.write(_DELTA, q[:, 0])
+        writer.write(_DELTA, q[:, 1])
+    else:
+        writer.write(_RAW_F8, ordered[:, 0])
+        writer.write(_RAW_F8, ordered[:, 1])
+    writer.write(_DELTA, arrays.vertex_ids[order])
+    writer.write(_DELTA, e_lo)
+    writer.write(_VARINT, e_hi - e_lo)
+    writer.write(_DELTA, arrays.edge_ids[halves])
+    if has_weights:
+        writer.write(_RAW_F8, weights)
+    logger.debug(f"[save_compressed] Wrote {arrays.n_vertices} vertices and {len(e_lo)} edges")
+
+
+def load_compressed(source: Union[str, BinaryIO], block_size: int = BLOCK_SIZE) -> HalfEdgeArrays:
+    """
+    Read a mesh written by ``save_compressed``.
+
+    Vertices come back in the stored (Z-order) order with their ids; the
+    coordinates are exact up to the quantization step.
+
+    Args:
+        source: Input path or binary file object
+        block_size: Compressed bytes read at once
+
+    Returns:
+        HalfEdgeArrays with the stored ids and weights
+
+    Raises:
+        ValueError: If the data is not a compressed mesh or is corrupt
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return load_compressed(f, block_size)
+
+    header = source.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("Not a compressed mesh")
+    magic, version, compression, bits, has_weights, n_vertices, n_edges, x0, y0, step = \
+        _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a compressed mesh")
+    if version != VERSION:
+        raise ValueError(f"Unsupported compressed mesh version {version}")
+
+    reader = _SectionReader(source, compression, block_size)
+    if bits:
+        x = reader.read(_DELTA) * step + x0
+        y = reader.read(_DELTA) * step + y0
+    else:
+        x = reader.read(_RAW_F8)
+        y = reader.read(_RAW_F8)
+    vertex_ids = reader.read(_DELTA)
+    e_lo = reader.read(_DELTA)
+    e_hi = e_lo + reader.read(_VARINT)
+    edge_ids = reader.read(_DELTA)
+    weight = reader.read(_RAW_F8) if has_weights else None
+    if len(x) != n_vertices or len(e_lo) != n_edges:
+        raise ValueError("Corrupt compressed mesh")
+    if n_edges and (e_hi.max() >= n_vertices or e_lo.min() < 0):
+        raise ValueError("Corrupt compressed mesh")
+
+    arrays = HalfEdgeArrays.from_edge_list(np.column_stack([x, y]), np.column_stack([e_lo, e_hi]),
+                                           vertex_ids=vertex_ids)
+    changes = {'edge_ids': edge_ids}
+    if weight is not None:
+        changes['weight'] = weight
+    logger.debug(f"[load_compressed] Read {n_vertices} vertices and {n_edges} edges")
+    return dataclasses.replace(arrays, **changes)
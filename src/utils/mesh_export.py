@@ -0,0 +1,220 @@
+"""
+Export of half-edge meshes to OBJ, binary PLY and binary STL.
+
+Faces are taken from the face cycles of ``HalfEdgeArrays`` and written in
+chunks.  Text is formatted straight into byte buffers with vectorized
+digit arithmetic and binary records are written as raw record arrays, so
+no Python string is built per vertex or face.
+"""
+import logging
+import os
+from typing import BinaryIO, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ROWS = 1 << 16  # vertices or faces formatted at once (fits in cache)
+
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+# Text row pieces: literal bytes, ('int', values, min_width) for
+# non-negative integers, ('flag', mask, byte) for an optional character
+_Piece = Union[bytes, Tuple[str, np.ndarray, int]]
+
+
+def _width(values: np.ndarray, min_width: int) -> int:
+    """Characters needed for the largest of some non-negative integers."""
+    if not len(values):
+        return min_width
+    return max(int(np.searchsorted(_POW10, values.max(), side='right')), min_width, 1)
+
+
+def _format_rows(pieces: Sequence[_Piece], n: int) -> np.ndarray:
+    """
+    Format ``n`` text rows into one byte buffer.
+
+    Every piece is laid out at a fixed width in a (width, n) character
+    table, together with a mask of the characters to keep (dropping leading
+    zeros and absent flags).  Compressing the transposed table with the mask
+    yields the rows back to back.
+
+    Args:
+        pieces: Pieces of every row, in order
+        n: Number of rows
+
+    Returns:
+        uint8 array with the concatenated rows
+    """
+    widths = [len(p) if isinstance(p, bytes) else _width(p[1], p[2]) if p[0] == 'int' else 1
+              for p in pieces]
+    chars = np.empty((sum(widths), n), dtype=np.uint8)
+    keep = np.ones((sum(widths), n), dtype=bool)
+    row = 0
+    for piece, width in zip(pieces, widths):
+        if isinstance(piece, bytes):
+            chars[row:row + width] = np.frombuffer(piece, dtype=np.uint8)[:, None]
+        elif piece[0] == 'int':
+            values, min_width = piece[1], piece[2]
+            # 32-bit division is much faster when the values fit
+            dtype = np.uint32 if width <= 9 else np.uint64
+            rest, ten = values.astype(dtype), dtype(10)
+            for col in range(row + width - 1, row - 1, -1):
+                quotient = rest // ten
+                chars[col] = rest - quotient * ten
+                rest = quotient
+            chars[row:row + width] += ord('0')
+            for col in range(width - min_width):
+                keep[row + col] = values >= _POW10[width - 1 - col]
+        else:
+            chars[row] = piece[2]
+            keep[row] = piece[1]
+        row += width
+    return chars.T[keep.T]
+
+
+def _fixed_point(values: np.ndarray, precision: int) -> List[_Piece]:
+    """Pieces writing floats with ``precision`` decimals."""
+    scale = _POW10[precision]
+    scaled = np.rint(np.abs(values) * scale).astype(np.int64)
+    return [('flag', (values < 0) & (scaled > 0), ord('-')),
+            ('int', scaled // scale, 1), b'.', ('int', scaled % scale, precision)]
+
+
+def _write_text_vertices(f: BinaryIO, coords: np.ndarray, precision: int) -> None:
+    limit = float(_POW10[18 - precision])
+    for start in range(0, len(coords), CHUNK_ROWS):
+        chunk = coords[start:start + CHUNK_ROWS]
+        if np.abs(chunk).max() >= limit:
+            # Too large for int64 fixed point; fall back to per-row formatting
+            np.savetxt(f, chunk, fmt=f'v %.{precision}f %.{precision}f 0')
+            continue
+        pieces: List[_Piece] = [b'v ']
+        pieces += _fixed_point(chunk[:, 0], precision) + [b' ']
+        pieces += _fixed_point(chunk[:, 1], precision) + [b' 0\n']
+        f.write(_format_rows(pieces, len(chunk)))
+
+
+def _face_groups(face_vertices: np.ndarray, face_sizes: np.ndarray):
+    """Yield (size, (n_faces, size) vertex indices) per distinct face size."""
+    offsets = np.cumsum(face_sizes) - face_sizes
+    for size in np.unique(face_sizes).tolist():
+        starts = offsets[face_sizes == size]
+        yield size, face_vertices[starts[:, None] + np.arange(size)]
+
+
+def write_obj(arrays: HalfEdgeArrays, filename: str, precision: int = 6) -> None:
+    """
+    Write the vertices and inner faces of a mesh to an OBJ file.
+
+    Vertices get a zero z coordinate; faces are grouped by vertex count.
+
+    Args:
+        arrays: Mesh to export
+        filename: Output path
+        precision: Decimals of the coordinates
+    """
+    face_vertices, face_sizes = arrays.faces()
+    with open(filename, 'wb') as f:
+        _write_text_vertices(f, arrays.coords, precision)
+        for size, faces in _face_groups(face_vertices, face_sizes):
+            for start in range(0, len(faces), CHUNK_ROWS):
+                chunk = faces[start:start + CHUNK_ROWS] + 1
+                pieces: List[_Piece] = [b'f']
+                for k in range(size):
+                    pieces += [b' ', ('int', chunk[:, k], 1)]
+                pieces.append(b'\n')
+                f.write(_format_rows(pieces, len(chunk)))
+    logger.debug(f"[write_obj] Wrote {arrays.n_vertices} vertices and {len(face_sizes)} faces to {filename}")
+
+
+def write_ply(arrays: HalfEdgeArrays, filename: str) -> None:
+    """
+    Write the vertices and inner faces of a mesh to a binary PLY file.
+
+    Args:
+        arrays: Mesh to export
+        filename: Output path
+    """
+    face_vertices, face_sizes = arrays.faces()
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        f"element vertex {arrays.n_vertices}\n"
+        "property double x\n"
+        "property double y\n"
+        "property double z\n"
+        f"element face {len(face_sizes)}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+    if len(face_sizes) and face_sizes.max() > 255:
+        raise ValueError("PLY face lists are limited to 255 vertices")
+
+    with open(filename, 'wb') as f:
+        f.write(header.encode('ascii'))
+        for start in range(0, arrays.n_vertices, CHUNK_ROWS):
+            chunk = arrays.coords[start:start + CHUNK_ROWS]
+            xyz = np.zeros((len(chunk), 3), dtype='<f8')
+            xyz[:, :2] = chunk
+            f.write(xyz)
+        for size, faces in _face_groups(face_vertices, face_sizes):
+            record = np.dtype([('n', 'u1'), ('v', '<i4', (size,))])
+            for start in range(0, len(faces), CHUNK_ROWS):
+                chunk = faces[start:start + CHUNK_ROWS]
+                rows = np.empty(len(chunk), dtype=record)
+                rows['n'] = size
+                rows['v'] = chunk
+                f.write(rows)
+    logger.debug(f"[write_ply] Wrote {arrays.n_vertices} vertices and {len(face_sizes)} faces to {filename}")
+
+
+_STL_RECORD = np.dtype([('normal', '<f4', (3,)), ('v', '<f4', (3, 3)), ('attr', '<u2')])
+
+
+def write_stl(arrays: HalfEdgeArrays, filename: str) -> None:
+    """
+    Write the inner faces of a mesh to a binary STL file.
+
+    STL stores triangles only: larger faces are split into a fan from
+    their first vertex, which is exact for convex faces.
+
+    Args:
+        arrays: Mesh to export
+        filename: Output path
+    """
+    triangles = arrays.triangles()
+    n = len(triangles)
+
+    with open(filename, 'wb') as f:
+        f.write(b'binary STL written by half_edge'.ljust(80, b' '))
+        f.write(np.uint32(n).tobytes())
+        for start in range(0, n, CHUNK_ROWS):
+            chunk = triangles[start:start + CHUNK_ROWS]
+            rows = np.zeros(len(chunk), dtype=_STL_RECORD)
+            rows['normal'][:, 2] = 1.0
+            rows['v'][:, :, :2] = arrays.coords[chunk]
+            f.write(rows)
+    logger.debug(f"[write_stl] Wrote {n} triangles to {filename}")
+
+
+_WRITERS = {'.obj': write_obj, '.ply': write_ply, '.stl': write_stl}
+
+
+def export_mesh(arrays: HalfEdgeArrays, filename: str) -> None:
+    """
+    Export a mesh in the format given by the file extension.
+
+    Args:
+        arrays: Mesh to export
+        filename: Output path ending in .obj, .ply or .stl
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {ext!r}")
+    _WRITERS[ext](arrays, filename)
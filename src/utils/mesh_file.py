@@ -0,0 +1,120 @@
+"""
+Binary container format for ``HalfEdgeArrays`` snapshots.
+
+Layout (little endian)::
+
+    header      magic b'HEMESH\\x00\\x01', version, section count,
+                vertex count, half-edge count
+    sections    (name, dtype, byte offset, rows, columns) per array
+    data        raw arrays, each starting on a 64-byte boundary
+
+Opening a file maps it with ``numpy.memmap`` and wraps every section as a
+read-only view, so nothing is parsed or copied: the OS pages data in on
+first access and processes opening the same file share the page cache.
+"""
+import logging
+import struct
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..core.half_edge_arrays import HalfEdgeArrays
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'HEMESH\x00\x01'
+VERSION = 1
+ALIGNMENT = 64
+
+_HEADER = struct.Struct('<8sIIQQ')
+_SECTION = struct.Struct('<16s8sQQQ')
+
+# Sections always written, in file order
+_REQUIRED = ('coords', 'origin', 'twin', 'next', 'vertex_ids', 'edge_ids')
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_mesh(arrays: HalfEdgeArrays, filename: str, face_ids: bool = False) -> None:
+    """
+    Write a mesh snapshot to a binary mesh file.
+
+    Weights are stored only when at least one half-edge has an explicit
+    weight.
+
+    Args:
+        arrays: Mesh snapshot
+        filename: Output path
+        face_ids: Also store ``arrays.face_ids`` (always stored when already
+            computed)
+    """
+    sections: Dict[str, np.ndarray] = {name: getattr(arrays, name) for name in _REQUIRED}
+    if not np.isnan(arrays.weight).all():
+        sections['weight'] = arrays.weight
+    if face_ids or 'face_ids' in vars(arrays):
+        sections['face_ids'] = arrays.face_ids
+
+    table: List[Tuple[str, np.ndarray, int]] = []
+    offset = _align(_HEADER.size + _SECTION.size * len(sections))
+    for name, array in sections.items():
+        table.append((name, np.ascontiguousarray(array), offset))
+        offset = _align(offset + array.nbytes)
+
+    with open(filename, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(table), arrays.n_vertices, arrays.n_half_edges))
+        for name, array, start in table:
+            cols = array.shape[1] if array.ndim == 2 else 0
+            f.write(_SECTION.pack(name.encode(), array.dtype.str.encode(), start, len(array), cols))
+        for _, array, start in table:
+            if array.size:  # memoryview cannot cast a view with a zero-length axis
+                f.seek(start)
+                f.write(memoryview(array).cast('B'))
+        f.truncate(offset)
+    logger.debug(f"[save_mesh] Wrote {arrays.n_half_edges} half-edges to {filename}")
+
+
+def open_mesh(filename: str) -> HalfEdgeArrays:
+    """
+    Open a binary mesh file without parsing it.
+
+    Args:
+        filename: Path written by ``save_mesh``
+
+    Returns:
+        HalfEdgeArrays whose arrays are read-only views of the mapped file
+
+    Raises:
+        ValueError: If the file is not a binary mesh file of a known version
+    """
+    data = np.memmap(filename, dtype=np.uint8, mode='r')
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{filename} is not a binary mesh file")
+    magic, version, n_sections, n_vertices, n_half_edges = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{filename} is not a binary mesh file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary mesh version {version} in {filename}")
+
+    sections: Dict[str, np.ndarray] = {}
+    for i in range(n_sections):
+        name, dtype, start, rows, cols = _SECTION.unpack_from(data, _HEADER.size + i * _SECTION.size)
+        dtype = np.dtype(dtype.rstrip(b'\x00').decode())
+        shape = (rows, cols) if cols else (rows,)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        if start + nbytes > len(data):
+            raise ValueError(f"Truncated binary mesh file {filename}")
+        view = data[start:start + nbytes].view(dtype).reshape(shape)
+        sections[name.rstrip(b'\x00').decode()] = np.asarray(view)
+
+    weight = sections.get('weight')
+    if weight is None:
+        # Unweighted meshes share one NaN instead of allocating an array
+        weight = np.broadcast_to(np.float64(np.nan), (n_half_edges,))
+    arrays = HalfEdgeArrays(weight=weight, **{name: sections[name] for name in _REQUIRED})
+    if 'face_ids' in sections:
+        # Pre-fill the cached property
+        vars(arrays)['face_ids'] = sections['face_ids']
+    logger.debug(f"[open_mesh] Mapped {n_vertices} vertices and {n_half_edges} half-edges from {filename}")
+    return arrays
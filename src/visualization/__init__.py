@@ -4,6 +4,16 @@ Provides both turtle-based and GUI-based visualization capabilities.
 """
 
 from .turtle_visualizer import TurtleVisualizer
-from .gui import run_visualization, MainWindow, HalfEdgeCanvas
+from .gui import run_visualization, run_visualization_from_file, MainWindow, HalfEdgeCanvas
+from .loader import AsyncMeshLoader, MeshLoadWorker, load_mesh
+from .view_transform import ViewTransform
+from .edge_scene import EdgeScene
+from .lod import DetailLevel, LevelOfDetail
+from .raster import RasterImage, render_mesh
+from .mpl_visualizer import MatplotlibVisualizer
+from .playback import Frame, TriangulationPlayer
 
-__all__ = ['TurtleVisualizer', 'run_visualization', 'MainWindow', 'HalfEdgeCanvas']
+__all__ = ['TurtleVisualizer', 'run_visualization', 'run_visualization_from_file', 'MainWindow',
+           'HalfEdgeCanvas', 'AsyncMeshLoader', 'MeshLoadWorker', 'load_mesh', 'ViewTransform',
+           'EdgeScene', 'DetailLevel', 'LevelOfDetail', 'RasterImage', 'render_mesh',
+           'MatplotlibVisualizer', 'Frame', 'TriangulationPlayer']
@@ -0,0 +1,196 @@
+"""
+Flat, indexed copy of the edges shown by ``HalfEdgeCanvas``.
+
+Painting and picking work on arrays instead of walking ``HalfEdge`` objects:
+every undirected edge appears once (the first of its two half-edges in the
+edge list) and an ``EdgeGrid`` finds the edges inside the exposed rectangle,
+so a repaint only touches what is visible.
+"""
+import logging
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..algorithms.spatial_index import EdgeGrid, segment_distances
+from ..core.half_edge_ds import HalfEdge, Vertex
+from .lod import DetailLevel, LevelOfDetail
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[float, float, float, float]
+
+# Appended or moved edges stay unindexed until they outnumber the indexed
+# ones or this
+MIN_INDEXED = 4096
+
+
+class EdgeScene:
+    """Deduplicated edge segments of a canvas with a spatial index.
+
+    Edges appended with ``extend`` are kept in a small unindexed tail that
+    queries scan directly; the grid is rebuilt once the tail outgrows it, so
+    streaming a mesh in chunks does not rebuild the index per chunk.  Indexed
+    edges moved by ``refresh`` are likewise scanned directly until then.
+
+    Attributes:
+        edges: One half-edge per undirected edge
+        segments: (n, 4) segment of ``edges[i]``, origin first
+        grid: Spatial index over the first ``len(grid)`` segments
+    """
+
+    def __init__(self, edges: Sequence[HalfEdge]):
+        """
+        Collect and index the edges.
+
+        Args:
+            edges: Half-edges to show; twins may or may not both be listed
+        """
+        self._index = {}
+        self.edges: List[HalfEdge] = []
+        self.segments = np.empty((0, 4))
+        self._append(edges)
+        self.reindex()
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def _append(self, edges: Sequence[HalfEdge]) -> None:
+        added = []
+        for edge in edges:
+            if id(edge.S) not in self._index:
+                self._index[id(edge)] = len(self.edges) + len(added)
+                added.append(edge)
+        self.edges.extend(added)
+        self.segments = np.concatenate([self.segments, EdgeGrid.segments_of(added)])
+
+    def extend(self, edges: Sequence[HalfEdge]) -> None:
+        """Append half-edges whose twin is not shown yet."""
+        self._append(edges)
+        self._reindex_if_outgrown()
+
+    def _reindex_if_outgrown(self) -> None:
+        unindexed = len(self.segments) - len(self.grid) + len(self._moved)
+        if unindexed > max(len(self.grid), MIN_INDEXED):
+            self.reindex()
+
+    def refresh(self, edges: Sequence[HalfEdge]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Re-read the endpoints of shown edges that were changed in place.
+
+        Args:
+            edges: Shown half-edges (or their twins) whose endpoints moved;
+                others are ignored
+
+        Returns:
+            The (k, 4) segments of the changed edges before and after
+        """
+        found = [self._index.get(id(edge), self._index.get(id(edge.S))) for edge in edges]
+        indices = np.unique(np.array([i for i in found if i is not None], dtype=np.int64))
+        old = self.segments[indices]
+        new = EdgeGrid.segments_of([self.edges[i] for i in indices.tolist()])
+        self.segments[indices] = new
+        indexed = indices[indices < len(self.grid)]
+        if len(indexed):
+            # The grid still files these under their old position
+            self._moved = np.union1d(self._moved, indexed)
+            self._lod = None
+            self._reindex_if_outgrown()
+        return old, new
+
+    def reindex(self) -> None:
+        """Rebuild the grid over all segments."""
+        self.grid = EdgeGrid(self.segments)
+        self._moved = np.empty(0, dtype=np.int64)
+        self._lod: Optional[LevelOfDetail] = None
+        logger.debug(f"[EdgeScene] Indexed {len(self.edges)} edges")
+
+    def _tail(self) -> Tuple[int, np.ndarray]:
+        start = len(self.grid)
+        return start, self.segments[start:]
+
+    def visible(self, rect: Rect) -> np.ndarray:
+        """Indices of the edges whose bounding box overlaps ``(x0, y0, x1, y1)``."""
+        start, tail = self._tail()
+        found = self.grid.in_rect(*rect)
+        if len(self._moved):
+            moved = self._moved[segments_in_rect(self.segments[self._moved], rect)]
+            found = np.union1d(np.setdiff1d(found, self._moved, assume_unique=True), moved)
+        if not len(tail):
+            return found
+        return np.concatenate([found, start + segments_in_rect(tail, rect)])
+
+    def tail_visible(self, rect: Rect) -> np.ndarray:
+        """Like ``visible``, for the edges appended since the last reindex."""
+        start, tail = self._tail()
+        return start + segments_in_rect(tail, rect)
+
+    def detail_level(self, pixel_size: float) -> Optional[DetailLevel]:
+        """
+        Simplified version of the indexed edges to draw at ``pixel_size``.
+
+        The level hierarchy is built on first use after every reindex or
+        move; the unindexed tail is not part of it and is drawn as is.
+
+        Args:
+            pixel_size: World units per screen pixel
+
+        Returns:
+            A level, or None when the edges are far enough apart to draw
+        """
+        if self._lod is None:
+            self._lod = LevelOfDetail(self.segments[:len(self.grid)])
+        return self._lod.select(pixel_size)
+
+    def midpoints(self, indices: np.ndarray) -> np.ndarray:
+        """(n, 2) midpoints of some edges, where their labels go."""
+        segments = self.segments[indices]
+        return (segments[:, :2] + segments[:, 2:]) / 2
+
+    def nearest(self, point: Tuple[float, float], max_distance: float) -> Optional[HalfEdge]:
+        """Edge nearest to ``point`` if it is within ``max_distance``."""
+        scanned = np.arange(len(self.grid), len(self.segments))
+        if not len(self._moved):
+            index, distance = self.grid.nearest(point, max_distance=max_distance)
+        else:
+            # Moved edges are only found where they used to be
+            index, distance = -1, math.inf
+            nearby = self.grid.candidates(point, max_distance) if math.isfinite(max_distance) \
+                else np.arange(len(self.grid))
+            scanned = np.concatenate([np.setdiff1d(nearby, self._moved), self._moved, scanned])
+        if len(scanned):
+            distances = segment_distances(point, self.segments[scanned])
+            best = int(distances.argmin())
+            if distances[best] <= max_distance and distances[best] < distance:
+                index = int(scanned[best])
+        return self.edges[index] if index >= 0 else None
+
+
+def vertex_coords(vertices: Sequence[Vertex]) -> np.ndarray:
+    """(n, 2) positions of some vertices."""
+    return np.array([v.getxy() for v in vertices], dtype=np.float64).reshape(-1, 2)
+
+
+def segments_in_rect(segments: np.ndarray, rect: Rect) -> np.ndarray:
+    """Indices of the (x1, y1, x2, y2) segments whose bounding box overlaps ``(x0, y0, x1, y1)``."""
+    x0, y0, x1, y1 = rect
+    lo = np.minimum(segments[:, :2], segments[:, 2:])
+    hi = np.maximum(segments[:, :2], segments[:, 2:])
+    return np.flatnonzero((lo[:, 0] <= x1) & (hi[:, 0] >= x0) & (lo[:, 1] <= y1) & (hi[:, 1] >= y0))
+
+
+def points_in_rect(coords: np.ndarray, rect: Rect) -> np.ndarray:
+    """Indices of the points inside ``(x0, y0, x1, y1)``."""
+    x0, y0, x1, y1 = rect
+    x, y = coords[:, 0], coords[:, 1]
+    return np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+
+
+def one_per_pixel(coords: np.ndarray, pixel_size: float = 1.0) -> np.ndarray:
+    """The first of the points falling in every occupied pixel."""
+    if not len(coords):
+        return coords
+    cells = np.floor(coords / pixel_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    _, first = np.unique(cells[:, 1] * (int(cells[:, 0].max()) + 1) + cells[:, 0], return_index=True)
+    return coords[first]
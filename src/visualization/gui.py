@@ -3,20 +3,122 @@ GUI-based visualization module for Half-Edge data structures.
 Provides interactive visualization capabilities using PyQt.
 """
 from typing import List, Optional, Tuple
+import numpy as np
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QLabel, QSpinBox,
                             QComboBox, QMessageBox, QToolBar, QStatusBar,
-                            QGroupBox)
-from PyQt6.QtCore import Qt, QPointF, pyqtSignal
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QAction, QIcon
+                            QGroupBox, QFileDialog)
+from PyQt6.QtCore import Qt, QPoint, QPointF, QRect, QRectF, QByteArray, QDataStream, pyqtSignal
+from PyQt6.QtGui import QPainter, QPainterPath, QPen, QColor, QFont, QFontMetrics, QAction, QIcon, QPixmap, QPolygonF
 import logging
 import random
 
 from ..core.half_edge_ds import HalfEdge, Vertex
 from ..algorithms.delaunay import DelaunayTriangulation
+from .edge_scene import EdgeScene, one_per_pixel, points_in_rect, segments_in_rect, vertex_coords
+from .loader import AsyncMeshLoader
+from .view_transform import ViewTransform
 
 logger = logging.getLogger(__name__)
 
+VERTEX_RADIUS = 5
+# Labels and vertex circles are drawn when the visible vertices average at
+# least this many pixels apart; denser views draw plain lines and dots
+DETAIL_SPACING = 20.0
+ZOOM_STEP = 1.25  # zoom factor per mouse wheel notch
+
+
+def _polygon(points: np.ndarray) -> QPolygonF:
+    """QPolygonF holding (n, 2) points, filled through its buffer."""
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon = QPolygonF()
+    polygon.resize(len(points))
+    if len(points):
+        buffer = polygon.data()
+        buffer.setsize(points.nbytes)
+        np.frombuffer(buffer, dtype=np.float64)[:] = points.ravel()
+    return polygon
+
+
+# QPainterPath as QDataStream writes it (``operator<<(QDataStream &,
+# const QPainterPath &)``, unchanged since Qt 4.x): int32 element count,
+# (int32 type, double x, double y) per element, int32 cStart (index of the
+# element starting the current subpath) and int32 fill rule, big-endian.
+# The stream version is pinned; ``_streamed_path_ok`` checks the layout
+# against a path built through the API once before it is relied on.
+_PATH_ELEMENT = np.dtype([('type', '>i4'), ('x', '>f8'), ('y', '>f8')])
+_PATH_STREAM_VERSION = QDataStream.Version.Qt_6_0
+_MOVE_TO, _LINE_TO = 0, 1  # QPainterPath.ElementType values
+
+
+def _api_lines_path(segments: np.ndarray) -> QPainterPath:
+    """QPainterPath of (n, 4) line segments, one ``moveTo``/``lineTo`` pair each."""
+    path = QPainterPath()
+    for x1, y1, x2, y2 in np.asarray(segments, dtype=float).reshape(-1, 4).tolist():
+        path.moveTo(x1, y1)
+        path.lineTo(x2, y2)
+    return path
+
+
+def _streamed_lines_path(segments: np.ndarray) -> QPainterPath:
+    """QPainterPath of (n, 4) line segments, read from a buffer laid out with NumPy."""
+    segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+    n = len(segments)
+    elements = np.empty(2 * n, dtype=_PATH_ELEMENT)
+    elements['type'][0::2] = _MOVE_TO
+    elements['type'][1::2] = _LINE_TO
+    elements['x'][0::2], elements['y'][0::2] = segments[:, 0], segments[:, 1]
+    elements['x'][1::2], elements['y'][1::2] = segments[:, 2], segments[:, 3]
+    tail = np.array([max(2 * n - 2, 0), Qt.FillRule.OddEvenFill.value], dtype='>i4')
+    data = b''.join([np.array(2 * n, dtype='>i4').tobytes(), elements.tobytes(), tail.tobytes()])
+    stream = QDataStream(QByteArray(data))
+    stream.setVersion(_PATH_STREAM_VERSION)
+    stream.setByteOrder(QDataStream.ByteOrder.BigEndian)
+    path = QPainterPath()
+    stream >> path
+    return path
+
+
+def _same_path(a: QPainterPath, b: QPainterPath) -> bool:
+    """Whether two paths have the same elements and fill rule, and close alike."""
+    if a != b or a.fillRule() != b.fillRule():
+        return False
+    # closeSubpath goes back to cStart, which == does not compare
+    a, b = QPainterPath(a), QPainterPath(b)
+    a.closeSubpath()
+    b.closeSubpath()
+    return a == b
+
+
+_stream_checked: Optional[bool] = None
+
+
+def _streamed_path_ok() -> bool:
+    """Whether this Qt reads ``_streamed_lines_path`` buffers as intended (checked once)."""
+    global _stream_checked
+    if _stream_checked is None:
+        sample = np.array([[0, 0, 10, 0], [1.5, 2.5, 3, 4], [3, 4, -1, 7]])
+        _stream_checked = _same_path(_streamed_lines_path(sample), _api_lines_path(sample))
+        if not _stream_checked:
+            logger.warning("[HalfEdgeCanvas] QPainterPath stream layout differs; "
+                           "building line paths element by element")
+    return _stream_checked
+
+
+def _lines_path(segments: np.ndarray) -> QPainterPath:
+    """
+    QPainterPath of (n, 4) line segments, built without a Python loop.
+
+    The path is deserialized from a buffer laid out with NumPy.  Stroking
+    one path is several times faster than ``drawLines`` with the same
+    points, so this is worth it for large meshes; if the Qt in use reads
+    the buffer differently the path is built through the API instead.
+    """
+    if _streamed_path_ok():
+        return _streamed_lines_path(segments)
+    return _api_lines_path(segments)
+
+
 class HalfEdgeCanvas(QWidget):
     """A widget for drawing Half-Edge data structures."""
     
@@ -31,6 +133,19 @@ class HalfEdgeCanvas(QWidget):
         self.selected_edge: Optional[HalfEdge] = None
         self.selected_vertex: Optional[Vertex] = None
         self.drawing_mode: str = "vertex"  # "vertex" or "edge"
+        self.pick_distance: float = 10.0
+        self._scene: Optional[EdgeScene] = None
+        self._scene_key: Optional[Tuple[int, int]] = None
+        self._vertex_coords = np.empty((0, 2))
+        self._vertex_key: Optional[int] = None
+        self._layer: Optional[QPixmap] = None
+        self._layer_key: Optional[tuple] = None
+        self._layer_counts: Tuple[int, int] = (0, 0)
+        self._layer_detailed = True
+        self._layer_view: Optional[ViewTransform] = None
+        #: World-to-screen mapping; vertices keep their world coordinates
+        self.view = ViewTransform()
+        self._pan_anchor: Optional[QPoint] = None
         self.setMinimumSize(800, 600)
         self.setMouseTracking(True)
         self.setStyleSheet("background-color: white;")
@@ -40,65 +155,248 @@ class HalfEdgeCanvas(QWidget):
         logger.debug(f"[HalfEdgeCanvas] Received {len(vertices)} vertices and {len(edges)} edges")
         self.vertices = vertices
         self.edges = edges
+        self._scene = None
+        self._vertex_key = None
         self.update()
 
-    def paintEvent(self, event) -> None:
-        """Handle paint events."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def add_vertices(self, vertices: List[Vertex]) -> None:
+        """Append streamed vertices and schedule a repaint."""
+        self.vertices.extend(vertices)
+        self.update()
 
-        # Draw edges
-        for edge in self.edges:
-            start = edge.V.getxy()
-            end = edge.S.V.getxy()
-            
-            # Set pen style based on edge type
-            if edge == self.selected_edge or edge.S == self.selected_edge:
-                pen = QPen(QColor(255, 0, 0))  # Red for selected edge
-                pen.setWidth(3)
-            else:
-                pen = QPen(QColor(0, 0, 255))  # Blue for normal edges
-                pen.setWidth(2)
-            
-            painter.setPen(pen)
-            painter.drawLine(
-                int(start[0]), int(start[1]),
-                int(end[0]), int(end[1])
-            )
-
-            # Draw edge ID
-            mid_x = (start[0] + end[0]) / 2
-            mid_y = (start[1] + end[1]) / 2
+    def add_edges(self, edges: List[HalfEdge]) -> None:
+        """Append streamed edges and schedule a repaint."""
+        indexed = self._scene is not None and self._scene_key == (id(self.edges), len(self.edges))
+        self.edges.extend(edges)
+        if indexed:
+            self._scene.extend(edges)
+            self._scene_key = (id(self.edges), len(self.edges))
+        self.update()
+
+    def update_edges(self, edges: List[HalfEdge]) -> None:
+        """
+        Redraw shown edges whose endpoints were changed in place.
+
+        Only the area around the old and new positions of the edges is
+        rendered again and the spatial index is kept; zoomed out, the
+        simplified mesh is rebuilt as well.  The edges must stay in
+        ``self.edges``; replacing items of the list still needs ``set_data``.
+
+        Args:
+            edges: Changed half-edges (either of each pair will do)
+        """
+        old, new = self.edge_scene().refresh(edges)
+        if self._layer is None or not len(old):
+            self.update()
+            return
+        self._update_layer()
+        points = self.view.apply(np.concatenate([old[:, :2], old[:, 2:], new[:, :2], new[:, 2:]]))
+        margin = self._margin(self._layer_detailed)
+        rect = QRectF(QPointF(*(points.min(axis=0) - margin)), QPointF(*(points.max(axis=0) + margin)))
+        self._redraw_layer([rect], self._layer_detailed)
+        self.update(rect.toAlignedRect())
+
+    def edge_scene(self) -> EdgeScene:
+        """
+        Indexed copy of the current edges, rebuilt when they change.
+
+        Replacing or resizing ``self.edges`` is detected; edges changed in
+        place are re-read by ``update_edges``, other edits that keep the list
+        and its length need ``set_data`` to refresh the index.
+        """
+        key = (id(self.edges), len(self.edges))
+        if self._scene is None or self._scene_key != key:
+            self._scene = EdgeScene(self.edges)
+            self._scene_key = key
+        return self._scene
+
+    def vertex_positions(self) -> np.ndarray:
+        """(n, 2) positions of ``self.vertices``, extended as vertices are appended."""
+        n = len(self.vertices)
+        if self._vertex_key != id(self.vertices) or len(self._vertex_coords) > n:
+            self._vertex_coords = vertex_coords(self.vertices)
+            self._vertex_key = id(self.vertices)
+        elif len(self._vertex_coords) < n:
+            added = vertex_coords(self.vertices[len(self._vertex_coords):])
+            self._vertex_coords = np.concatenate([self._vertex_coords, added])
+        return self._vertex_coords
+
+    def set_view(self, view: ViewTransform) -> None:
+        """Show the mesh through another world-to-screen transform."""
+        self.view = view
+        self.update()
+
+    def fit_view(self) -> None:
+        """Center the vertices in the widget, their larger side filling two thirds of it."""
+        self.set_view(ViewTransform.fit(self.vertex_positions(), extent=min(self.width(), self.height()) * 2 / 3,
+                                        screen_center=(self.width() / 2, self.height() / 2)))
+
+    def _world_rect(self, rect: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
+        """World coordinates of a screen rectangle (x0, y0, x1, y1)."""
+        (x0, y0), (x1, y1) = self.view.invert(np.array([rect[:2], rect[2:]]))
+        return x0, y0, x1, y1
+
+    def _is_detailed(self, coords: np.ndarray) -> bool:
+        """Whether the vertices on screen are sparse enough for labels."""
+        visible = points_in_rect(coords, self._world_rect((0, 0, self.width(), self.height())))
+        return len(visible) * DETAIL_SPACING ** 2 <= self.width() * self.height()
+
+    def _margin(self, detailed: bool) -> float:
+        """How far circles and labels reach beyond the items they belong to, in pixels."""
+        if not detailed:
+            return VERTEX_RADIUS
+        widest = '8' * len(str(max(HalfEdge.count, Vertex.count)))
+        return VERTEX_RADIUS + 10 + QFontMetrics(QFont('Arial', 10, QFont.Weight.Bold)).horizontalAdvance(widest)
+
+    def _pan_offset(self) -> Optional[Tuple[int, int]]:
+        """Whole-pixel shift from the layer's view to the current one, if that is all that changed."""
+        old, new = self._layer_view, self.view
+        if old is None or old.scale != new.scale or old.center != new.center:
+            return None
+        dx = new.screen_center[0] - old.screen_center[0]
+        dy = new.screen_center[1] - old.screen_center[1]
+        ratio = self._layer.devicePixelRatio()
+        if dx * ratio != round(dx * ratio) or dy * ratio != round(dy * ratio) or \
+                abs(dx) >= self.width() or abs(dy) >= self.height():
+            return None
+        return int(dx), int(dy)
+
+    def _update_layer(self) -> None:
+        """
+        Bring the cached mesh image up to date.
+
+        The layer remembers the view and how many edges and vertices it
+        shows.  Items appended since are drawn by re-rendering just their
+        bounding box, and a pan scrolls the layer and renders only the
+        uncovered strips; ``update_edges`` handles edges edited in place.
+        Anything else (new lists, removals, resizes, every zoom step, a
+        change of detail level) re-renders the whole layer.
+        """
+        ratio = self.devicePixelRatioF()
+        key = (id(self.edges), id(self.vertices), self.width(), self.height(), ratio)
+        scene = self.edge_scene()
+        coords = self.vertex_positions()
+        n_edges, n_vertices = self._layer_counts
+        if self._layer is not None and self._layer_key == key and self._layer_view == self.view and \
+                (n_edges, n_vertices) == (len(scene), len(coords)):
+            return
+
+        detailed = self._is_detailed(coords)
+        offset = None
+        if self._layer is not None and self._layer_key == key and detailed == self._layer_detailed and \
+                n_edges <= len(scene) and n_vertices <= len(coords):
+            offset = (0, 0) if self._layer_view == self.view else self._pan_offset()
+        if offset is None:
+            self._layer = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            self._layer.setDevicePixelRatio(ratio)
+            rects = [QRectF(0, 0, self.width(), self.height())]
+        else:
+            dx, dy = offset
+            rects = []
+            if offset != (0, 0):
+                self._layer.scroll(int(dx * ratio), int(dy * ratio), self._layer.rect())
+                w, h = self.width(), self.height()
+                if dx:
+                    rects.append(QRectF(0 if dx > 0 else w + dx, 0, abs(dx), h))
+                if dy:
+                    rects.append(QRectF(0, 0 if dy > 0 else h + dy, w, abs(dy)))
+            if (n_edges, n_vertices) != (len(scene), len(coords)):
+                # Appended items: redraw around them
+                points = self.view.apply(np.concatenate([
+                    scene.segments[n_edges:, :2], scene.segments[n_edges:, 2:], coords[n_vertices:]]))
+                lo = points.min(axis=0) - self._margin(detailed)
+                hi = points.max(axis=0) + self._margin(detailed)
+                rects.append(QRectF(QPointF(*lo), QPointF(*hi)))
+
+        self._redraw_layer(rects, detailed)
+        self._layer_key = key
+        self._layer_view = self.view
+        self._layer_counts = (len(scene), len(coords))
+        self._layer_detailed = detailed
+
+    def _redraw_layer(self, rects: List[QRectF], detailed: bool) -> None:
+        """Clear some areas of the cached mesh image and draw them again."""
+        painter = QPainter(self._layer)
+        for rect in rects:
+            painter.setClipRect(rect)
+            painter.fillRect(rect, QColor(255, 255, 255))
+            self._render_mesh(painter, rect, detailed)
+        painter.end()
+        logger.debug(f"[HalfEdgeCanvas] Rendered {len(rects)} layer area(s)")
+
+    def _render_mesh(self, painter: QPainter, clip: QRectF, detailed: bool) -> None:
+        """Draw the edges and vertices overlapping ``clip``."""
+        margin = self._margin(detailed)
+        rect = self._world_rect((clip.left() - margin, clip.top() - margin,
+                                 clip.right() + margin, clip.bottom() + margin))
+        view = self.view
+        scene = self.edge_scene()
+        coords = self.vertex_positions()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, detailed)
+        level = None if detailed else scene.detail_level(pixel_size=1 / view.scale)
+        if level is not None:
+            # Zoomed out: draw the simplified mesh plus any edges streamed
+            # in since it was built
+            segments = np.concatenate([level.segments[segments_in_rect(level.segments, rect)],
+                                       scene.segments[scene.tail_visible(rect)]])
+            painter.setPen(QPen(QColor(0, 0, 255), 1))
+            painter.strokePath(_lines_path(view.apply_segments(segments)), painter.pen())
+            painter.setPen(QPen(QColor(0, 0, 0), 3))
+            painter.drawPoints(_polygon(one_per_pixel(view.apply(coords[points_in_rect(coords, rect)]))))
+            return
+
+        edges = scene.visible(rect)
+        vertices = points_in_rect(coords, rect)
+        screen = view.apply(coords[vertices])
+
+        # Draw edges as one batch
+        painter.setPen(QPen(QColor(0, 0, 255), 2 if detailed else 1))  # Blue for normal edges
+        painter.strokePath(_lines_path(view.apply_segments(scene.segments[edges])), painter.pen())
+
+        if detailed:
+            # Draw edge IDs
             painter.setPen(QPen(QColor(0, 128, 0)))  # Dark green for edge IDs
             painter.setFont(QFont('Arial', 8, QFont.Weight.Bold))
-            painter.drawText(
-                int(mid_x),
-                int(mid_y),
-                str(edge.id)
-            )
-
-        # Draw vertices
-        for vertex in self.vertices:
-            pos = vertex.getxy()
-            
-            # Set brush color based on selection
-            if vertex == self.selected_vertex:
-                painter.setBrush(QColor(255, 0, 0))  # Red for selected vertex
-            else:
-                painter.setBrush(QColor(255, 255, 255))  # White for normal vertices
-            
-            # Draw vertex circle
+            for i, (x, y) in zip(edges.tolist(), view.apply(scene.midpoints(edges)).tolist()):
+                painter.drawText(int(x), int(y), str(scene.edges[i].id))
+
+            # Draw vertex circles as one path
+            path = QPainterPath()
+            for x, y in screen.tolist():
+                path.addEllipse(QPointF(x, y), VERTEX_RADIUS, VERTEX_RADIUS)
             painter.setPen(QPen(QColor(0, 0, 0)))
-            painter.drawEllipse(QPointF(pos[0], pos[1]), 5, 5)
-            
-            # Draw vertex ID
+            painter.setBrush(QColor(255, 255, 255))  # White for normal vertices
+            painter.drawPath(path)
+
+            # Draw vertex IDs
             painter.setPen(QPen(QColor(128, 0, 128)))  # Purple for vertex IDs
             painter.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            painter.drawText(
-                int(pos[0] + 10),
-                int(pos[1] - 10),
-                str(vertex.Vertex_id)
-            )
+            for i, (x, y) in zip(vertices.tolist(), screen.tolist()):
+                painter.drawText(int(x + 10), int(y - 10), str(self.vertices[i].Vertex_id))
+        else:
+            painter.setPen(QPen(QColor(0, 0, 0), 3))
+            painter.drawPoints(_polygon(screen))
+
+    def paintEvent(self, event) -> None:
+        """Copy the cached mesh image and draw the selection over it."""
+        self._update_layer()
+        painter = QPainter(self)
+        exposed = QRectF(event.rect())
+        painter.drawPixmap(exposed, self._layer, QRectF(
+            exposed.topLeft() * self._layer.devicePixelRatio(),
+            exposed.size() * self._layer.devicePixelRatio()))
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self.selected_edge is not None:
+            start, end = self.view.apply([self.selected_edge.V.getxy(), self.selected_edge.S.V.getxy()])
+            painter.setPen(QPen(QColor(255, 0, 0), 3))  # Red for selected edge
+            painter.drawLine(QPointF(*start), QPointF(*end))
+
+        if self.selected_vertex is not None:
+            center = self.view.apply([self.selected_vertex.getxy()])[0]
+            painter.setPen(QPen(QColor(0, 0, 0)))
+            painter.setBrush(QColor(255, 0, 0))  # Red for selected vertex
+            painter.drawEllipse(QPointF(*center), VERTEX_RADIUS, VERTEX_RADIUS)
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse press events."""
@@ -107,32 +405,56 @@ class HalfEdgeCanvas(QWidget):
             
             if self.drawing_mode == "vertex":
                 # Add new vertex
-                vertex = Vertex(pos[0], pos[1])
-                self.vertices.append(vertex)
+                x, y = self.view.invert([pos])[0]
+                vertex = Vertex(float(x), float(y))
+                self.add_vertices([vertex])
                 self.vertex_added.emit(vertex)
-                self.update()
             else:
                 # Select nearest edge
                 self.select_nearest_edge(pos)
+        elif event.button() in (Qt.MouseButton.MiddleButton, Qt.MouseButton.RightButton):
+            self._pan_anchor = event.position().toPoint()
+
+    def mouseMoveEvent(self, event) -> None:
+        """Pan while the middle or right button is held."""
+        if self._pan_anchor is not None:
+            pos = event.position().toPoint()
+            delta = pos - self._pan_anchor
+            self._pan_anchor = pos
+            self.set_view(self.view.panned(delta.x(), delta.y()))
+
+    def mouseReleaseEvent(self, event) -> None:
+        """Stop panning."""
+        if event.button() in (Qt.MouseButton.MiddleButton, Qt.MouseButton.RightButton):
+            self._pan_anchor = None
+
+    def wheelEvent(self, event) -> None:
+        """Zoom about the mouse cursor."""
+        factor = ZOOM_STEP ** (event.angleDelta().y() / 120)
+        if factor != 1:
+            self.set_view(self.view.zoomed(factor, (event.position().x(), event.position().y())))
 
     def select_nearest_edge(self, point: Tuple[float, float]) -> None:
-        """Select the edge nearest to the given point."""
-        min_dist = float('inf')
-        nearest_edge = None
-        
-        for edge in self.edges:
-            start = edge.V.getxy()
-            end = edge.S.V.getxy()
-            dist = self.point_to_line_distance(point, start, end)
-            
-            if dist < min_dist:
-                min_dist = dist
-                nearest_edge = edge
-        
-        if min_dist < 10:  # Threshold for selection
-            self.selected_edge = nearest_edge
+        """Select the edge nearest to the given screen point."""
+        world = tuple(self.view.invert([point])[0])
+        nearest_edge = self.edge_scene().nearest(world, self.pick_distance / self.view.scale)
+        if nearest_edge is not None:
+            self.set_selected_edge(nearest_edge)
             self.edge_selected.emit(nearest_edge)
-            self.update()
+
+    def _edge_rect(self, edge: Optional[HalfEdge]) -> QRect:
+        """Widget area covered by the selection overlay of an edge."""
+        if edge is None:
+            return QRect()
+        (x1, y1), (x2, y2) = self.view.apply([edge.V.getxy(), edge.S.V.getxy()])
+        rect = QRectF(QPointF(min(x1, x2), min(y1, y2)), QPointF(max(x1, x2), max(y1, y2)))
+        return rect.adjusted(-4, -4, 4, 4).toAlignedRect()
+
+    def set_selected_edge(self, edge: Optional[HalfEdge]) -> None:
+        """Select an edge, repainting only around the old and new selection."""
+        dirty = self._edge_rect(self.selected_edge).united(self._edge_rect(edge))
+        self.selected_edge = edge
+        self.update(dirty)
 
     def point_to_line_distance(self, point: Tuple[float, float],
                              line_start: Tuple[float, float],
@@ -176,6 +498,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Half-Edge Structure Visualizer")
         self.setMinimumSize(1200, 800)
+        self.loader = AsyncMeshLoader(self)
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -195,6 +518,15 @@ class MainWindow(QMainWindow):
         control_panel.setMaximumWidth(300)
         layout.addWidget(control_panel)
 
+        open_btn = QPushButton("Open File...")
+        open_btn.clicked.connect(self.open_file)
+        control_layout.addWidget(open_btn)
+
+        fit_btn = QPushButton("Fit View")
+        fit_btn.setToolTip("Wheel zooms, middle or right drag pans")
+        fit_btn.clicked.connect(self.canvas.fit_view)
+        control_layout.addWidget(fit_btn)
+
         # Add mode selection
         mode_label = QLabel("Drawing Mode:")
         control_layout.addWidget(mode_label)
@@ -246,6 +578,54 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready")
 
+    def open_file(self) -> None:
+        """Ask for a file and load it."""
+        filename, _ = QFileDialog.getOpenFileName(self, "Open Mesh", "", "OBJ files (*.obj);;All files (*)")
+        if filename:
+            self.load_file(filename)
+
+    def load_file(self, filename: str) -> None:
+        """
+        Load a file in the background, drawing it as it arrives.
+
+        The window stays responsive; a load in progress is cancelled.
+        """
+        self.canvas.set_data([], [])
+        self.canvas.selected_edge = None
+        self.canvas.selected_vertex = None
+        # Keep file coordinates in the mesh; the view maps them to the screen
+        worker = self.loader.start(filename, fit_to_view=False)
+        worker.vertices_ready.connect(self.on_vertices_loaded)
+        worker.edges_ready.connect(self.canvas.add_edges)
+        worker.progress.connect(self.on_load_progress)
+        worker.loaded.connect(self.on_file_loaded)
+        worker.failed.connect(self.on_load_failed)
+        self.statusBar.showMessage(f"Loading {filename}...")
+
+    def on_vertices_loaded(self, vertices: List[Vertex]) -> None:
+        """Show the streamed vertices and fit the view to them."""
+        self.canvas.add_vertices(vertices)
+        self.canvas.fit_view()
+
+    def on_load_progress(self, done: int, total: int) -> None:
+        """Report streamed edges."""
+        self.statusBar.showMessage(f"Loading: {done}/{total} edges")
+
+    def on_file_loaded(self, mesh) -> None:
+        """Report a finished load."""
+        self.statusBar.showMessage(f"Loaded {mesh.n_vertices} vertices and {mesh.n_half_edges // 2} edges")
+
+    def on_load_failed(self, message: str) -> None:
+        """Report a failed load."""
+        logger.error(f"[MainWindow] {message}")
+        self.statusBar.showMessage(message)
+        QMessageBox.critical(self, "Error", message)
+
+    def closeEvent(self, event) -> None:
+        """Stop a load in progress before closing."""
+        self.loader.cancel()
+        super().closeEvent(event)
+
     def change_mode(self, mode: str) -> None:
         """Change the drawing mode."""
         self.canvas.set_drawing_mode("vertex" if mode == "Add Vertex" else "edge")
@@ -255,9 +635,9 @@ class MainWindow(QMainWindow):
         """Add a random vertex to the canvas."""
         x = random.randint(50, self.canvas.width() - 50)
         y = random.randint(50, self.canvas.height() - 50)
-        vertex = Vertex(x, y)
-        self.canvas.vertices.append(vertex)
-        self.canvas.update()
+        wx, wy = self.canvas.view.invert([(x, y)])[0]
+        vertex = Vertex(float(wx), float(wy))
+        self.canvas.add_vertices([vertex])
         self.statusBar.showMessage(f"Added vertex {vertex.Vertex_id} at ({x}, {y})")
 
     def perform_triangulation(self) -> None:
@@ -272,19 +652,17 @@ class MainWindow(QMainWindow):
             new_edges = delaunay.triangulate()
             
             # Update canvas
-            self.canvas.edges = new_edges
-            self.canvas.update()
+            self.canvas.set_data(self.canvas.vertices, new_edges)
             self.statusBar.showMessage(f"Triangulation completed with {len(new_edges)} edges")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Triangulation failed: {str(e)}")
 
     def clear_all(self) -> None:
         """Clear all vertices and edges."""
-        self.canvas.vertices.clear()
-        self.canvas.edges.clear()
+        self.loader.cancel()
         self.canvas.selected_edge = None
         self.canvas.selected_vertex = None
-        self.canvas.update()
+        self.canvas.set_data([], [])
         self.statusBar.showMessage("Cleared all data")
 
     def on_vertex_added(self, vertex: Vertex) -> None:
@@ -300,22 +678,19 @@ class MainWindow(QMainWindow):
     def next_edge(self) -> None:
         """Navigate to the next edge."""
         if self.canvas.selected_edge:
-            self.canvas.selected_edge = self.canvas.selected_edge.Next
-            self.canvas.update()
+            self.canvas.set_selected_edge(self.canvas.selected_edge.Next)
             self.statusBar.showMessage(f"Selected edge: {self.canvas.selected_edge.id}")
 
     def prev_edge(self) -> None:
         """Navigate to the previous edge."""
         if self.canvas.selected_edge:
-            self.canvas.selected_edge = self.canvas.selected_edge.Prev
-            self.canvas.update()
+            self.canvas.set_selected_edge(self.canvas.selected_edge.Prev)
             self.statusBar.showMessage(f"Selected edge: {self.canvas.selected_edge.id}")
 
     def sym_edge(self) -> None:
         """Navigate to the symmetric edge."""
         if self.canvas.selected_edge:
-            self.canvas.selected_edge = self.canvas.selected_edge.Sym()
-            self.canvas.update()
+            self.canvas.set_selected_edge(self.canvas.selected_edge.Sym())
             self.statusBar.showMessage(f"Selected edge: {self.canvas.selected_edge.id}")
 
 def run_visualization(vertices: List[Vertex], edges: List[HalfEdge]) -> None:
@@ -324,4 +699,12 @@ def run_visualization(vertices: List[Vertex], edges: List[HalfEdge]) -> None:
     window = MainWindow()
     window.canvas.set_data(vertices, edges)
     window.show()
-    app.exec() 
\ No newline at end of file
+    app.exec() 
+
+def run_visualization_from_file(filename: str) -> None:
+    """Show the window right away and load ``filename`` in the background."""
+    app = QApplication([])
+    window = MainWindow()
+    window.show()
+    window.load_file(filename)
+    app.exec()
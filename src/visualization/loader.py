@@ -0,0 +1,184 @@
+"""
+Background loading of mesh files for the GUI.
+
+Parsing and building a large file takes seconds, during which a synchronous
+loader freezes the window.  ``MeshLoadWorker`` does the work on a ``QThread``
+and streams the result through signals: the vertices as soon as the file is
+parsed, then the edges in chunks, so the canvas can draw the mesh while it
+is still being built.
+"""
+import logging
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+
+from ..core.half_edge_arrays import HalfEdgeArrays
+from ..core.half_edge_builder import HalfEdgeBuilder
+from ..core.half_edge_ds import Vertex
+from ..utils.data_io import parse_obj, faces_to_edges
+from .view_transform import ViewTransform
+
+logger = logging.getLogger(__name__)
+
+# Edges per ``edges_ready`` signal
+EDGE_CHUNK_SIZE = 1 << 14
+
+
+def load_mesh(filename: str) -> HalfEdgeArrays:
+    """
+    Parse a file once into a mesh snapshot with the coordinates as stored.
+
+    Args:
+        filename: Path to the file containing the data
+
+    Returns:
+        HalfEdgeArrays of the file's vertices and face edges
+    """
+    coords, face_vertices, face_sizes = parse_obj(filename)
+    edges = faces_to_edges(face_vertices, face_sizes, len(coords))
+    return HalfEdgeBuilder().add_vertices(coords).add_edges(edges).build_arrays()
+
+
+def screen_vertices(mesh: HalfEdgeArrays, fit_to_view: bool = False) -> List[Vertex]:
+    """
+    Create the vertices to draw, carrying the ids of the mesh.
+
+    The snapshot keeps the file coordinates; only the drawn vertices are
+    moved into screen space.
+
+    Args:
+        mesh: Loaded mesh
+        fit_to_view: Move the vertices through ``ViewTransform.fit`` so the
+            mesh is centered in an 800x600 window; by default they keep
+            the file coordinates and drawing applies the transform
+
+    Returns:
+        One vertex per mesh vertex, in index order
+    """
+    coords = ViewTransform.fit(mesh.coords).apply(mesh.coords) if fit_to_view else mesh.coords
+    return mesh.make_vertices(coords)
+
+
+class MeshLoadWorker(QObject):
+    """Loads a mesh file off the GUI thread and streams the objects.
+
+    Signals are emitted in order: ``vertices_ready`` once, ``edges_ready``
+    per chunk (with ``progress``), then ``loaded`` with the snapshot.  Any
+    error ends the load with ``failed`` instead.
+    """
+
+    vertices_ready = pyqtSignal(list)
+    edges_ready = pyqtSignal(list)
+    progress = pyqtSignal(int, int)
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, filename: str, fit_to_view: bool = False,
+                 chunk_size: int = EDGE_CHUNK_SIZE):
+        """
+        Args:
+            filename: Path to the file containing the data
+            fit_to_view: See ``screen_vertices``
+            chunk_size: Edges per ``edges_ready`` signal
+        """
+        super().__init__()
+        self.filename = filename
+        self.fit_to_view = fit_to_view
+        self.chunk_size = chunk_size
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop after the current step; no further signals are emitted."""
+        self._cancelled = True
+
+    def run(self) -> None:
+        """Load the file; connect to ``QThread.started``."""
+        try:
+            mesh = load_mesh(self.filename)
+            if self._cancelled:
+                return
+            vertices = screen_vertices(mesh, self.fit_to_view)
+            self.vertices_ready.emit(vertices)
+
+            total = mesh.n_half_edges // 2
+            done = 0
+            for chunk in mesh.iter_half_edges(vertices, self.chunk_size):
+                if self._cancelled:
+                    return
+                done += len(chunk)
+                self.edges_ready.emit(chunk)
+                self.progress.emit(done, total)
+        except FileNotFoundError:
+            self.failed.emit(f"File {self.filename} not found")
+            return
+        except Exception as e:
+            logger.exception(f"[MeshLoadWorker] Loading {self.filename} failed")
+            self.failed.emit(f"Error reading file: {e}")
+            return
+        logger.debug(f"[MeshLoadWorker] Loaded {mesh.n_vertices} vertices and {total} edges")
+        self.loaded.emit(mesh)
+
+
+class AsyncMeshLoader(QObject):
+    """Runs one ``MeshLoadWorker`` at a time on its own thread.
+
+    Example:
+        >>> loader = AsyncMeshLoader()
+        >>> worker = loader.start('data/graph.obj')
+        >>> worker.edges_ready.connect(canvas.add_edges)
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[MeshLoadWorker] = None
+
+    def start(self, filename: str, fit_to_view: bool = False,
+              chunk_size: int = EDGE_CHUNK_SIZE) -> MeshLoadWorker:
+        """
+        Start loading ``filename``, cancelling any load in progress.
+
+        The thread starts once control returns to the event loop, so
+        signals connected to the returned worker right after this call are
+        not missed; they are delivered on the caller's thread.
+
+        Returns:
+            The worker doing the load
+        """
+        self.cancel()
+        thread = QThread()
+        worker = MeshLoadWorker(filename, fit_to_view, chunk_size)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.loaded.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        self._thread, self._worker = thread, worker
+        QTimer.singleShot(0, lambda: self._start_thread(thread))
+        return worker
+
+    def _start_thread(self, thread: QThread) -> None:
+        # Skip loads cancelled or replaced meanwhile, and threads already started
+        if thread is self._thread and not thread.isRunning() and not thread.isFinished():
+            thread.start()
+
+    def cancel(self) -> None:
+        """Cancel the current load and wait for its thread to stop."""
+        if self._worker is not None:
+            self._worker.cancel()
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+        self._thread = self._worker = None
+
+    def is_running(self) -> bool:
+        """Whether a load is in progress."""
+        return self._thread is not None and not self._thread.isFinished()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the current load finishes; mainly for scripts and tests."""
+        if self._thread is None:
+            return True
+        self._start_thread(self._thread)
+        if msecs < 0:
+            return self._thread.wait()
+        return self._thread.wait(msecs)
@@ -0,0 +1,141 @@
+"""
+Level of detail for drawing large meshes zoomed out.
+
+When many edges fall within one pixel, drawing all of them is wasted work.
+``LevelOfDetail`` precomputes coarser versions of an edge set by vertex
+clustering: endpoints are snapped to square cells, every cell becomes one
+point at the mean of its endpoints, and edges are remapped to cells,
+dropping those inside a single cell and duplicates.  Each level doubles the
+cell size of the previous one and is clustered from it, so the whole
+hierarchy costs about as much as its finest level.
+"""
+import logging
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# A level is drawn when its cells are at most this many pixels wide
+LOD_PIXELS = 3.0
+# Coarsening stops once a level has this few edges
+MIN_LEVEL_EDGES = 1024
+
+
+@dataclass(frozen=True, eq=False)
+class DetailLevel:
+    """One simplified version of an edge set.
+
+    Attributes:
+        cell_size: Side of the clustering cells, in world units
+        points: (k, 2) cluster positions
+        edges: (m, 2) pairs of cluster indices
+    """
+    cell_size: float
+    points: np.ndarray
+    edges: np.ndarray
+
+    @cached_property
+    def segments(self) -> np.ndarray:
+        """(m, 4) edge segments."""
+        return np.hstack([self.points[self.edges[:, 0]], self.points[self.edges[:, 1]]])
+
+
+def _labels(key: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Dense labels 0..k-1 of non-negative integer keys, in key order."""
+    size = int(key.max()) + 1
+    if size <= 4 * len(key):
+        # Few possible keys: label the occupied ones without sorting
+        occupied = np.bincount(key, minlength=size) > 0
+        label = np.cumsum(occupied) - 1
+        return label[key], int(occupied.sum())
+    order = np.argsort(key)
+    ordered = key[order]
+    new = np.empty(len(key), dtype=bool)
+    new[0] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=new[1:])
+    inverse = np.empty(len(key), dtype=np.int64)
+    inverse[order] = np.cumsum(new) - 1
+    return inverse, int(new.sum())
+
+
+def _cluster(points: np.ndarray, weights: np.ndarray, edges: np.ndarray,
+             origin: np.ndarray, cell_size: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge the points of every cell into their weighted mean.
+
+    Returns:
+        Tuple of (cluster positions, cluster weights, remapped unique edges)
+    """
+    cells = np.floor((points - origin) / cell_size).astype(np.int64)
+    inverse, k = _labels(cells[:, 1] * (int(cells[:, 0].max()) + 1) + cells[:, 0])
+    total = np.bincount(inverse, weights, minlength=k)
+    merged = np.column_stack([np.bincount(inverse, weights * points[:, 0], minlength=k),
+                              np.bincount(inverse, weights * points[:, 1], minlength=k)]) / total[:, None]
+
+    # np.unique is much slower than a plain sort here
+    pairs = np.sort(inverse[edges], axis=1)
+    keys = pairs[:, 0] * k + pairs[:, 1]
+    keys = np.sort(keys[pairs[:, 0] != pairs[:, 1]])
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+    return merged, total, np.column_stack([keys // k, keys % k])
+
+
+class LevelOfDetail:
+    """Hierarchy of vertex-clustered simplifications of a set of segments.
+
+    Example:
+        >>> lod = LevelOfDetail(segments)
+        >>> level = lod.select(pixel_size=1 / view.scale)
+        >>> draw(level.segments if level is not None else segments)
+    """
+
+    def __init__(self, segments: np.ndarray, base_cell: Optional[float] = None):
+        """
+        Build the levels.
+
+        Args:
+            segments: (n, 4) segments as (x1, y1, x2, y2)
+            base_cell: Cell size of the finest level (default: the mean
+                segment extent)
+        """
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        self.levels: List[DetailLevel] = []
+        if len(segments) <= MIN_LEVEL_EDGES:
+            return
+        points = segments.reshape(-1, 2)
+        if base_cell is None:
+            base_cell = float(np.abs(segments[:, 2:] - segments[:, :2]).max(axis=1).mean())
+        origin = points.min(axis=0)
+        weights = np.ones(len(points))
+        edges = np.arange(len(points)).reshape(-1, 2)
+        cell_size = max(base_cell, 1e-12)
+        drawn = len(segments)
+        while len(edges) > MIN_LEVEL_EDGES:
+            points, weights, edges = _cluster(points, weights, edges, origin, cell_size)
+            # A level must save a good part of the drawing to be worth keeping
+            if len(edges) <= 0.75 * drawn:
+                self.levels.append(DetailLevel(cell_size, points, edges))
+                drawn = len(edges)
+            cell_size *= 2
+        logger.debug(f"[LevelOfDetail] {len(self.levels)} levels from {len(segments)} segments: "
+                     f"{[len(level.edges) for level in self.levels]} edges")
+
+    def select(self, pixel_size: float) -> Optional[DetailLevel]:
+        """
+        Coarsest level whose cells are at most ``LOD_PIXELS`` pixels wide.
+
+        Args:
+            pixel_size: World units per screen pixel
+
+        Returns:
+            The level to draw, or None when the full mesh should be drawn
+        """
+        chosen = None
+        for level in self.levels:
+            if level.cell_size > LOD_PIXELS * pixel_size:
+                break
+            chosen = level
+        return chosen
@@ -0,0 +1,219 @@
+"""
+Matplotlib visualization of Half-Edge meshes.
+
+The mesh is handed to Matplotlib as whole arrays: all edges form one
+``(n_edges, 2, 2)`` segments array in a single ``LineCollection`` and the
+faces one ``tripcolor`` call, so a large mesh is one draw call instead of
+one per edge.  Paths and the selection are separate collections on top,
+updated in place, so changing them does not touch the mesh.
+"""
+import logging
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+
+from ..algorithms.pathfinding import PathResult
+from ..algorithms.spatial_index import EdgeGrid
+from ..core.half_edge_arrays import HalfEdgeArrays
+from ..core.half_edge_ds import HalfEdge
+
+logger = logging.getLogger(__name__)
+
+# Margin around the mesh, as a fraction of its size along each axis
+LIMIT_MARGIN = 0.02
+
+
+def mesh_segments(arrays: HalfEdgeArrays, half_edges: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Segments of some half-edges, as ``LineCollection`` takes them.
+
+    Args:
+        arrays: Mesh snapshot
+        half_edges: Half-edge indices (default: one per undirected edge)
+
+    Returns:
+        (n, 2, 2) array of (origin, target) positions
+    """
+    if half_edges is None:
+        half_edges = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+    half_edges = np.asarray(half_edges, dtype=np.int64)
+    return np.stack([arrays.coords[arrays.origin[half_edges]], arrays.coords[arrays.target[half_edges]]], axis=1)
+
+
+def path_segments(paths: Sequence[PathResult]) -> np.ndarray:
+    """(n, 2, 2) segments of the steps of some paths."""
+    parts = [np.stack([p.points[:-1], p.points[1:]], axis=1) for p in paths if len(p.points) > 1]
+    return np.concatenate(parts) if parts else np.empty((0, 2, 2))
+
+
+class MatplotlibVisualizer:
+    """Draws a mesh, paths and selected edges on a Matplotlib ``Axes``.
+
+    Example:
+        >>> vis = MatplotlibVisualizer()
+        >>> vis.draw_mesh(arrays, face_values=arrays.coords[:, 0])
+        >>> vis.draw_path(search.path_to(target))
+        >>> vis.save('mesh.png')
+    """
+
+    def __init__(self, ax: Optional[Axes] = None):
+        """
+        Initialize the visualizer.
+
+        Args:
+            ax: Axes to draw on (default: a new pyplot figure)
+        """
+        if ax is None:
+            _, ax = plt.subplots()
+        self.ax = ax
+        self.ax.set_aspect('equal')
+        self.arrays: Optional[HalfEdgeArrays] = None
+        self.edges: Optional[LineCollection] = None
+        self.faces = None
+        self._path_list: List[PathResult] = []
+        self.paths = self._overlay(color='orange', linewidth=3, zorder=3)
+        self.selection = self._overlay(color='brown', linewidth=5, zorder=4)
+        self.selected = np.empty(0, dtype=np.int64)
+        self._grid: Optional[EdgeGrid] = None
+
+    def _overlay(self, **style) -> LineCollection:
+        collection = LineCollection(np.empty((0, 2, 2)), **style)
+        self.ax.add_collection(collection)
+        return collection
+
+    def draw_mesh(self, arrays: HalfEdgeArrays, edge_color='tab:blue', linewidth: float = 0.5,
+                  face_values: Optional[np.ndarray] = None, cmap: str = 'viridis') -> None:
+        """
+        Draw (or replace) the mesh.
+
+        Args:
+            arrays: Mesh snapshot
+            edge_color: Color of the edges, or None to hide them
+            linewidth: Edge width in points
+            face_values: Optional values to color the faces by: one per
+                triangle of ``arrays.triangles()`` (flat) or one per vertex
+                (interpolated)
+            cmap: Colormap of ``face_values``
+        """
+        self.arrays = arrays
+        self._grid = None
+        self.select_edges([])
+        segments = mesh_segments(arrays)
+        if self.edges is None:
+            self.edges = LineCollection(segments, linewidths=linewidth, zorder=2)
+            self.ax.add_collection(self.edges)
+        else:
+            self.edges.set_segments(segments)
+            self.edges.set_linewidth(linewidth)
+        self.edges.set_visible(edge_color is not None)
+        if edge_color is not None:
+            self.edges.set_color(edge_color)
+
+        if self.faces is not None:
+            self.faces.remove()
+            self.faces = None
+        triangles = arrays.triangles() if face_values is not None else None
+        # tripcolor cannot color a mesh without triangles
+        if triangles is not None and len(triangles):
+            values = np.asarray(face_values, dtype=float)
+            x, y = arrays.coords[:, 0], arrays.coords[:, 1]
+            if len(values) == arrays.n_vertices:
+                self.faces = self.ax.tripcolor(x, y, triangles, values, shading='gouraud', cmap=cmap, zorder=1)
+            else:
+                self.faces = self.ax.tripcolor(x, y, triangles, facecolors=values, cmap=cmap, zorder=1)
+
+        self._fit_limits(arrays.coords)
+        logger.debug(f"[MatplotlibVisualizer] Drew {len(segments)} edges")
+
+    def draw_edges(self, edges: Sequence[HalfEdge], **kwargs) -> None:
+        """Draw a Half-Edge object graph; see ``draw_mesh`` for the options."""
+        self.draw_mesh(HalfEdgeArrays.from_half_edges(edges), **kwargs)
+
+    def draw_frame(self, frame) -> None:
+        """
+        Show a frame of ``TriangulationPlayer``: all edges after the frame.
+
+        Args:
+            frame: ``playback.Frame`` to show
+        """
+        segments = frame.segments().reshape(-1, 2, 2)
+        if self.edges is None:
+            self.edges = LineCollection(segments, linewidths=0.5, color='tab:blue', zorder=2)
+            self.ax.add_collection(self.edges)
+            self._fit_limits(frame.player.log.coords[:frame.player.log.n_points])
+        else:
+            self.edges.set_segments(segments)
+        self.ax.figure.canvas.draw_idle()
+        self.ax.figure.canvas.flush_events()
+
+    def _fit_limits(self, coords: np.ndarray) -> None:
+        """Set the axis limits around some points, with a margin.
+
+        An axis along which the points do not extend gets the margin of the
+        other axis, or of a unit size, so its limits never coincide.
+        """
+        if not len(coords):
+            return
+        lo, hi = coords.min(axis=0), coords.max(axis=0)
+        size = hi - lo
+        pad = np.where(size > 0, size, size.max() or 1.0) * LIMIT_MARGIN
+        self.ax.set_xlim(lo[0] - pad[0], hi[0] + pad[0])
+        self.ax.set_ylim(lo[1] - pad[1], hi[1] + pad[1])
+
+    def draw_path(self, path: PathResult) -> None:
+        """Add a path returned by ``SearchResult.path_to`` to the path overlay."""
+        self._path_list.append(path)
+        self.paths.set_segments(path_segments(self._path_list))
+
+    def clear_paths(self) -> None:
+        """Remove all paths."""
+        self._path_list = []
+        self.paths.set_segments(np.empty((0, 2, 2)))
+
+    def select_edges(self, half_edges: Sequence[int]) -> None:
+        """
+        Highlight some half-edges of the mesh, replacing the current selection.
+
+        Args:
+            half_edges: Half-edge indices into the drawn ``arrays``
+        """
+        self.selected = np.asarray(half_edges, dtype=np.int64).reshape(-1)
+        if self.arrays is None or not len(self.selected):
+            self.selection.set_segments(np.empty((0, 2, 2)))
+        else:
+            self.selection.set_segments(mesh_segments(self.arrays, self.selected))
+
+    def select_nearest_edge(self, point: Tuple[float, float], max_distance: float = math.inf) -> int:
+        """
+        Select the edge nearest to a point, e.g. a mouse click in data coordinates.
+
+        Args:
+            point: (x, y) position
+            max_distance: Ignore edges farther than this
+
+        Returns:
+            The selected half-edge index, or -1 (clearing the selection)
+        """
+        if self.arrays is None:
+            return -1
+        if self._grid is None:
+            self._grid = EdgeGrid.from_arrays(self.arrays)
+        half_edge, _ = self._grid.nearest(point, max_distance=max_distance)
+        self.select_edges([half_edge] if half_edge >= 0 else [])
+        return half_edge
+
+    def save(self, filename: str, **kwargs) -> None:
+        """Write the figure to a file (any format ``savefig`` supports)."""
+        self.ax.figure.savefig(filename, **kwargs)
+
+    def show(self) -> None:
+        """Show the figure in a window."""
+        plt.show()
+
+    def close(self) -> None:
+        """Release the figure."""
+        plt.close(self.ax.figure)
@@ -0,0 +1,230 @@
+"""
+Frame-budgeted playback of a recorded triangulation.
+
+Drawing every step while the triangulator runs slows it down to the speed
+of the drawing.  Instead ``IncrementalDelaunay(record=True)`` logs its steps
+at full speed and ``TriangulationPlayer`` replays the log afterwards: the
+events are merged into frames of net edge changes (an edge created and
+flipped away within one frame is never drawn), and ``play`` advances the
+log at a fixed event rate, so a slow visualizer gets fewer, larger frames
+rather than slowing playback down.
+
+Any visualizer can be driven through a callable taking a ``Frame``; the
+``draw_frame`` methods of ``TurtleVisualizer`` and ``MatplotlibVisualizer``
+fit directly.
+"""
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Set
+
+import numpy as np
+
+from ..algorithms.incremental_delaunay import EventKind, EventLog
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Frame:
+    """Net change of the triangulation over some consecutive events.
+
+    Attributes:
+        index: Frame number
+        start: First event of the frame
+        stop: One past the last event of the frame
+        added: (k, 2) vertex pairs of the edges that appeared
+        removed: (k, 2) vertex pairs of the edges that disappeared
+        points: Vertices inserted during the frame
+    """
+    index: int
+    start: int
+    stop: int
+    added: np.ndarray
+    removed: np.ndarray
+    points: np.ndarray
+    player: 'TriangulationPlayer' = field(repr=False)
+
+    @property
+    def added_segments(self) -> np.ndarray:
+        """(k, 4) segments of ``added``."""
+        return self.player.segments_of(self.added)
+
+    @property
+    def removed_segments(self) -> np.ndarray:
+        """(k, 4) segments of ``removed``."""
+        return self.player.segments_of(self.removed)
+
+    def kept_at_removed(self) -> np.ndarray:
+        """
+        (k, 2) pairs of the shown edges, other than ``added``, that share a
+        vertex with a removed edge.
+
+        Painter-style visualizers erase removed edges by drawing over them,
+        which also covers the ends of these edges; they redraw them.
+        """
+        current = self.player.edges()
+        if not len(self.removed) or not len(current):
+            return current[:0]
+        touched = np.isin(current, self.removed.reshape(-1)).any(axis=1)
+        if len(self.added):
+            width = self.player._width
+            added = np.sort(self.added, axis=1)
+            touched &= ~np.isin(np.sort(current, axis=1) @ [width, 1], added @ [width, 1])
+        return current[touched]
+
+    def segments(self) -> np.ndarray:
+        """(n, 4) segments of all edges shown after the frame."""
+        return self.player.segments_of(self.player.edges())
+
+
+class TriangulationPlayer:
+    """Replays an ``EventLog`` as frames of edge changes.
+
+    Example:
+        >>> player = TriangulationPlayer(log, events_per_frame=20)
+        >>> player.play(visualizer.draw_frame, fps=30)
+    """
+
+    def __init__(self, log: EventLog, events_per_frame: int = 1, show_enclosing: bool = False):
+        """
+        Set up playback from the empty triangulation.
+
+        Args:
+            log: Recorded construction
+            events_per_frame: Events advanced per frame, which sets the
+                playback speed together with the frame rate
+            show_enclosing: Also report edges to the corners of the
+                enclosing triangle (far outside the points)
+        """
+        self.log = log
+        self.events_per_frame = max(int(events_per_frame), 1)
+        self.show_enclosing = show_enclosing
+        self._rows = log.events.tolist()
+        self._width = len(log.coords)
+        self._edges: Set[int] = set()
+        self.position = 0
+        self.frame_count = 0
+        if show_enclosing:
+            n = log.n_points
+            self._edges = {self._key(n, n + 1), self._key(n + 1, n + 2), self._key(n, n + 2)}
+
+    def __len__(self) -> int:
+        """Number of events."""
+        return len(self._rows)
+
+    def _key(self, a: int, b: int) -> int:
+        return a * self._width + b if a < b else b * self._width + a
+
+    def _pairs(self, keys) -> np.ndarray:
+        keys = np.fromiter(keys, dtype=np.int64)
+        pairs = np.column_stack([keys // self._width, keys % self._width])
+        if not self.show_enclosing:
+            pairs = pairs[(pairs < self.log.n_points).all(axis=1)]
+        return pairs
+
+    def edges(self) -> np.ndarray:
+        """(n, 2) vertex pairs of the edges shown at the current position."""
+        return self._pairs(self._edges)
+
+    def segments_of(self, pairs: np.ndarray) -> np.ndarray:
+        """(n, 4) segments of some vertex pairs."""
+        coords = self.log.coords
+        return np.hstack([coords[pairs[:, 0]], coords[pairs[:, 1]]]).reshape(-1, 4)
+
+    def advance(self, stop: int) -> Frame:
+        """
+        Apply the events up to ``stop`` and return their net change.
+
+        Args:
+            stop: Event to stop before (clipped to the log length)
+        """
+        stop = min(max(stop, self.position), len(self._rows))
+        added: Set[int] = set()
+        removed: Set[int] = set()
+        points: List[int] = []
+        key = self._key
+
+        def add(a: int, b: int) -> None:
+            k = key(a, b)
+            self._edges.add(k)
+            if k in removed:
+                removed.discard(k)
+            else:
+                added.add(k)
+
+        def remove(a: int, b: int) -> None:
+            k = key(a, b)
+            self._edges.discard(k)
+            if k in added:
+                added.discard(k)
+            else:
+                removed.add(k)
+
+        for kind, v0, v1, v2, v3, v4 in self._rows[self.position:stop]:
+            if kind == EventKind.INSERT:
+                points.append(v0)
+            elif kind == EventKind.SPLIT:
+                add(v0, v1)
+                add(v0, v2)
+                add(v0, v3)
+            elif kind == EventKind.SPLIT_EDGE:
+                remove(v1, v2)
+                for other in (v1, v2, v3, v4):
+                    add(v0, other)
+            elif kind == EventKind.FLIP:
+                remove(v0, v1)
+                add(v2, v3)
+            elif kind == EventKind.REMOVE:
+                remove(v0, v1)
+        frame = Frame(self.frame_count, self.position, stop, self._pairs(added), self._pairs(removed),
+                      np.array(points, dtype=np.int64), self)
+        self.position = stop
+        self.frame_count += 1
+        return frame
+
+    def frames(self) -> Iterator[Frame]:
+        """Frames of ``events_per_frame`` events each, to the end of the log."""
+        while self.position < len(self._rows):
+            yield self.advance(self.position + self.events_per_frame)
+
+    def play(self, draw: Callable[[Frame], None], fps: float = 30.0,
+             clock: Callable[[], float] = time.perf_counter,
+             sleep: Callable[[float], None] = time.sleep) -> int:
+        """
+        Replay the log in real time.
+
+        The log advances by ``events_per_frame * fps`` events per second of
+        wall time.  Every frame takes all events due by the time it starts;
+        when ``draw`` takes longer than a frame, the next frame simply
+        covers more events, so playback keeps its speed.
+
+        Args:
+            draw: Called with every frame
+            fps: Frames per second to aim for
+            clock: Time source in seconds
+            sleep: Waits for a number of seconds
+
+        Returns:
+            Number of frames drawn
+        """
+        period = 1.0 / fps
+        begin = clock()
+        tick = 0
+        drawn = 0
+        while self.position < len(self._rows):
+            # Skip the frame periods that passed while drawing
+            tick = max(tick + 1, math.floor((clock() - begin) / period) + 1)
+            draw(self.advance(tick * self.events_per_frame))
+            drawn += 1
+            wait = begin + tick * period - clock()
+            if wait > 0 and self.position < len(self._rows):
+                sleep(wait)
+        logger.debug(f"[TriangulationPlayer] Played {len(self._rows)} events in {drawn} frames")
+        return drawn
+
+    @classmethod
+    def for_duration(cls, log: EventLog, seconds: float, fps: float = 30.0, **kwargs) -> 'TriangulationPlayer':
+        """Player that replays the whole log in about ``seconds`` at ``fps``."""
+        return cls(log, events_per_frame=math.ceil(len(log) / max(seconds * fps, 1)), **kwargs)
@@ -0,0 +1,293 @@
+"""
+Headless rasterization of meshes into PNG images.
+
+Thumbnails of large meshes have to be drawn on machines without a display,
+where turtle, Tkinter and Qt are not available.  ``RasterImage`` draws with
+NumPy only: segments are clipped to the image and sampled once per pixel
+along their major axis (a vectorized DDA line), triangles are filled by
+testing the pixel centers of their bounding boxes, and all samples of a
+chunk are written with one indexed store into a packed RGBA buffer.
+"""
+import logging
+import struct
+import zlib
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..algorithms.pathfinding import PathResult
+from ..core.half_edge_arrays import HalfEdgeArrays
+from .view_transform import ViewTransform
+
+logger = logging.getLogger(__name__)
+
+Color = Union[Tuple[int, int, int], np.ndarray]
+
+# Pixels sampled at once; bounds the temporary arrays of a drawing call
+CHUNK_PIXELS = 1 << 18
+
+
+def _pack(color: Color) -> np.ndarray:
+    """Opaque RGB color(s), one or (n, 3), as packed RGBA words."""
+    rgb = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+    rgba = np.empty((len(rgb), 4), dtype=np.uint8)
+    rgba[:, :3] = rgb
+    rgba[:, 3] = 255
+    return rgba.view(np.uint32).ravel()
+
+
+def _chunks(costs: np.ndarray):
+    """Yield slices of consecutive items costing about ``CHUNK_PIXELS`` together."""
+    ends = np.cumsum(costs)
+    start = 0
+    while start < len(costs):
+        done = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, done + CHUNK_PIXELS, side='right')), start + 1)
+        yield slice(start, stop)
+        start = stop
+
+
+def clip_segments(segments: np.ndarray, width: float, height: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clip segments to the rectangle ``[0, width] x [0, height]`` (Liang-Barsky).
+
+    Args:
+        segments: (n, 4) segments as (x1, y1, x2, y2)
+        width: Right edge of the rectangle
+        height: Bottom edge of the rectangle
+
+    Returns:
+        Tuple of (clipped segments, indices of the input segments they come from)
+    """
+    x1, y1, x2, y2 = segments.T
+    dx, dy = x2 - x1, y2 - y1
+    t0 = np.zeros(len(segments))
+    t1 = np.ones(len(segments))
+    keep = np.ones(len(segments), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in ((-dx, x1), (dx, width - x1), (-dy, y1), (dy, height - y1)):
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+            keep &= (p != 0) | (q >= 0)
+    keep &= t0 <= t1
+    index = np.flatnonzero(keep)
+    t0, t1 = t0[index], t1[index]
+    x1, y1, dx, dy = x1[index], y1[index], dx[index], dy[index]
+    return np.column_stack([x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy]), index
+
+
+class RasterImage:
+    """RGB image that meshes are drawn into without any GUI toolkit.
+
+    Coordinates given to the drawing methods are world coordinates, mapped
+    to pixels by ``view``; a point at screen position (x, y) lands in pixel
+    (floor(x), floor(y)).
+
+    Example:
+        >>> image = render_mesh(arrays, 512, 512)
+        >>> image.draw_path(path, color=(255, 128, 0), width=3)
+        >>> image.save('mesh.png')
+    """
+
+    def __init__(self, width: int, height: int, view: Optional[ViewTransform] = None,
+                 background: Color = (255, 255, 255)):
+        """
+        Create a blank image.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            view: World-to-pixel transform (default: identity)
+            background: Fill color
+        """
+        self.width = width
+        self.height = height
+        self.view = view if view is not None else ViewTransform()
+        self._words = np.full(width * height, _pack(background)[0], dtype=np.uint32)
+
+    @property
+    def pixels(self) -> np.ndarray:
+        """(height, width, 3) uint8 view of the image."""
+        return self._words.view(np.uint8).reshape(self.height, self.width, 4)[:, :, :3]
+
+    def _store(self, x: np.ndarray, y: np.ndarray, words: np.ndarray) -> None:
+        """Set the pixels (x, y) inside the image; ``words`` is one color or one per pixel."""
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        if len(words) > 1:
+            words = words[inside]
+        self._words[y[inside] * self.width + x[inside]] = words
+
+    def draw_segments(self, segments: np.ndarray, color: Color = (0, 0, 0), width: int = 1) -> None:
+        """
+        Draw line segments.
+
+        Args:
+            segments: (n, 4) world segments as (x1, y1, x2, y2)
+            color: RGB color, or (n, 3) colors, one per segment
+            width: Line width in pixels
+        """
+        words = _pack(color)
+        screen = self.view.apply_segments(segments)
+        screen, index = clip_segments(screen, self.width, self.height)
+        if len(words) > 1:
+            words = words[index]
+        offsets = np.arange(width) - (width - 1) // 2
+        # One sample per pixel along the major axis, both ends included
+        steps = np.ceil(np.abs(screen[:, 2:] - screen[:, :2]).max(axis=1)).astype(np.int64) + 1
+        for part in _chunks(steps * width * width):
+            seg = screen[part]
+            count = steps[part]
+            which = np.repeat(np.arange(len(seg)), count)
+            k = np.arange(len(which)) - np.repeat(np.cumsum(count) - count, count)
+            t = k / np.maximum(count - 1, 1)[which]
+            x = np.floor(seg[which, 0] + t * (seg[which, 2] - seg[which, 0])).astype(np.int64)
+            y = np.floor(seg[which, 1] + t * (seg[which, 3] - seg[which, 1])).astype(np.int64)
+            sample_words = words[part][which] if len(words) > 1 else words
+            if width > 1:
+                x = (x[:, None, None] + offsets[None, :, None]).repeat(width, axis=2).ravel()
+                y = (y[:, None, None] + offsets[None, None, :]).repeat(width, axis=1).ravel()
+                if len(sample_words) > 1:
+                    sample_words = np.repeat(sample_words, width * width)
+            self._store(x, y, sample_words)
+
+    def draw_points(self, points: np.ndarray, color: Color = (0, 0, 0), size: int = 1) -> None:
+        """
+        Draw points as squares.
+
+        Args:
+            points: (n, 2) world positions
+            color: RGB color, or (n, 3) colors, one per point
+            size: Side of the squares in pixels
+        """
+        words = _pack(color)
+        screen = np.floor(self.view.apply(np.asarray(points).reshape(-1, 2))).astype(np.int64)
+        offsets = np.arange(size) - (size - 1) // 2
+        x = (screen[:, 0, None, None] + offsets[None, :, None]).repeat(size, axis=2).ravel()
+        y = (screen[:, 1, None, None] + offsets[None, None, :]).repeat(size, axis=1).ravel()
+        self._store(x, y, np.repeat(words, size * size) if len(words) > 1 else words)
+
+    def fill_triangles(self, triangles: np.ndarray, color: Color = (200, 200, 200)) -> None:
+        """
+        Fill triangles.
+
+        A pixel is filled when its center lies inside the triangle or on
+        its border; the corners may be in either order.
+
+        Args:
+            triangles: (n, 3, 2) world corner positions
+            color: RGB color, or (n, 3) colors, one per triangle
+        """
+        words = _pack(color)
+        screen = self.view.apply(np.asarray(triangles).reshape(-1, 2)).reshape(-1, 3, 2)
+        lo = np.maximum(np.floor(screen.min(axis=1) - 0.5), 0).astype(np.int64)
+        hi = np.minimum(np.ceil(screen.max(axis=1) - 0.5), [self.width - 1, self.height - 1]).astype(np.int64)
+        span = np.maximum(hi - lo + 1, 0)
+        index = np.flatnonzero(span[:, 0] * span[:, 1] > 0)
+        if len(words) > 1:
+            words = words[index]
+        screen, lo, span = screen[index], lo[index], span[index]
+        area = span[:, 0] * span[:, 1]
+        # Edge functions a * x + b * y + c of the three sides, signed so
+        # that they are non-negative inside
+        end = screen[:, [1, 2, 0]]
+        u, v = screen[:, 1] - screen[:, 0], screen[:, 2] - screen[:, 0]
+        flip = np.where(u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0] < 0, -1.0, 1.0)
+        a = (screen[:, :, 1] - end[:, :, 1]) * flip[:, None]
+        b = (end[:, :, 0] - screen[:, :, 0]) * flip[:, None]
+        c = -(a * screen[:, :, 0] + b * screen[:, :, 1])
+        sides = [(a[:, j].copy(), b[:, j].copy(), c[:, j].copy()) for j in range(3)]
+        for part in _chunks(area):
+            start, size = lo[part], span[part]
+            count = area[part]
+            which = np.repeat(np.arange(len(count)), count)
+            k = np.arange(len(which)) - np.repeat(np.cumsum(count) - count, count)
+            columns = size[:, 0][which]
+            row = k // columns
+            x = start[:, 0][which] + (k - row * columns)
+            y = start[:, 1][which] + row
+            px, py = x + 0.5, y + 0.5
+            inside = np.ones(len(which), dtype=bool)
+            for side_a, side_b, side_c in sides:
+                inside &= side_a[part][which] * px + side_b[part][which] * py + side_c[part][which] >= 0
+            fill = words[part][which[inside]] if len(words) > 1 else words
+            self._store(x[inside], y[inside], fill)
+
+    def draw_path(self, path: PathResult, color: Color = (255, 165, 0), width: int = 3) -> None:
+        """Draw a path returned by ``SearchResult.path_to`` as a polyline."""
+        points = path.points
+        if len(points) > 1:
+            self.draw_segments(np.hstack([points[:-1], points[1:]]), color, width)
+        else:
+            self.draw_points(points, color, width)
+
+    def to_png(self, level: int = 6) -> bytes:
+        """Encode the image as an 8-bit RGB PNG."""
+        return encode_png(self.pixels, level)
+
+    def save(self, filename: str, level: int = 6) -> None:
+        """Write the image to a PNG file."""
+        with open(filename, 'wb') as f:
+            f.write(self.to_png(level))
+        logger.debug(f"[RasterImage] Wrote {self.width}x{self.height} image to {filename}")
+
+
+def encode_png(pixels: np.ndarray, level: int = 6) -> bytes:
+    """
+    Encode an image as PNG.
+
+    Args:
+        pixels: (height, width, 3) uint8 RGB image
+        level: zlib compression level
+
+    Returns:
+        The PNG file contents
+    """
+    height, width = pixels.shape[:2]
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 3)  # filter type 0 per row
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows.tobytes(), level)) + chunk(b'IEND', b''))
+
+
+def render_mesh(arrays: HalfEdgeArrays, width: int = 256, height: Optional[int] = None,
+                edge_color: Color = (0, 0, 255), face_color: Optional[Color] = None,
+                paths: Sequence[PathResult] = (), margin: int = 4) -> RasterImage:
+    """
+    Draw a mesh fitted to a new image.
+
+    Args:
+        arrays: Mesh to draw
+        width: Image width in pixels
+        height: Image height in pixels (default: ``width``)
+        edge_color: Color of the edges, or None to skip them
+        face_color: Color of the inner faces, or (n_triangles, 3) colors
+            for the triangles of ``arrays.triangles()``; None leaves them empty
+        paths: Paths to draw over the mesh
+        margin: Free pixels around the mesh
+
+    Returns:
+        The image
+    """
+    height = width if height is None else height
+    # Scale the larger side of the mesh so that both sides fit
+    size = np.ptp(arrays.coords, axis=0) if arrays.n_vertices else np.zeros(2)
+    room = np.maximum(np.array([width, height]) - 2 * margin - 1, 1)
+    extent = float((room / np.maximum(size, 1e-300)).min() * size.max()) if size.max() > 0 else float(room.min())
+    view = ViewTransform.fit(arrays.coords, extent=extent, screen_center=(width / 2, height / 2))
+    image = RasterImage(width, height, view)
+    if face_color is not None:
+        image.fill_triangles(arrays.coords[arrays.triangles()], face_color)
+    if edge_color is not None:
+        half = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+        image.draw_segments(np.hstack([arrays.coords[arrays.origin[half]],
+                                       arrays.coords[arrays.target[half]]]), edge_color)
+    for path in paths:
+        image.draw_path(path)
+    logger.debug(f"[render_mesh] Drew {arrays.n_half_edges // 2} edges on {width}x{height} pixels")
+    return image
@@ -2,23 +2,129 @@
 Turtle-based visualization module for Half-Edge data structures.
 Provides interactive visualization capabilities using Python's turtle graphics.
 """
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+import logging
 import turtle
 from turtle import Turtle
 import math
 
-from ..core.half_edge_ds import HalfEdge, Vertex
+import numpy as np
+
+from ..core.half_edge_ds import HalfEdge, Vertex, neighbours
+from ..core.half_edge_arrays import HalfEdgeArrays
+from ..algorithms.incremental_delaunay import IncrementalDelaunay, spatial_order
+from ..algorithms.pathfinding import PathResult
+from .view_transform import ViewTransform
+
+logger = logging.getLogger(__name__)
+
+# Horizontal offset of a vertex label from its vertex
+LABEL_OFFSET = 15
+
+EdgeKey = Tuple[int, int]
+Point = Tuple[float, float]
+# Line segment as (start, end) points
+Segment = Tuple[Point, Point]
+
+
+def edge_key(edge: HalfEdge) -> EdgeKey:
+    """Key shared by a half-edge and its twin: the sorted ids of their vertices."""
+    a, b = edge.V.Vertex_id, edge.S.V.Vertex_id
+    return (a, b) if a < b else (b, a)
+
+
+def drawing_plan(edges: Sequence[HalfEdge]) -> Tuple[List[HalfEdge], List[Vertex]]:
+    """
+    What to draw for some half-edges: every undirected edge and every vertex once.
+
+    Args:
+        edges: Half-edges; twins and repeats may or may not be listed
+
+    Returns:
+        Tuple of (one half-edge per undirected edge, their vertices), both in
+        the order they are first met
+    """
+    seen: Set[int] = set()
+    labelled: Set[int] = set()
+    unique: List[HalfEdge] = []
+    vertices: List[Vertex] = []
+    for edge in edges:
+        if id(edge) in seen or id(edge.S) in seen:
+            continue
+        seen.add(id(edge))
+        unique.append(edge)
+        for vertex in (edge.V, edge.S.V):
+            if id(vertex) not in labelled:
+                labelled.add(id(vertex))
+                vertices.append(vertex)
+    return unique, vertices
+
+
+def delaunay_inserter(vertices: Sequence[Vertex]) -> Callable[[Vertex], List[HalfEdge]]:
+    """
+    ``insert_point`` callback that keeps a Delaunay triangulation of some vertices.
+
+    Each call adds the vertex and triangulates all vertices again, like
+    ``gui.main_window.MeshCanvas``; the half-edges are rebuilt on the same
+    vertex objects, so ``update_edges`` only redraws the edges that changed.
+
+    Args:
+        vertices: Vertices already in the mesh; the list is copied
+
+    Returns:
+        Callback taking the new vertex and returning all half-edges afterwards
+    """
+    points = list(vertices)
+
+    def insert(vertex: Vertex) -> List[HalfEdge]:
+        points.append(vertex)
+        coords = np.array([v.getxy() for v in points], dtype=np.float64)
+        dt = IncrementalDelaunay(coords).insert_all(spatial_order(coords))
+        arrays = HalfEdgeArrays.from_edge_list(coords, dt.edges(),
+                                               vertex_ids=[v.Vertex_id for v in points])
+        _, edges = arrays.to_half_edges(points)
+        logger.debug(f"[TurtleVisualizer] Inserted vertex {vertex.Vertex_id}: {len(edges)} edges")
+        return edges
+
+    return insert
+
 
 class TurtleVisualizer:
-    """A class for visualizing Half-Edge data structures using turtle graphics."""
+    """A class for visualizing Half-Edge data structures using turtle graphics.
+
+    In fast mode (the default) tracing is off: the turtle is hidden, nothing
+    is animated and the screen is updated once per drawing call instead of
+    after every stroke.
+
+    Vertices keep their mesh coordinates; with a ``view`` every point is
+    mapped to the screen when drawn and clicks are mapped back.
+    """
     
-    def __init__(self):
-        """Initialize the turtle visualizer."""
+    def __init__(self, fast: bool = True, view: Optional[ViewTransform] = None):
+        """
+        Initialize the turtle visualizer.
+
+        Args:
+            fast: Draw with tracing off and one screen update per call
+            view: Mesh-to-screen transform; ``None`` draws mesh coordinates
+                as they are.  The turtle screen has its origin at the center
+                and y pointing up, so fit it with ``screen_center=(0, 0)``.
+        """
         self.turtle = Turtle()
         self.turtle.speed(0)
+        self.screen = self.turtle.getscreen()
+        self.fast = fast
+        self.view = view
+        if fast:
+            self.screen.tracer(0)
+            self.turtle.hideturtle()
         self.drawing_edge: Optional[HalfEdge] = None
         self.taken_edge: Optional[HalfEdge] = None
         self.main_edge: Optional[HalfEdge] = None
+        #: Inserts a vertex into the mesh and returns all its edges afterwards
+        self.insert_point: Optional[Callable[[Vertex], Sequence[HalfEdge]]] = None
+        self._drawn: Dict[EdgeKey, HalfEdge] = {}
+        self._outgoing: Dict[int, List[HalfEdge]] = {}
         self.setup_turtle()
 
     def setup_turtle(self) -> None:
@@ -31,24 +137,146 @@ class TurtleVisualizer:
         turtle.onscreenclick(self.add_point, 3)
         turtle.listen()
 
+    def set_edges(self, edges: Sequence[HalfEdge]) -> None:
+        """
+        Register the edges of the mesh, so ``get_neighbours`` can find the
+        edges around a vertex.
+
+        Args:
+            edges: Half-edges of the mesh; twins are registered too
+        """
+        self._outgoing = {}
+        for edge in edges:
+            for half in (edge, edge.S):
+                self._outgoing.setdefault(half.V.Vertex_id, []).append(half)
+
     def draw_delaunay_triangulation(self, drawing_points: List[Vertex]) -> None:
         """
         Draw the complete Delaunay triangulation.
         
         Args:
-            drawing_points: List of vertices to draw
+            drawing_points: List of vertices (or half-edges) to draw
         """
+        edges: List[HalfEdge] = []
         for vert in drawing_points:
-            for edge in self.get_neighbours(vert):
-                self.turtle.penup()
-                self.turtle.goto(edge.V.getxy()[0] + 15, edge.V.getxy()[1])
-                self.turtle.write(edge.V.Vertex_id)
-                self.turtle.goto(edge.V.getxy())
-                self.turtle.pendown()
-                self.turtle.goto(edge.Sym().V.getxy())
-                self.turtle.penup()
-                self.turtle.goto(edge.Sym().V.getxy()[0] + 15, edge.Sym().V.getxy()[1])
-                self.turtle.write(edge.Sym().V.Vertex_id)
+            edges.extend(self.get_neighbours(vert))
+        self.draw_edges(edges)
+
+    def draw_edges(self, edges: Sequence[HalfEdge]) -> None:
+        """
+        Draw some edges and the ids of their vertices.
+
+        Every undirected edge is stroked once and every vertex labelled
+        once, however many of its half-edges are listed.
+
+        Args:
+            edges: Half-edges to draw
+        """
+        unique, vertices = drawing_plan(edges)
+        self.turtle.pencolor("black")
+        for edge in unique:
+            self._stroke(edge)
+            self._drawn[edge_key(edge)] = edge
+        for vertex in vertices:
+            self._label(vertex)
+        self._flush()
+        logger.debug(f"[TurtleVisualizer] Drew {len(unique)} edges and {len(vertices)} labels")
+
+    def update_edges(self, edges: Sequence[HalfEdge]) -> None:
+        """
+        Redraw only what changed since the last drawing.
+
+        Edges that are gone are painted over in the background color, new
+        ones are drawn, and the kept edges and labels at the vertices of the
+        erased edges are drawn again, since erasing also covers their ends.
+
+        Args:
+            edges: All half-edges of the mesh now
+        """
+        unique, _ = drawing_plan(edges)
+        current = {edge_key(edge): edge for edge in unique}
+        erased = [edge for key, edge in self._drawn.items() if key not in current]
+        added = [edge for key, edge in current.items() if key not in self._drawn]
+        touched = {v.Vertex_id for edge in erased for v in (edge.V, edge.S.V)}
+        kept = [edge for key, edge in current.items()
+                if key in self._drawn and (key[0] in touched or key[1] in touched)]
+
+        redrawn, vertices = drawing_plan(added + kept)
+        self._repaint([(e.V.getxy(), e.S.V.getxy()) for e in erased],
+                      [(e.V.getxy(), e.S.V.getxy()) for e in redrawn])
+        labels = {v.Vertex_id for edge in added for v in (edge.V, edge.S.V)} | touched
+        for vertex in vertices:
+            if vertex.Vertex_id in labels:
+                self._label(vertex)
+        self._drawn = current
+        self.set_edges(unique)
+        self._flush()
+        logger.debug(f"[TurtleVisualizer] Erased {len(erased)} edges, drew {len(added)} new "
+                     f"and {len(kept)} kept edges")
+
+    def draw_frame(self, frame) -> None:
+        """
+        Show a frame of ``TriangulationPlayer``.
+
+        Like ``update_edges``: edges that disappeared are painted over, and
+        new edges plus the kept ones at the ends of the erased ones are
+        drawn, with one screen update for the whole frame.
+
+        Args:
+            frame: ``playback.Frame`` to show
+        """
+        def pairs(segments) -> List[Segment]:
+            return [((x1, y1), (x2, y2)) for x1, y1, x2, y2 in segments.tolist()]
+
+        kept = frame.player.segments_of(frame.kept_at_removed())
+        self._repaint(pairs(frame.removed_segments), pairs(frame.added_segments) + pairs(kept))
+        self._flush()
+
+    def _repaint(self, erased: Sequence[Segment], drawn: Sequence[Segment]) -> None:
+        """Paint segments over in the background color, then draw others."""
+        self.turtle.pencolor(self.screen.bgcolor())
+        self.turtle.pensize(3)
+        for start, end in erased:
+            self._stroke_segment(start, end)
+        self.turtle.pensize(1)
+        self.turtle.pencolor("black")
+        for start, end in drawn:
+            self._stroke_segment(start, end)
+
+    def _stroke(self, edge: HalfEdge) -> None:
+        self._stroke_segment(edge.V.getxy(), edge.S.V.getxy())
+
+    def _stroke_segment(self, start: Point, end: Point) -> None:
+        self.turtle.penup()
+        self.turtle.goto(self._screen_point(start))
+        self.turtle.pendown()
+        self.turtle.goto(self._screen_point(end))
+        self.turtle.penup()
+
+    def _label(self, vertex: Vertex) -> None:
+        x, y = self._screen_point(vertex.getxy())
+        self.turtle.penup()
+        self.turtle.goto(x + LABEL_OFFSET, y)
+        self.turtle.write(vertex.Vertex_id)
+
+    def _screen_point(self, point: Point) -> Point:
+        """Screen position of a mesh point."""
+        if self.view is None:
+            return point
+        x, y = self.view.apply(point)
+        return float(x), float(y)
+
+    def _mesh_point(self, x: float, y: float) -> Point:
+        """Mesh position of a screen point, such as a click."""
+        if self.view is None:
+            return x, y
+        x, y = self.view.invert((x, y))
+        return float(x), float(y)
+
+    def _flush(self) -> None:
+        """Show what was drawn, once, when tracing is off."""
+        if self.fast:
+            self.screen.update()
 
     def draw_line(self, edge: HalfEdge, color: str = "brown", width: int = 5) -> None:
         """
@@ -62,11 +290,35 @@ class TurtleVisualizer:
         self.turtle.penup()
         self.turtle.pensize(width)
         self.turtle.pencolor(color)
-        self.turtle.goto(edge.V.getxy())
+        self._stroke(edge)
+        self.turtle.pensize(1)
+        self._flush()
+
+    def draw_path(self, path: PathResult, color: str = "orange", width: int = 5) -> None:
+        """
+        Draw a path returned by ``SearchResult.path_to``.
+
+        Args:
+            path: Path to draw
+            color: Color of the path
+            width: Width of the path
+        """
+        points = path.points
+        if not len(points):
+            return
+        if self.view is not None:
+            points = self.view.apply(points)
+        points = points.tolist()
+        self.turtle.penup()
+        self.turtle.pensize(width)
+        self.turtle.pencolor(color)
+        self.turtle.goto(points[0])
         self.turtle.pendown()
-        self.turtle.goto(edge.S.V.getxy())
+        for point in points[1:]:
+            self.turtle.goto(point)
         self.turtle.penup()
         self.turtle.pensize(1)
+        self._flush()
 
     def delete_line(self) -> None:
         """Delete the currently drawn line."""
@@ -99,7 +351,7 @@ class TurtleVisualizer:
             x: X coordinate of the click
             y: Y coordinate of the click
         """
-        point = Vertex(x, y)
+        point = Vertex(*self._mesh_point(x, y))
         if self.main_edge:
             searching_tri = self.walk_in_tri(self.main_edge, point)
             self.drawing_edge = self.distance_from(searching_tri, point)
@@ -113,7 +365,9 @@ class TurtleVisualizer:
             x: X coordinate of the new point
             y: Y coordinate of the new point
         """
-        pass  # To be implemented
+        if self.insert_point is None:
+            return
+        self.update_edges(self.insert_point(Vertex(*self._mesh_point(x, y))))
 
     def distance_from(self, edges: List[HalfEdge], point: Vertex) -> HalfEdge:
         """
@@ -160,6 +414,9 @@ class TurtleVisualizer:
     def get_neighbours(self, vertex: Vertex) -> List[HalfEdge]:
         """
         Get all neighboring edges of a vertex.
+
+        Vertices are looked up among the edges given to ``set_edges``; a
+        half-edge stands for its origin and is walked with ``neighbours``.
         
         Args:
             vertex: Vertex to get neighbors for
@@ -167,8 +424,9 @@ class TurtleVisualizer:
         Returns:
             List of neighboring edges
         """
-        # Implementation to be added
-        pass
+        if isinstance(vertex, HalfEdge):
+            return neighbours(vertex)
+        return self._outgoing.get(vertex.Vertex_id, [])
 
     def draw_selected_edge(self) -> None:
         """Draw the currently selected edge."""
@@ -179,14 +437,18 @@ class TurtleVisualizer:
         if self.taken_edge:
             self.draw_line(self.taken_edge, "brown", 5)
 
-    def run(self, initial_edge: HalfEdge, drawing_points: List[Vertex]) -> None:
+    def run(self, initial_edge: HalfEdge, drawing_points: List[Vertex],
+            edges: Optional[Sequence[HalfEdge]] = None) -> None:
         """
         Start the visualization.
         
         Args:
             initial_edge: Starting edge for the visualization
             drawing_points: List of vertices to draw
+            edges: Half-edges of the mesh, to find the edges of the vertices
         """
         self.main_edge = initial_edge
+        if edges is not None:
+            self.set_edges(edges)
         self.draw_delaunay_triangulation(drawing_points)
         turtle.mainloop() 
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+World-to-screen transform for drawing Half-Edge data structures.
+
+Mesh coordinates are stored as read from the file; drawing code maps them to
+screen space through a ``ViewTransform`` instead of rewriting the vertices.
+"""
+from dataclasses import dataclass, replace
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ViewTransform:
+    """Uniform scale about ``center`` followed by a move to ``screen_center``.
+
+    Attributes:
+        scale: Screen units per world unit
+        center: World point shown at ``screen_center``
+        screen_center: Screen position of ``center``
+    """
+    scale: float = 1.0
+    center: Tuple[float, float] = (0.0, 0.0)
+    screen_center: Tuple[float, float] = (0.0, 0.0)
+
+    @classmethod
+    def fit(cls, coords: np.ndarray, extent: float = 400.0,
+            screen_center: Tuple[float, float] = (400.0, 300.0)) -> 'ViewTransform':
+        """
+        Transform that centers ``coords`` and scales their larger side to ``extent``.
+
+        Args:
+            coords: (n, 2) world coordinates
+            extent: Screen size of the larger side of the bounding box
+            screen_center: Screen position of the bounding box center
+
+        Returns:
+            Fitted ViewTransform (identity scale for empty or single-point input)
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        if not len(coords):
+            return cls(screen_center=screen_center)
+        lo = coords.min(axis=0)
+        hi = coords.max(axis=0)
+        size = float((hi - lo).max())
+        center = (lo + hi) / 2
+        return cls(scale=extent / size if size > 0 else 1.0,
+                   center=(float(center[0]), float(center[1])),
+                   screen_center=screen_center)
+
+    def apply(self, coords: np.ndarray) -> np.ndarray:
+        """Map (n, 2) world coordinates to screen coordinates."""
+        return (np.asarray(coords, dtype=float) - self.center) * self.scale + self.screen_center
+
+    def invert(self, coords: np.ndarray) -> np.ndarray:
+        """Map (n, 2) screen coordinates back to world coordinates."""
+        return (np.asarray(coords, dtype=float) - self.screen_center) / self.scale + self.center
+
+    def apply_segments(self, segments: np.ndarray) -> np.ndarray:
+        """Map (n, 4) world segments (x1, y1, x2, y2) to screen coordinates."""
+        return self.apply(np.asarray(segments, dtype=float).reshape(-1, 2)).reshape(-1, 4)
+
+    def zoomed(self, factor: float, anchor: Tuple[float, float]) -> 'ViewTransform':
+        """
+        Transform scaled by ``factor`` about a screen point.
+
+        The world point under ``anchor`` stays under it, like zooming
+        towards the mouse cursor.
+        """
+        world = self.invert(np.array([anchor]))[0]
+        scale = self.scale * factor
+        return replace(self, scale=scale, screen_center=(
+            float(anchor[0] - (world[0] - self.center[0]) * scale),
+            float(anchor[1] - (world[1] - self.center[1]) * scale)))
+
+    def panned(self, dx: float, dy: float) -> 'ViewTransform':
+        """Transform moved by (dx, dy) screen units."""
+        return replace(self, screen_center=(self.screen_center[0] + dx, self.screen_center[1] + dy))
@@ -0,0 +1,69 @@
+import pytest
+
+from src.visualization import turtle_visualizer
+from src.visualization.turtle_visualizer import TurtleVisualizer
+
+
+class RecordingTurtle:
+    """Stands in for ``turtle.Turtle`` (which needs a display) and records strokes."""
+
+    def __init__(self):
+        self.strokes = []
+        self.labels = []
+        self.color = "black"
+        self.screen = RecordingScreen()
+        self._pos = (0.0, 0.0)
+        self._down = False
+
+    def getscreen(self):
+        return self.screen
+
+    def speed(self, speed):
+        pass
+
+    def hideturtle(self):
+        pass
+
+    def penup(self):
+        self._down = False
+
+    def pendown(self):
+        self._down = True
+
+    def goto(self, *point):
+        point = tuple(point[0]) if len(point) == 1 else point
+        if self._down:
+            self.strokes.append((self.color, self._pos, point))
+        self._pos = point
+
+    def write(self, text):
+        self.labels.append(text)
+
+    def pencolor(self, color):
+        self.color = color
+
+    def pensize(self, width):
+        pass
+
+
+class RecordingScreen:
+    def __init__(self):
+        self.updates = 0
+
+    def tracer(self, n):
+        pass
+
+    def update(self):
+        self.updates += 1
+
+    def bgcolor(self):
+        return "white"
+
+
+@pytest.fixture
+def make_visualizer(monkeypatch):
+    """Build visualizers through the constructor, with the screen stubbed out."""
+    monkeypatch.setattr(turtle_visualizer, 'Turtle', RecordingTurtle)
+    for name in ('onkey', 'onscreenclick', 'listen'):
+        monkeypatch.setattr(turtle_visualizer.turtle, name, lambda *args: None)
+    return lambda view=None: TurtleVisualizer(view=view)
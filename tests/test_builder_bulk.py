@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.core.half_edge_ds import EdgeValidationError, VertexValidationError
+from src.core.half_edge_builder import HalfEdgeBuilder
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.visualization.view_transform import ViewTransform
+
+COORDS = [(0, 0), (2, 0), (2, 1), (0, 1), (1, 3)]
+EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (2, 4), (3, 4)]
+
+
+def ring_keys(arrays):
+    """(origin, target) -> (origin, target) of next, in file coordinates."""
+    xy = [tuple(p) for p in arrays.coords.tolist()]
+    o, t, n = arrays.origin, arrays.target, arrays.next
+    return {(xy[o[h]], xy[t[h]]): (xy[o[n[h]]], xy[t[n[h]]]) for h in range(arrays.n_half_edges)}
+
+
+def test_bulk_matches_one_by_one():
+    builder = HalfEdgeBuilder()
+    for x, y in COORDS:
+        builder.add_vertex(x, y)
+    for a, b in EDGES:
+        builder.add_edge(builder._vertices[a], builder._vertices[b])
+    vertices, edges = builder.build()
+    expected = HalfEdgeArrays.from_half_edges(edges, vertices)
+
+    bulk = HalfEdgeBuilder().add_vertices(COORDS).add_edges(EDGES)
+    arrays = bulk.build_arrays()
+    assert ring_keys(arrays) == ring_keys(expected)
+
+    bulk_vertices, bulk_edges = bulk.build()
+    assert [v.Vertex_id for v in bulk_vertices] == arrays.vertex_ids.tolist()
+    assert ring_keys(HalfEdgeArrays.from_half_edges(bulk_edges, bulk_vertices)) == ring_keys(expected)
+
+
+def test_bulk_validation():
+    with pytest.raises(VertexValidationError):
+        HalfEdgeBuilder().add_vertices([(0, np.nan)])
+    builder = HalfEdgeBuilder().add_vertices(COORDS)
+    with pytest.raises(EdgeValidationError):
+        builder.add_edges([(0, 0)])
+    with pytest.raises(EdgeValidationError):
+        builder.add_edges([(0, 5)])
+    with pytest.raises(EdgeValidationError):
+        builder.add_edges([(0, 1), (1, 0)])
+    with pytest.raises(EdgeValidationError):
+        builder.add_edges([(0, 1)], weights=[-1.0])
+
+
+def test_view_transform_fit():
+    coords = np.array(COORDS, dtype=float)
+    view = ViewTransform.fit(coords, extent=300, screen_center=(400, 300))
+    screen = view.apply(coords)
+    assert np.allclose(screen.min(axis=0) + screen.max(axis=0), [800, 600])
+    assert np.isclose(np.ptp(screen, axis=0).max(), 300)
+    assert np.allclose(view.invert(screen), coords)
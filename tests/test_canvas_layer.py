@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from src.core.half_edge_ds import Vertex
+from src.visualization.gui import HalfEdgeCanvas
+from benchmarks.common import grid_triangulation
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def mesh():
+    arrays = grid_triangulation(8, 6, jitter=0)
+    return arrays.to_half_edges(arrays.make_vertices(arrays.coords * 60 + 40))
+
+
+def pixels(canvas):
+    image = canvas.grab().toImage().convertToFormat(QImage.Format.Format_RGB32)
+    return np.frombuffer(image.constBits().asstring(image.sizeInBytes()), dtype=np.uint8).copy()
+
+
+def spy_renders(canvas):
+    clips = []
+    render = canvas._render_mesh
+    canvas._render_mesh = lambda painter, clip, detailed: (clips.append(clip), render(painter, clip, detailed))
+    return clips
+
+
+def test_selection_reuses_cached_layer(app, mesh):
+    vertices, edges = mesh
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, edges)
+    clips = spy_renders(canvas)
+    pixels(canvas)
+    assert len(clips) == 1
+    canvas.set_selected_edge(edges[3])
+    selected = pixels(canvas)
+    canvas.select_nearest_edge((10, 10))  # too far: keeps the selection
+    assert len(clips) == 1
+    assert (selected == pixels(canvas)).all()
+
+
+def test_appended_items_redraw_their_area(app, mesh):
+    vertices, edges = mesh
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices[:30], edges[:40])
+    clips = spy_renders(canvas)
+    pixels(canvas)
+    canvas.add_vertices(vertices[30:])
+    canvas.add_edges(edges[40:])
+    canvas.add_vertices([Vertex(700, 500)])
+    incremental = pixels(canvas)
+    assert len(clips) == 2 and clips[1].width() < canvas.width()
+
+    fresh = HalfEdgeCanvas()
+    fresh.set_data(vertices + [canvas.vertices[-1]], edges)
+    assert (incremental == pixels(fresh)).all()
+
+
+def test_edges_changed_in_place_redraw_their_area(app, mesh):
+    vertices, edges = mesh
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, edges)
+    canvas.set_selected_edge(edges[0])
+    clips = spy_renders(canvas)
+    pixels(canvas)
+    edges[0].V, edges[0].S.V = vertices[9], vertices[1]
+    canvas.update_edges([edges[0].S])
+    moved = pixels(canvas)
+    assert len(clips) == 2 and clips[1].width() < canvas.width() / 2
+
+    fresh = HalfEdgeCanvas()
+    fresh.set_data(vertices, edges)
+    fresh.set_selected_edge(edges[0])
+    # Anti-aliasing of a partial path may round one level differently
+    assert np.abs(moved.astype(int) - pixels(fresh)).max() <= 1
+    assert canvas.edge_scene().nearest((70.0, 40.0), 5.0) is None
+
+
+def test_replaced_data_redraws_everything(app, mesh):
+    vertices, edges = mesh
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, edges)
+    clips = spy_renders(canvas)
+    pixels(canvas)
+    canvas.set_data(vertices, edges[:10])
+    pixels(canvas)
+    assert len(clips) == 2 and clips[1].width() == canvas.width()
+
+
+def test_streamed_edges_extend_the_index(app):
+    arrays = grid_triangulation(80, 80)
+    vertices, edges = arrays.to_half_edges()
+    canvas = HalfEdgeCanvas()
+    canvas.set_data([], [])
+    scene = canvas.edge_scene()
+    for start in range(0, len(edges), 1000):
+        canvas.add_edges(edges[start:start + 1000])
+        assert canvas.edge_scene() is scene
+    assert len(scene) == len(edges) and len(scene.grid) > len(edges) // 3
+    assert sorted(scene.visible((-1, -1, 100, 100)).tolist()) == list(range(len(edges)))
+    assert canvas.edge_scene().nearest(tuple(arrays.coords[0] + 0.01), 1.0) is not None
@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtCore import QPoint, QPointF, Qt
+from PyQt6.QtGui import QImage, QWheelEvent
+from PyQt6.QtWidgets import QApplication
+
+from src.visualization.gui import HalfEdgeCanvas, MainWindow
+from src.visualization.view_transform import ViewTransform
+from benchmarks.common import grid_triangulation
+from tests.test_loader import OBJ, wait_for
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def canvas(app):
+    arrays = grid_triangulation(12, 9, jitter=0)
+    vertices, edges = arrays.to_half_edges(arrays.make_vertices())
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, edges)
+    canvas.fit_view()
+    return canvas
+
+
+def pixels(canvas):
+    image = canvas.grab().toImage().convertToFormat(QImage.Format.Format_RGB32)
+    return np.frombuffer(image.constBits().asstring(image.sizeInBytes()), dtype=np.uint8).copy()
+
+
+def test_zoom_keeps_anchor_and_pan_moves():
+    view = ViewTransform(scale=2.0, center=(1.0, 1.0), screen_center=(100.0, 50.0))
+    anchor = (130.0, 70.0)
+    zoomed = view.zoomed(3.0, anchor)
+    assert zoomed.scale == 6.0
+    assert np.allclose(zoomed.apply(view.invert([anchor])), [anchor])
+    panned = view.panned(5, -2)
+    assert np.allclose(panned.apply([(1, 1)]), [(105, 48)])
+    assert np.allclose(view.apply_segments([[1, 1, 2, 3]]), [[100, 50, 102, 54]])
+
+
+def test_fit_keeps_world_coordinates(canvas):
+    assert canvas.vertices[-1].getxy() == (11.0, 8.0)
+    screen = canvas.view.apply(canvas.vertex_positions())
+    assert np.allclose(screen.min(axis=0) + screen.max(axis=0), [canvas.width(), canvas.height()])
+    pixels(canvas)
+    assert canvas._layer_detailed
+
+
+def test_pick_in_screen_space_after_zoom(canvas):
+    canvas.set_view(canvas.view.zoomed(2.0, (400, 300)))
+    edge = canvas.edges[0]
+    (x1, y1), (x2, y2) = canvas.view.apply([edge.V.getxy(), edge.S.V.getxy()])
+    canvas.select_nearest_edge(((x1 + x2) / 2, (y1 + y2) / 2 + 3))
+    assert canvas.selected_edge is edge
+    # 3 pixels is still close after zooming in, 30 pixels is not
+    canvas.set_selected_edge(None)
+    canvas.select_nearest_edge(((x1 + x2) / 2, (y1 + y2) / 2 - 30))
+    assert canvas.selected_edge is None
+
+
+def test_wheel_zooms_about_cursor(canvas):
+    before = canvas.view
+    event = QWheelEvent(QPointF(200, 100), QPointF(200, 100), QPoint(0, 0), QPoint(0, 120),
+                        Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                        Qt.ScrollPhase.NoScrollPhase, False)
+    QApplication.sendEvent(canvas, event)
+    assert canvas.view.scale == pytest.approx(before.scale * 1.25)
+    assert np.allclose(canvas.view.invert([(200, 100)]), before.invert([(200, 100)]))
+
+
+def test_pan_scrolls_the_layer(canvas):
+    pixels(canvas)
+    clips = []
+    render = canvas._render_mesh
+    canvas._render_mesh = lambda painter, clip, detailed: (clips.append(clip), render(painter, clip, detailed))
+    canvas.set_view(canvas.view.panned(30, -20))
+    panned = pixels(canvas)
+    assert sorted((c.width(), c.height()) for c in clips) == [(30, 600), (800, 20)]
+
+    fresh = HalfEdgeCanvas()
+    fresh.set_data(canvas.vertices, canvas.edges)
+    fresh.set_view(canvas.view)
+    assert (panned == pixels(fresh)).all()
+
+
+def test_main_window_keeps_file_coordinates(app, tmp_path):
+    path = tmp_path / 'mesh.obj'
+    path.write_text(OBJ)
+    window = MainWindow()
+    window.load_file(str(path))
+    wait_for(app, window.loader)
+    assert sorted(v.getxy() for v in window.canvas.vertices) == [(0, 0), (0, 1), (1, 3), (2, 0), (2, 1)]
+    assert window.canvas.view.scale > 50
+    window.close()
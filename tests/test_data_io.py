@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.utils.data_io import get_data, parse_obj, read_obj
+
+SQUARE = """# unit square split into two triangles
+v 0.0 0.0 0.0
+v 1.0 0.0 0.0
+v 1.0 1.0 0.0
+v 0.0 1.0 0.0
+f 1/1/1 2/2/1 3/3/1
+f 1 3 4
+"""
+
+
+@pytest.fixture
+def square(tmp_path):
+    path = tmp_path / 'square.obj'
+    path.write_text(SQUARE)
+    return str(path)
+
+
+def test_shared_edges_are_matched(square):
+    arrays = read_obj(square)
+    assert arrays.n_vertices == 4
+    # 5 distinct edges: the diagonal 1-3 is shared by both faces
+    assert arrays.n_half_edges == 10
+    assert np.array_equal(arrays.origin[arrays.twin], arrays.target)
+    fn = arrays.face_next
+    h = np.arange(arrays.n_half_edges)
+    # both triangles and the 4-sided outer face are closed cycles
+    assert np.count_nonzero(fn[fn[fn[h]]] == h) == 6
+    assert np.count_nonzero(fn[fn[fn[fn[h]]]] == h) == 4
+
+
+def test_small_chunks_and_relative_indices(tmp_path, square):
+    path = tmp_path / 'relative.obj'
+    path.write_text(SQUARE.replace('f 1 3 4', 'f -4 -2 -1'))
+    expected = parse_obj(square)
+    for chunk_size in (7, 64, 1 << 20):
+        result = parse_obj(str(path), chunk_size=chunk_size)
+        for got, want in zip(result, expected):
+            assert np.array_equal(got, want)
+
+
+def test_parallel_ranges_match_sequential(tmp_path):
+    # Interleaved vertex and face blocks, with relative indices, so every
+    # range has to be shifted by the vertices of the ranges before it
+    lines = []
+    for k in range(40):
+        lines += [f"v {k} 0", f"v {k} 1", f"v {k + 0.5} 2", "f -3 -2 -1", f"f {3 * k + 1} {3 * k + 2} {3 * k + 3}"]
+    path = tmp_path / 'strips.obj'
+    path.write_text("\n".join(lines) + "\n")
+    expected = parse_obj(str(path), chunk_size=64)
+    for processes in (2, 3, 7):
+        result = parse_obj(str(path), chunk_size=64, processes=processes)
+        for got, want in zip(result, expected):
+            assert np.array_equal(got, want)
+    assert np.array_equal(expected[1][:6], [0, 1, 2, 0, 1, 2])
+
+
+def test_compact_vertices_and_malformed_records(tmp_path):
+    path = tmp_path / 'graph.obj'
+    path.write_text("v 1.70\nv 1.55\nv bad\nv 50.70\nf 1 2 3\nf 1 x 2\nf 1 2\n")
+    coords, face_vertices, face_sizes = parse_obj(str(path))
+    assert coords.tolist() == [[1, 70], [1, 55], [50, 70]]
+    assert face_vertices.tolist() == [0, 1, 2]
+    assert face_sizes.tolist() == [3]
+
+
+@pytest.mark.parametrize('chunk_size', [64, 1 << 20])
+def test_mixed_widths_are_not_regrouped(tmp_path, chunk_size):
+    path = tmp_path / 'mixed.obj'
+    path.write_text("v 1 2 3\nv 4 5\nv 6 7 8 9\nv 0 0\nf 1 2 3 4\nf 1 2\nf 4/1 3/1 2/1\n")
+    coords, face_vertices, face_sizes = parse_obj(str(path), chunk_size=chunk_size)
+    assert coords.tolist() == [[1, 2], [4, 5], [6, 7], [0, 0]]
+    # One quad and one triangle; the two-index record is skipped
+    assert face_vertices.tolist() == [0, 1, 2, 3, 3, 2, 1]
+    assert face_sizes.tolist() == [4, 3]
+
+
+def test_get_data_links_like_snapshot(square):
+    edges, vertices = get_data(square)
+    assert len(vertices) == 4 and len(edges) == 5
+    for he in edges:
+        assert he.S.S is he
+        assert he.Next.V is he.V
+    rebuilt = HalfEdgeArrays.from_half_edges(edges, vertices)
+    assert rebuilt.n_half_edges == 10
+
+
+def test_missing_file():
+    assert get_data('does/not/exist.obj') == ([], [])
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from src.core.half_edge_builder import HalfEdgeBuilder
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.utils.database import Data_base
+
+COORDS = [(0, 0), (2, 0), (2, 1), (0, 1), (1, 3)]
+EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (2, 4), (3, 4)]
+
+
+@pytest.fixture
+def base(tmp_path):
+    with Data_base(str(tmp_path / 'mesh.db')) as db:
+        yield db
+
+
+def topology(arrays):
+    """Mesh connectivity expressed with ids instead of indices."""
+    vid, eid = arrays.vertex_ids.tolist(), arrays.edge_ids.tolist()
+    links = {
+        eid[h]: (vid[arrays.origin[h]], eid[arrays.twin[h]], eid[arrays.next[h]])
+        for h in range(arrays.n_half_edges)
+    }
+    faces = {}
+    for h, face in enumerate(arrays.face_ids.tolist()):
+        faces.setdefault(face, set()).add(eid[h])
+    return links, sorted(sorted(f) for f in faces.values())
+
+
+def test_round_trip(base):
+    mesh = HalfEdgeArrays.from_edge_list(COORDS, EDGES, weights=[1, np.nan, 2, 3, np.nan, 4, 5])
+    base.save_arrays(mesh)
+    loaded = base.load_arrays()
+    assert np.array_equal(loaded.coords, mesh.coords)
+    assert np.array_equal(loaded.edge_ids, mesh.edge_ids)
+    assert np.array_equal(loaded.next, mesh.next)
+    assert np.array_equal(loaded.weight, mesh.weight, equal_nan=True)
+    assert np.array_equal(loaded.face_ids, mesh.face_ids)
+
+
+def test_object_graph_round_trip(base):
+    builder = HalfEdgeBuilder()
+    for x, y in COORDS:
+        builder.add_vertex(x, y)
+    for a, b in EDGES:
+        builder.add_edge(builder._vertices[a], builder._vertices[b])
+    vertices, edges = builder.build()
+    mesh = HalfEdgeArrays.from_half_edges(edges, vertices)
+
+    base.save_arrays(mesh)
+    base.save_arrays(mesh)  # saving again replaces the stored mesh
+    assert len(base.read_data()) == len(EDGES)
+    assert topology(base.load_arrays()) == topology(mesh)
+
+
+def test_rows_without_topology(base):
+    base.creating_table()
+    v1 = base.add_vertex(0, 0)
+    v2 = base.add_vertex(1, 0)
+    base.adding_edge(v1, v2)
+    assert [tuple(row) for row in base.read_data()] == [(1, v1, v2)]
+    with pytest.raises(ValueError):
+        base.load_arrays()
+
+
+def test_load_region(base):
+    n = 6
+    coords = [(x, y) for y in range(n) for x in range(n)]
+    edges = [(v, v + 1) for v in range(n * n) if v % n < n - 1]
+    edges += [(v, v + n) for v in range(n * (n - 1))]
+    mesh = HalfEdgeArrays.from_edge_list(coords, edges)
+    base.save_arrays(mesh)
+
+    region = base.load_region((1.5, 1.5, 3.5, 3.5))
+    sub = region.arrays
+    xy = {tuple(p) for p in sub.coords.tolist()}
+    inside = {(x, y) for x in (2, 3) for y in (2, 3)}
+    # the 4 inner vertices plus the far ends of the 8 edges leaving the box
+    assert inside <= xy and len(xy) == 12
+    assert sub.n_half_edges == 2 * (4 + 8)
+    assert int(region.boundary.sum()) == 2 * 8
+    assert set(sub.edge_ids.tolist()) <= set(mesh.edge_ids.tolist())
+    # rings of the sub-mesh stay consistent
+    assert np.array_equal(sub.origin[sub.next], sub.origin)
+
+    assert base.load_region((10, 10, 11, 11)).arrays.n_vertices == 0
+
+
+def test_spatial_index_follows_updates(base):
+    mesh = HalfEdgeArrays.from_edge_list(COORDS, EDGES)
+    base.save_arrays(mesh)
+    vid = mesh.vertex_ids.tolist()
+    rows = base.con.execute('SELECT count(*) FROM EDGE_RTREE').fetchone()[0]
+    assert rows == len(EDGES)
+
+    def region_edges(bbox):
+        region = base.load_region(bbox)
+        return region.arrays.n_half_edges // 2, set(region.arrays.vertex_ids.tolist())
+
+    # Move the top vertex (1, 3) far to the right: its two edges follow it
+    with base.con:
+        base.con.execute('UPDATE VERTEX SET x = 10, y = 10 WHERE id = ?', (vid[4],))
+    assert region_edges((0.5, 2.5, 1.5, 3.5)) == (0, set())
+    count, vertices = region_edges((9.5, 9.5, 10.5, 10.5))
+    assert count == 2 and vid[4] in vertices
+    # The edge boxes now reach across the gap
+    assert region_edges((5, 5, 6, 6))[0] == 2
+
+    # Rewire the diagonal 0-2 to 1-3
+    with base.con:
+        base.con.execute('UPDATE EDGES SET V1 = ?, V2 = ? WHERE V1 = ? AND V2 = ?',
+                         (vid[1], vid[3], vid[0], vid[2]))
+    box = base.con.execute('SELECT min_x, max_x, min_y, max_y FROM EDGE_RTREE AS R JOIN EDGES AS E '
+                           'ON E.id = R.id WHERE E.V1 = ?', (vid[1],)).fetchall()
+    assert (0.0, 2.0, 0.0, 1.0) in [tuple(row) for row in box]
+
+    # Rows added after a bulk save are indexed too
+    new = base.add_vertex(20, 20)
+    assert region_edges((19, 19, 21, 21))[1] == {new}
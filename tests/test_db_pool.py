@@ -0,0 +1,97 @@
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.utils.db_pool import ConnectionPool
+from benchmarks.common import grid_triangulation
+
+
+@pytest.fixture
+def pool(tmp_path):
+    with ConnectionPool(str(tmp_path / 'pool.db')) as pool:
+        yield pool
+
+
+def test_concurrent_readers(pool):
+    mesh = grid_triangulation(10, 10, jitter=0)
+    pool.submit(lambda db: db.save_arrays(mesh)).result()
+
+    def query(i):
+        x = i % 8
+        region = pool.reader().load_region((x + 0.5, 0.5, x + 1.5, 1.5))
+        return region.arrays.n_half_edges
+
+    with ThreadPoolExecutor(4) as ex:
+        counts = list(ex.map(query, range(32)))
+    # six edges at the one vertex inside, two diagonals whose boxes reach in
+    assert set(counts) == {2 * (6 + 2)}
+    assert np.array_equal(pool.reader().load_arrays().coords, mesh.coords)
+
+
+def test_writes_are_batched_and_isolated(pool):
+    with ThreadPoolExecutor(4) as ex:
+        futures = list(ex.map(lambda i: pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (i + 1, i, i)),
+                              range(200)))
+    duplicate = pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (1, 0, 0))
+    after = pool.execute_many('INSERT INTO VERTEX VALUES(?, ?, ?)', [(1000, 0, 0), (1001, 1, 1)])
+    assert sum(f.result() for f in futures) == 200
+    with pytest.raises(sqlite3.IntegrityError):
+        duplicate.result()
+    assert after.result() == 2
+
+    rows = pool.reader().con.execute('SELECT count(*) FROM VERTEX').fetchone()[0]
+    assert rows == 202
+    with pytest.raises(sqlite3.OperationalError):
+        pool.reader().con.execute('DELETE FROM VERTEX')
+
+
+def test_non_sqlite_errors_fail_only_their_statement(pool):
+    too_big = pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (2 ** 70, 1.0, 2.0))
+    after = pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (1, 1.0, 2.0))
+    with pytest.raises(OverflowError):
+        too_big.result(timeout=5)
+    assert after.result(timeout=5) == 1
+
+    def failing(db):
+        raise KeyError('boom')
+    with pytest.raises(KeyError):
+        pool.submit(failing).result(timeout=5)
+    assert pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (2, 0, 0)).result(timeout=5) == 1
+
+
+def test_queued_work_fails_when_the_writer_dies(pool):
+    release = threading.Event()
+    blocker = pool.submit(lambda db: release.wait(5))
+    queued = [pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (i + 1, 0, 0)) for i in range(3)]
+    task = pool.submit(lambda db: 1)
+
+    def crash(con, batch):
+        raise SystemError('writer bug')
+    pool._run_batch = crash
+    release.set()
+    assert blocker.result(timeout=5)
+    for future in queued + [task]:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+    with pytest.raises(RuntimeError):
+        pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (9, 0, 0))
+
+
+def test_closed_pool_rejects_writes(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'closed.db'))
+    pending = pool.execute('INSERT INTO VERTEX VALUES(?, ?, ?)', (1, 0, 0))
+    pool.close()
+    assert pending.result(timeout=5) == 1
+    with pytest.raises(RuntimeError):
+        pool.execute_many('INSERT INTO VERTEX VALUES(?, ?, ?)', [(2, 0, 0)])
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda db: None)
+    pool.close()
+
+
+def test_memory_database_rejected():
+    with pytest.raises(ValueError):
+        ConnectionPool(':memory:')
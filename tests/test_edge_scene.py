@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.visualization.edge_scene import EdgeScene, points_in_rect, vertex_coords
+from src.visualization.gui import (HalfEdgeCanvas, _api_lines_path, _lines_path, _same_path,
+                                   _streamed_lines_path, _streamed_path_ok)
+from benchmarks.common import grid_triangulation
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def both_halves(edges):
+    return [h for e in edges for h in (e, e.S)]
+
+
+def test_twins_are_drawn_once():
+    arrays = HalfEdgeArrays.from_edge_list([(0, 0), (10, 0), (0, 10)], [(0, 1), (1, 2), (2, 0)])
+    _, edges = arrays.to_half_edges()
+    scene = EdgeScene(both_halves(edges))
+    assert len(scene) == 3 and scene.edges == edges
+    assert np.allclose(scene.midpoints(np.array([0])), [[5, 0]])
+
+
+def test_visible_culls_to_rectangle():
+    arrays = grid_triangulation(20, 20)
+    vertices, edges = arrays.to_half_edges(arrays.make_vertices())
+    scene = EdgeScene(both_halves(edges))
+    visible = scene.visible((2.5, 2.5, 5.5, 5.5))
+    seg = scene.segments
+    lo = np.minimum(seg[:, :2], seg[:, 2:])
+    hi = np.maximum(seg[:, :2], seg[:, 2:])
+    expected = np.flatnonzero((lo <= 5.5).all(axis=1) & (hi >= 2.5).all(axis=1))
+    assert visible.tolist() == expected.tolist()
+    assert len(scene.visible((-1, -1, 30, 30))) == len(scene)
+    assert len(points_in_rect(vertex_coords(vertices), (2.5, 2.5, 5.5, 5.5))) == 9
+
+
+def test_refreshed_edges_are_found_where_they_moved():
+    arrays = grid_triangulation(20, 20)
+    vertices, edges = arrays.to_half_edges(arrays.make_vertices())
+    scene = EdgeScene(edges)
+    grid = scene.grid
+    rng = np.random.default_rng(3)
+    moved = rng.choice(len(edges), 30, replace=False)
+    for i in moved.tolist():
+        edges[i].V = vertices[rng.integers(len(vertices))]
+    old, new = scene.refresh([edges[i].S for i in moved.tolist()])
+    assert scene.grid is grid and len(old) == len(new) == 30
+    fresh = EdgeScene(edges)
+    for x, y in rng.uniform(-1, 20, (50, 2)).tolist():
+        rect = (x, y, x + 3, y + 2)
+        assert sorted(scene.visible(rect).tolist()) == sorted(fresh.visible(rect).tolist())
+        assert scene.nearest((x, y), 0.5) is fresh.nearest((x, y), 0.5)
+
+
+@pytest.mark.parametrize('n, scale', [(20, 40.0), (100, 5.0)])
+def test_paint_detailed_and_dense_views(app, n, scale):
+    arrays = grid_triangulation(n, n, jitter=0)
+    vertices, edges = arrays.to_half_edges(arrays.make_vertices(arrays.coords * scale + 5))
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, both_halves(edges))
+    canvas.selected_edge = edges[0].S
+    canvas.selected_vertex = vertices[0]
+    image = canvas.grab().toImage().convertToFormat(QImage.Format.Format_RGB32)
+    pixels = np.frombuffer(image.constBits().asstring(image.sizeInBytes()), dtype=np.uint8)
+    bgr = pixels.reshape(image.height(), -1, 4)[:, :image.width(), :3].astype(int)
+    blue = (bgr[..., 0] > 200) & (bgr[..., 2] < 50)
+    red = (bgr[..., 2] > 200) & (bgr[..., 0] < 50)
+    ys, xs = np.nonzero(blue)
+    assert blue.any() and red.any()
+    assert xs.max() <= 5 + (n - 1) * scale + 5 and ys.max() <= 5 + (n - 1) * scale + 5
+
+
+def test_vertex_positions_follow_appends(app):
+    canvas = HalfEdgeCanvas()
+    arrays = HalfEdgeArrays.from_edge_list([(0, 0), (10, 0), (0, 10)], [(0, 1), (1, 2), (2, 0)])
+    vertices, _ = arrays.to_half_edges()
+    canvas.set_data(vertices[:2], [])
+    assert len(canvas.vertex_positions()) == 2
+    canvas.vertices.append(vertices[2])
+    assert canvas.vertex_positions().tolist() == [[0, 0], [10, 0], [0, 10]]
+
+
+def test_lines_path_from_buffer(app):
+    path = _lines_path(np.array([[0, 0, 10, 0], [1.5, 2.5, 3, 4]]))
+    assert path.elementCount() == 4
+    elements = [path.elementAt(i) for i in range(4)]
+    assert [(e.isMoveTo(), e.x, e.y) for e in elements] == [
+        (True, 0, 0), (False, 10, 0), (True, 1.5, 2.5), (False, 3, 4)]
+
+
+
+@pytest.mark.parametrize('n', [0, 1, 5, 1000])
+def test_streamed_path_matches_the_api(app, n):
+    assert _streamed_path_ok()
+    segments = np.random.default_rng(n).uniform(-50, 50, (n, 4))
+    streamed, built = _streamed_lines_path(segments), _api_lines_path(segments)
+    assert _same_path(streamed, built)
+    assert streamed.currentPosition() == built.currentPosition()
+    # Both keep extending the same way
+    for path in (streamed, built):
+        path.lineTo(7, 7)
+        path.closeSubpath()
+    assert streamed == built
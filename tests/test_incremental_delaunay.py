@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from scipy.spatial import ConvexHull, Delaunay
+
+from src.algorithms.incremental_delaunay import (EVENT_COLUMNS, EventKind, IncrementalDelaunay,
+                                                 spatial_order, triangulate)
+
+
+def edge_set(triangles):
+    pairs = np.sort(np.vstack([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]]), axis=1)
+    return set(map(tuple, pairs.tolist()))
+
+
+@pytest.mark.parametrize('sort', [False, True])
+def test_matches_scipy_on_random_points(sort):
+    coords = np.random.default_rng(0).uniform(0, 100, (500, 2))
+    arrays, log = triangulate(coords, sort=sort)
+    assert log is None
+    dt = IncrementalDelaunay(coords).insert_all(spatial_order(coords) if sort else None)
+    assert edge_set(dt.triangles()) == edge_set(Delaunay(coords).simplices)
+    assert arrays.n_half_edges == 2 * len(edge_set(Delaunay(coords).simplices))
+    assert len(arrays.triangles()) == len(Delaunay(coords).simplices)
+
+
+def test_triangles_are_delaunay_with_points_on_edges():
+    # Grid points are cocircular and many fall on existing edges
+    gx, gy = np.meshgrid(np.arange(8.0), np.arange(6.0))
+    coords = np.column_stack([gx.ravel(), gy.ravel()])
+    dt = IncrementalDelaunay(coords, record=True).insert_all()
+    triangles = dt.triangles()
+    assert len(triangles) == 2 * 7 * 5
+    for a, b, c in triangles.tolist():
+        p = coords[[a, b, c]]
+        u, w = p[1] - p[0], p[2] - p[0]
+        assert u[0] * w[1] - u[1] * w[0] > 0
+        # No point strictly inside the circumcircle
+        d = coords - p[2]
+        q = p[:2] - p[2]
+        det = ((q[0] @ q[0]) * (q[1, 0] * d[:, 1] - d[:, 0] * q[1, 1])
+               - (q[1] @ q[1]) * (q[0, 0] * d[:, 1] - d[:, 0] * q[0, 1])
+               + (d ** 2).sum(axis=1) * (q[0, 0] * q[1, 1] - q[1, 0] * q[0, 1]))
+        assert (det > -1e-9).all()
+
+
+@pytest.mark.parametrize('scale', [(100, 0.01), (1e-3, 50)])
+def test_thin_inputs_keep_their_hull(scale):
+    # A finite enclosing triangle cuts off flat triangles along the hull
+    coords = np.random.default_rng(2).uniform(0, 1, (300, 2)) * scale
+    triangles = IncrementalDelaunay(coords).insert_all(spatial_order(coords)).triangles()
+    assert edge_set(triangles) == edge_set(Delaunay(coords).simplices)
+    a, b, c = (coords[triangles[:, i]] for i in range(3))
+    area = 0.5 * ((b - a)[:, 0] * (c - a)[:, 1] - (b - a)[:, 1] * (c - a)[:, 0])
+    assert (area > 0).all()
+    assert area.sum() == pytest.approx(ConvexHull(coords).volume, rel=1e-9)
+
+
+def test_point_on_an_edge_splits_it():
+    coords = np.array([[0, 0], [4, 0], [0, 4], [2, 2]], dtype=float)
+    dt = IncrementalDelaunay(coords, record=True).insert_all()
+    assert sorted(map(sorted, dt.triangles().tolist())) == [[0, 1, 3], [0, 2, 3]]
+    split = dt.log.events[dt.log.events[:, 0] == EventKind.SPLIT_EDGE]
+    assert len(split) == 1 and split[0, 1] == 3 and set(split[0, 2:4]) == {1, 2}
+
+
+def test_duplicates_are_skipped():
+    coords = np.array([[0, 0], [4, 0], [0, 4], [4, 0], [1, 1]], dtype=float)
+    dt = IncrementalDelaunay(coords)
+    assert [dt.insert(p) for p in range(5)] == [True, True, True, False, True]
+    assert len(dt.triangles()) == 3
+
+
+def test_log_rows():
+    coords = np.array([[0, 0], [4, 0], [0, 4], [3, 3]], dtype=float)
+    arrays, log = triangulate(coords, record=True, sort=False)
+    events = log.events
+    assert events.shape == (len(log), EVENT_COLUMNS) and events.dtype == np.int32
+    assert events[:, 0].tolist().count(EventKind.INSERT) == 4
+    assert events[0].tolist() == [EventKind.INSERT, 0, -1, -1, -1, -1]
+    assert events[1].tolist() == [EventKind.SPLIT, 0, 4, 5, 6, -1]
+    # The enclosing triangle's edges are removed at the end
+    assert (events[-3:, 0] == EventKind.REMOVE).all()
+    assert log.n_points == 4 and len(log.coords) == 7
+    assert arrays.n_half_edges == 2 * 5
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtWidgets import QApplication
+
+from src.visualization.gui import MainWindow
+from src.visualization.loader import AsyncMeshLoader
+from src.visualization.main import load_data_from_file
+
+OBJ = "v 0 0\nv 2 0\nv 2 1\nv 0 1\nv 1 3\nf 1 2 3\nf 1 3 4\nf 4 3 5\n"
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def obj_file(tmp_path):
+    path = tmp_path / 'mesh.obj'
+    path.write_text(OBJ)
+    return str(path)
+
+
+def wait_for(app, loader):
+    while loader.is_running():
+        app.processEvents()
+    # deliver the signals queued by the worker before its thread stopped
+    app.sendPostedEvents()
+    app.processEvents()
+
+
+def test_streams_vertices_then_edge_chunks(app, obj_file):
+    loader = AsyncMeshLoader()
+    events, chunks, meshes = [], [], []
+    worker = loader.start(obj_file, chunk_size=2)
+    worker.vertices_ready.connect(lambda vertices: events.append(('vertices', len(vertices))))
+    worker.edges_ready.connect(lambda edges: (events.append(('edges', len(edges))), chunks.append(edges)))
+    worker.loaded.connect(meshes.append)
+    wait_for(app, loader)
+
+    assert events[0] == ('vertices', 5)
+    assert [n for kind, n in events[1:]] == [2, 2, 2, 1]
+    edges = [e for chunk in chunks for e in chunk]
+    assert len(meshes) == 1 and meshes[0].n_half_edges == 2 * len(edges)
+    # rings are linked once every chunk has been emitted
+    assert all(e.Next is not None and e.S.Next is not None for e in edges)
+
+    _, reference = load_data_from_file(obj_file)
+    assert sorted((e.V.getxy(), e.S.V.getxy()) for e in edges) == \
+        sorted((e.V.getxy(), e.S.V.getxy()) for e in reference)
+
+
+def test_missing_file_fails(app, tmp_path):
+    loader = AsyncMeshLoader()
+    errors = []
+    worker = loader.start(str(tmp_path / 'missing.obj'))
+    worker.failed.connect(errors.append)
+    wait_for(app, loader)
+    assert len(errors) == 1 and 'not found' in errors[0]
+
+
+def test_main_window_draws_while_loading(app, obj_file):
+    window = MainWindow()
+    window.load_file(obj_file)
+    wait_for(app, window.loader)
+    assert len(window.canvas.vertices) == 5
+    assert len(window.canvas.edges) == 7
+    assert window.statusBar.currentMessage().startswith("Loaded 5 vertices")
+    window.close()
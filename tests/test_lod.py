@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtWidgets import QApplication
+
+from src.visualization.gui import HalfEdgeCanvas
+from src.visualization.lod import MIN_LEVEL_EDGES, LevelOfDetail, _labels
+from benchmarks.common import grid_triangulation
+
+
+def mesh_segments(n, scale=1.0):
+    arrays = grid_triangulation(n, n)
+    half = np.flatnonzero(np.arange(arrays.n_half_edges) < arrays.twin)
+    coords = arrays.coords * scale
+    return np.hstack([coords[arrays.origin[half]], coords[arrays.target[half]]])
+
+
+def test_labels_match_unique():
+    rng = np.random.default_rng(0)
+    for high in (50, 10 ** 9):
+        key = rng.integers(0, high, 1000)
+        inverse, k = _labels(key)
+        _, expected = np.unique(key, return_inverse=True)
+        assert k == expected.max() + 1 and (inverse == expected).all()
+
+
+def test_levels_coarsen():
+    segments = mesh_segments(120)
+    lod = LevelOfDetail(segments)
+    assert len(lod.levels) >= 3
+    counts = [len(segments)] + [len(level.edges) for level in lod.levels]
+    assert all(b <= 0.75 * a for a, b in zip(counts, counts[1:]))
+    assert len(lod.levels[-1].edges) <= 2 * MIN_LEVEL_EDGES
+    lo, hi = segments.reshape(-1, 2).min(axis=0), segments.reshape(-1, 2).max(axis=0)
+    for level in lod.levels:
+        assert (level.edges[:, 0] < level.edges[:, 1]).all()
+        assert len(np.unique(level.edges, axis=0)) == len(level.edges)
+        assert (level.points >= lo).all() and (level.points <= hi).all()
+        # merged edges connect neighbouring cells only
+        lengths = np.hypot(*(level.segments[:, 2:] - level.segments[:, :2]).T)
+        assert lengths.max() <= 3 * level.cell_size
+
+
+def test_select_by_pixel_size():
+    lod = LevelOfDetail(mesh_segments(120))
+    assert lod.select(pixel_size=0.01) is None
+    assert lod.select(pixel_size=1000) is lod.levels[-1]
+    chosen = lod.select(pixel_size=1.0)
+    assert chosen is not None and chosen.cell_size <= 3.0
+    assert LevelOfDetail(mesh_segments(5)).levels == []
+
+
+def test_canvas_draws_level_when_zoomed_out():
+    app = QApplication.instance() or QApplication([])
+    arrays = grid_triangulation(150, 150)
+    vertices, edges = arrays.to_half_edges(arrays.make_vertices(arrays.coords + 20))
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, edges)
+    level = canvas.edge_scene().detail_level(pixel_size=1.0)
+    assert level is not None and len(level.edges) < len(edges)
+    image = canvas.grab().toImage()
+    assert image.pixelColor(95, 95) != image.pixelColor(700, 500)
@@ -0,0 +1,130 @@
+import numpy as np
+
+from src.gui.main_window import MeshCanvas, edge_key
+
+
+class FakeCanvas:
+    """Stands in for ``tk.Canvas`` (which needs a display) and logs item calls."""
+
+    def __init__(self):
+        self.items = {}
+        self.calls = []
+        self._next = 1
+
+    def _create(self, kind, *coords, **options):
+        item = self._next
+        self._next += 1
+        self.items[item] = (kind, list(coords))
+        self.calls.append(('create', kind))
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create('line', *coords)
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', *coords)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', *coords)
+
+    def coords(self, item, *coords):
+        self.items[item] = (self.items[item][0], list(coords))
+        self.calls.append(('coords', item))
+
+    def delete(self, item):
+        del self.items[item]
+        self.calls.append(('delete', item))
+
+    def lines(self):
+        return {item: coords for item, (kind, coords) in self.items.items() if kind == 'line'}
+
+
+def line_set(mesh):
+    return {tuple(mesh.canvas.items[mesh.edge_items[e.id]][1]) for e in mesh.edges}
+
+
+def edge_segments(mesh):
+    return {e.V.getxy() + e.S.V.getxy() for e in mesh.edges}
+
+
+def make_mesh(n=30, seed=0):
+    mesh = MeshCanvas(FakeCanvas())
+    for x, y in np.random.default_rng(seed).uniform(0, 500, (n, 2)).tolist():
+        mesh.add_vertex(x, y)
+    return mesh
+
+
+def test_triangulation_draws_one_line_per_edge():
+    mesh = make_mesh()
+    mesh.triangulate()
+    lines = mesh.canvas.lines()
+    assert len(lines) == len(mesh.edges) > 0
+    assert line_set(mesh) == edge_segments(mesh)
+    for edge in mesh.edges:
+        assert mesh.edge_items[edge.id] == mesh.edge_items[edge.S.id]
+    assert len(mesh.canvas.items) == len(lines) + 2 * 30
+
+
+def test_edits_touch_only_changed_items():
+    mesh = make_mesh()
+    mesh.triangulate()
+    before = dict(mesh.canvas.lines())
+    mesh.canvas.calls.clear()
+
+    mesh.add_vertex(250.0, 250.0)
+    after = mesh.canvas.lines()
+    changed = {item for item, coords in after.items() if before.get(item) != coords}
+    touched = {item for call, item in mesh.canvas.calls if call in ('coords', 'delete')}
+    # No line is recreated or deleted unless the edge count grew or shrank
+    assert ('delete', 'line') not in mesh.canvas.calls
+    assert changed <= touched | {item for item in after if item not in before}
+    kept = before.keys() & after.keys()
+    assert len(kept - touched) > len(after) // 2
+    assert line_set(mesh) == edge_segments(mesh)
+
+    # Removing the vertex again restores the triangulation
+    new = mesh.vertices[-1]
+    mesh.remove_vertex(new)
+    assert len(mesh.canvas.lines()) == len(before)
+    assert set(map(tuple, mesh.canvas.lines().values())) == set(map(tuple, before.values()))
+
+
+def test_sync_moves_freed_lines_before_creating():
+    mesh = make_mesh(10)
+    mesh.connect_chain()
+    assert len(mesh.canvas.lines()) == 9
+    pairs = mesh.pairs()
+    dropped = sorted(pairs)[:3]
+    ids = [v.Vertex_id for v in mesh.vertices]
+    extra = {(ids[0], ids[5]), (ids[1], ids[7])}
+    mesh.canvas.calls.clear()
+    mesh.set_edges((pairs - set(dropped)) | extra)
+    kinds = [call for call, _ in mesh.canvas.calls]
+    assert kinds.count('coords') == 2 and kinds.count('delete') == 1 and 'create' not in kinds
+    assert line_set(mesh) == edge_segments(mesh)
+    assert {edge_key(e) for e in mesh.edges} == (pairs - set(dropped)) | extra
+
+
+def test_remove_untriangulated_vertex_drops_its_edges():
+    mesh = make_mesh(5)
+    mesh.connect_chain()
+    middle = mesh.vertices[2]
+    mesh.remove_vertex(middle)
+    assert len(mesh.canvas.lines()) == 2
+    assert middle.Vertex_id not in mesh.vertex_items
+    assert all(middle.Vertex_id not in edge_key(e) for e in mesh.edges)
+    assert mesh.vertex_at(*mesh.vertices[0].getxy()) is mesh.vertices[0]
+    assert mesh.vertex_at(-100, -100) is None
+
+
+def test_clear_and_small_meshes():
+    mesh = MeshCanvas(FakeCanvas())
+    mesh.triangulate()
+    assert mesh.edges == []
+    mesh.add_vertex(0.0, 0.0)
+    mesh.add_vertex(10.0, 0.0)
+    assert len(mesh.canvas.lines()) == 0
+    mesh.add_vertex(0.0, 10.0)
+    assert len(mesh.canvas.lines()) == 3
+    mesh.clear()
+    assert mesh.canvas.items == {} and mesh.edge_items == {} and not mesh.triangulated
@@ -0,0 +1,81 @@
+import io
+
+import numpy as np
+import pytest
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.utils.mesh_codec import load_compressed, save_compressed, varint_decode, varint_encode
+
+COORDS = [(0, 0), (2, 0), (2, 1), (0, 1), (1, 3)]
+EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (2, 4), (3, 4)]
+
+
+def half_edges_by_id(arrays):
+    """Every half-edge as id -> (origin id, target id, weight)."""
+    vid = arrays.vertex_ids
+    return {
+        eid: (vid[o], vid[t], w)
+        for eid, o, t, w in zip(arrays.edge_ids.tolist(), arrays.origin.tolist(),
+                                arrays.target.tolist(), arrays.weight.tolist())
+    }
+
+
+def rings_by_id(arrays):
+    eid = arrays.edge_ids
+    return {eid[h]: eid[n] for h, n in enumerate(arrays.next.tolist())}
+
+
+def test_varints():
+    values = np.array([0, 1, 127, 128, 300, 2**40, 2**64 - 1], dtype=np.uint64)
+    encoded = varint_encode(values)
+    assert len(encoded) == 1 + 1 + 1 + 2 + 2 + 6 + 10
+    assert np.array_equal(varint_decode(encoded), values)
+
+
+@pytest.mark.parametrize('compression', ['none', 'zlib', 'lzma'])
+def test_lossless_round_trip(compression):
+    mesh = HalfEdgeArrays.from_edge_list(COORDS, EDGES, weights=[1, np.nan, 2, 3, np.nan, 4, 5])
+    buf = io.BytesIO()
+    save_compressed(mesh, buf, bits=None, compression=compression)
+    buf.seek(0)
+    loaded = load_compressed(buf, block_size=7)
+
+    index = {vid: i for i, vid in enumerate(mesh.vertex_ids.tolist())}
+    order = [index[vid] for vid in loaded.vertex_ids.tolist()]
+    assert np.array_equal(loaded.coords, mesh.coords[order])
+    got, expected = half_edges_by_id(loaded), half_edges_by_id(mesh)
+    assert got.keys() == expected.keys()
+    for eid, (a, b, w) in expected.items():
+        assert got[eid][:2] == (a, b)
+        assert got[eid][2] == w or (np.isnan(w) and np.isnan(got[eid][2]))
+    assert rings_by_id(loaded) == rings_by_id(mesh)
+
+
+def test_quantized_coordinates(tmp_path):
+    rng = np.random.default_rng(1)
+    coords = rng.uniform(-100, 100, (200, 2))
+    edges = np.column_stack([np.arange(199), np.arange(1, 200)])
+    mesh = HalfEdgeArrays.from_edge_list(coords, edges)
+    path = str(tmp_path / 'mesh.hemz')
+    save_compressed(mesh, path, bits=16)
+    loaded = load_compressed(path)
+
+    step = 200 / (2**16 - 1)
+    index = {vid: i for i, vid in enumerate(mesh.vertex_ids.tolist())}
+    order = [index[vid] for vid in loaded.vertex_ids.tolist()]
+    assert np.abs(loaded.coords - mesh.coords[order]).max() <= step / 2 + 1e-9
+    assert np.isnan(loaded.weight).all()
+    assert half_edges_by_id(loaded).keys() == half_edges_by_id(mesh).keys()
+
+
+def test_rejects_bad_input(tmp_path):
+    mesh = HalfEdgeArrays.from_edge_list(COORDS, EDGES)
+    with pytest.raises(ValueError):
+        save_compressed(mesh, io.BytesIO(), compression='bz2')
+    with pytest.raises(ValueError):
+        load_compressed(io.BytesIO(b'v 0 0\n' * 20))
+
+    buf = io.BytesIO()
+    save_compressed(mesh, buf)
+    with pytest.raises(ValueError):
+        load_compressed(io.BytesIO(buf.getvalue()[:-5]))
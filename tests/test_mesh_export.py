@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.utils.data_io import parse_obj, read_obj
+from src.utils.mesh_export import export_mesh, write_obj, write_ply
+
+# square split into two triangles, plus a quad on top
+COORDS = [(0, 0), (2, 0), (2, 1), (0, 1), (2, 3), (0, 3)]
+EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (2, 4), (4, 5), (5, 3)]
+
+
+@pytest.fixture
+def mesh():
+    return HalfEdgeArrays.from_edge_list(COORDS, EDGES)
+
+
+def face_sets(face_vertices, face_sizes):
+    offsets = np.cumsum(face_sizes) - face_sizes
+    return sorted(sorted(face_vertices[o:o + s].tolist()) for o, s in zip(offsets, face_sizes))
+
+
+def test_faces_are_counter_clockwise(mesh):
+    fv, fs = mesh.faces()
+    assert face_sets(fv, fs) == [[0, 1, 2], [0, 2, 3], [2, 3, 4, 5]]
+    offsets = np.cumsum(fs) - fs
+    for o, s in zip(offsets, fs):
+        p = mesh.coords[fv[o:o + s]]
+        q = np.roll(p, -1, axis=0)
+        assert (p[:, 0] * q[:, 1] - p[:, 1] * q[:, 0]).sum() > 0
+    assert len(mesh.faces(include_outer=True)[1]) == 4
+
+
+def test_triangles_fan_out_faces(mesh):
+    triangles = mesh.triangles()
+    assert len(triangles) == 4
+    p = mesh.coords[triangles]
+    u, v = p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]
+    doubled_area = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    assert (doubled_area > 0).all() and doubled_area.sum() / 2 == 2 + 4
+
+
+def test_obj_round_trip(tmp_path, mesh):
+    path = str(tmp_path / 'mesh.obj')
+    write_obj(mesh, path)
+    coords, fv, fs = parse_obj(path)
+    assert np.allclose(coords, mesh.coords)
+    assert face_sets(fv, fs) == face_sets(*mesh.faces())
+    assert read_obj(path).n_half_edges == mesh.n_half_edges
+
+
+def test_obj_number_formatting(tmp_path):
+    mesh = HalfEdgeArrays.from_edge_list([(-0.5, 1234.0625), (-0.0000001, 10), (3, 0)],
+                                         [(0, 1), (1, 2), (2, 0)])
+    path = tmp_path / 'mesh.obj'
+    write_obj(mesh, str(path), precision=4)
+    lines = path.read_text().splitlines()
+    assert lines[:3] == ['v -0.5000 1234.0625 0', 'v 0.0000 10.0000 0', 'v 3.0000 0.0000 0']
+    assert lines[3].split()[0] == 'f' and sorted(lines[3].split()[1:]) == ['1', '2', '3']
+
+
+def test_ply(tmp_path, mesh):
+    path = tmp_path / 'mesh.ply'
+    write_ply(mesh, str(path))
+    data = path.read_bytes()
+    body = data[data.index(b'end_header\n') + len(b'end_header\n'):]
+    xyz = np.frombuffer(body, dtype='<f8', count=3 * mesh.n_vertices).reshape(-1, 3)
+    assert np.array_equal(xyz[:, :2], mesh.coords) and not xyz[:, 2].any()
+    rest = body[xyz.nbytes:]
+    triangles = np.frombuffer(rest, dtype=[('n', 'u1'), ('v', '<i4', (3,))], count=2)
+    quad = np.frombuffer(rest[triangles.nbytes:], dtype=[('n', 'u1'), ('v', '<i4', (4,))])
+    assert triangles['n'].tolist() == [3, 3] and quad['n'].tolist() == [4]
+    assert sorted(quad['v'][0].tolist()) == [2, 3, 4, 5]
+
+
+def test_stl(tmp_path, mesh):
+    path = tmp_path / 'mesh.stl'
+    export_mesh(mesh, str(path))
+    data = path.read_bytes()
+    n = int(np.frombuffer(data[80:84], dtype='<u4')[0])
+    # two triangles plus the quad split in two
+    assert n == 4 and len(data) == 84 + 50 * n
+    records = np.frombuffer(data[84:], dtype=[('normal', '<f4', (3,)), ('v', '<f4', (3, 3)), ('attr', '<u2')])
+    assert (records['normal'] == [0, 0, 1]).all()
+    v = records['v']
+    cross = ((v[:, 1, 0] - v[:, 0, 0]) * (v[:, 2, 1] - v[:, 0, 1])
+             - (v[:, 1, 1] - v[:, 0, 1]) * (v[:, 2, 0] - v[:, 0, 0]))
+    assert np.allclose(np.sort(cross / 2), [1, 1, 2, 2])
+
+
+def test_unknown_format(tmp_path, mesh):
+    with pytest.raises(ValueError):
+        export_mesh(mesh, str(tmp_path / 'mesh.dxf'))
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.algorithms.pathfinding import dijkstra_arrays
+from src.utils.mesh_file import open_mesh, save_mesh
+
+COORDS = [(0, 0), (2, 0), (2, 1), (0, 1), (1, 3)]
+EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (2, 4), (3, 4)]
+
+
+@pytest.fixture
+def mesh():
+    return HalfEdgeArrays.from_edge_list(COORDS, EDGES)
+
+
+def test_round_trip(tmp_path, mesh):
+    path = str(tmp_path / 'mesh.hem')
+    save_mesh(mesh, path, face_ids=True)
+    mapped = open_mesh(path)
+
+    for name in ('coords', 'origin', 'twin', 'next', 'vertex_ids', 'edge_ids'):
+        assert np.array_equal(getattr(mapped, name), getattr(mesh, name))
+        assert getattr(mapped, name).dtype == getattr(mesh, name).dtype
+        assert not getattr(mapped, name).flags.writeable
+    assert np.isnan(mapped.weight).all()
+    assert np.array_equal(mapped.face_ids, mesh.face_ids)
+    assert np.array_equal(dijkstra_arrays(mapped, 0).distance, dijkstra_arrays(mesh, 0).distance)
+
+
+def test_weights_are_stored(tmp_path):
+    mesh = HalfEdgeArrays.from_edge_list(COORDS, EDGES, weights=[1, np.nan, 2, 3, np.nan, 4, 5])
+    path = str(tmp_path / 'weighted.hem')
+    save_mesh(mesh, path)
+    assert np.array_equal(open_mesh(path).weight, mesh.weight, equal_nan=True)
+
+
+@pytest.mark.parametrize('coords', [np.empty((0, 2)), [(0, 0), (1, 1)]])
+def test_meshes_without_edges(tmp_path, coords):
+    mesh = HalfEdgeArrays.from_edge_list(coords, np.empty((0, 2), dtype=np.int64))
+    path = str(tmp_path / 'empty.hem')
+    save_mesh(mesh, path, face_ids=True)
+    mapped = open_mesh(path)
+    assert mapped.n_vertices == len(mesh.coords) and mapped.n_half_edges == 0
+    assert np.array_equal(mapped.coords, mesh.coords)
+    assert mapped.coords.shape == (len(mesh.coords), 2) and mapped.face_ids.shape == (0,)
+
+
+def test_face_ids():
+    # square with one diagonal: two triangles and the outer face
+    mesh = HalfEdgeArrays.from_edge_list([(0, 0), (1, 0), (1, 1), (0, 1)],
+                                         [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)])
+    faces = mesh.face_ids
+    assert faces.max() == 2
+    assert np.array_equal(faces[mesh.face_next], faces)
+    assert sorted(np.bincount(faces).tolist()) == [3, 3, 4]
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'graph.obj'
+    path.write_text("v 0 0\nv 1 0\nv 0 1\nf 1 2 3\n")
+    with pytest.raises(ValueError):
+        open_mesh(str(path))
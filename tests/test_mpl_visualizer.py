@@ -0,0 +1,76 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+
+from src.algorithms.pathfinding import dijkstra_arrays
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.visualization.mpl_visualizer import MatplotlibVisualizer, mesh_segments, path_segments
+from benchmarks.common import grid_triangulation
+
+
+@pytest.fixture
+def vis():
+    vis = MatplotlibVisualizer()
+    yield vis
+    vis.close()
+
+
+def test_mesh_is_one_collection(vis):
+    arrays = grid_triangulation(6, 5)
+    vis.draw_mesh(arrays)
+    segments = mesh_segments(arrays)
+    assert segments.shape == (arrays.n_half_edges // 2, 2, 2)
+    assert len(vis.edges.get_segments()) == len(segments)
+    collections = len(vis.ax.collections)
+
+    # Redrawing reuses the collection
+    vis.draw_mesh(grid_triangulation(3, 3))
+    assert len(vis.ax.collections) == collections
+    assert len(vis.edges.get_segments()) == 3 * 2 * 2 + 4
+
+
+def test_face_values(vis):
+    arrays = grid_triangulation(4, 4)
+    vis.draw_mesh(arrays, face_values=arrays.coords[:, 0])
+    assert vis.faces is not None
+    vis.draw_mesh(arrays, face_values=np.arange(len(arrays.triangles())))
+    assert len(vis.faces.get_array()) == len(arrays.triangles())
+    vis.draw_mesh(arrays)
+    assert vis.faces is None
+
+
+def test_path_and_selection_overlays(vis):
+    arrays = grid_triangulation(5, 5)
+    vis.draw_mesh(arrays)
+    path = dijkstra_arrays(arrays, 0, 24).path_to(24)
+    vis.draw_path(path)
+    vis.draw_path(path)
+    assert len(vis.paths.get_segments()) == 2 * (len(path) - 1)
+    assert np.allclose(path_segments([path])[:, 0], path.points[:-1])
+    vis.clear_paths()
+    assert len(vis.paths.get_segments()) == 0
+
+    half_edge = vis.select_nearest_edge(tuple(arrays.coords[0] + [0.5, 0.0]))
+    assert {int(arrays.origin[half_edge]), int(arrays.target[half_edge])} == {0, 1}
+    assert len(vis.selection.get_segments()) == 1
+    assert vis.select_nearest_edge((100.0, 100.0), max_distance=1.0) == -1
+    assert len(vis.selection.get_segments()) == 0
+
+
+@pytest.mark.filterwarnings('error')
+@pytest.mark.parametrize('coords', [[(1, 2), (3, 2)], [(1, 2), (1, 2)], [(1, 2), (1, 5)]])
+def test_meshes_without_triangles_or_extent(vis, coords):
+    arrays = HalfEdgeArrays.from_edge_list(coords, [(0, 1)])
+    vis.draw_mesh(arrays, face_values=[1.0, 2.0])
+    assert vis.faces is None
+    (x0, x1), (y0, y1) = vis.ax.get_xlim(), vis.ax.get_ylim()
+    assert x0 < 1 <= x1 and y0 < 2 < y1
+
+
+def test_draw_half_edge_objects(vis, tmp_path):
+    _, edges = grid_triangulation(4, 3).to_half_edges()
+    vis.draw_edges(edges)
+    assert len(vis.edges.get_segments()) == len(edges)
+    vis.save(tmp_path / 'mesh.png')
+    assert (tmp_path / 'mesh.png').read_bytes()[:4] == b'\x89PNG'
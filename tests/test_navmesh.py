@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.algorithms.navmesh import NavMesh, string_pull
+
+
+@pytest.fixture
+def l_shape():
+    """Three unit cells forming an L, each split into two triangles."""
+    coords = [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1), (0, 2), (1, 2)]
+    edges = [(0, 1), (1, 2), (3, 4), (4, 5), (6, 7),
+             (0, 3), (3, 6), (1, 4), (4, 7), (2, 5),
+             (0, 4), (1, 5), (3, 7)]
+    return NavMesh(HalfEdgeArrays.from_edge_list(coords, edges))
+
+
+def test_triangles(l_shape):
+    assert l_shape.n_triangles == 6
+    assert (l_shape.neighbours >= 0).sum() == 2 * 5
+    assert l_shape.locate((0.9, 0.1)) >= 0
+    assert l_shape.locate((1.5, 1.5)) == -1
+
+
+def test_straight_line_inside_mesh(l_shape):
+    assert l_shape.find_path((0.2, 0.2), (1.8, 0.8)) == [(0.2, 0.2), (1.8, 0.8)]
+
+
+def test_path_bends_at_inner_corner(l_shape):
+    path = l_shape.find_path((1.8, 0.2), (0.5, 1.8))
+    assert path == [(1.8, 0.2), (1.0, 1.0), (0.5, 1.8)]
+    assert l_shape.find_path((0.5, 1.8), (1.8, 0.2)) == path[::-1]
+
+
+def test_outside_mesh(l_shape):
+    assert l_shape.find_path((0.2, 0.2), (1.5, 1.5)) is None
+
+
+def test_string_pull_same_triangle():
+    assert string_pull([((0, 0), (0, 0)), ((3, 4), (3, 4))]) == [(0, 0), (3, 4)]
+
+
+def test_locate_matches_a_full_scan():
+    from benchmarks.common import grid_triangulation
+
+    navmesh = NavMesh(grid_triangulation(12, 9))
+    pts = navmesh.arrays.coords[navmesh.triangles]
+    rng = np.random.default_rng(0)
+    for x, y in rng.uniform(-2, 13, (300, 2)).tolist():
+        a, b = pts, np.roll(pts, -1, axis=1)
+        cross = (b[..., 0] - a[..., 0]) * (y - a[..., 1]) - (b[..., 1] - a[..., 1]) * (x - a[..., 0])
+        inside = np.flatnonzero((cross <= 1e-12).all(axis=1))
+        assert navmesh.locate((x, y)) == (int(inside[0]) if len(inside) else -1)
+
+
+def walked_cost(navmesh, corridor, start, goal):
+    """Length walked through a corridor, entering each portal where find_corridor aims."""
+    segments = navmesh._search_lists[2]
+    (px, py), (gx, gy), total = start, goal, 0.0
+    for he in corridor:
+        ax, ay, bx, by = segments[he]
+        ex, ey, dx, dy = bx - ax, by - ay, gx - px, gy - py
+        denom = ex * dy - ey * dx
+        t = min(max(((px - ax) * dy - (py - ay) * dx) / denom if denom else 0.5, 0.0), 1.0)
+        total += math.hypot(ax + t * ex - px, ay + t * ey - py)
+        px, py = ax + t * ex, ay + t * ey
+    return total + math.hypot(gx - px, gy - py)
+
+
+def test_stale_queue_entries_are_skipped():
+    from benchmarks.common import grid_triangulation
+
+    # An entry improved on after it was queued used to be expanded with its
+    # old cost and the new entry point, giving a corridor walked at 6.214
+    navmesh = NavMesh(grid_triangulation(15, 15, jitter=0.45, seed=6))
+    start, goal = (0.2343, 3.5338), (2.5027, 8.9709)
+    corridor = navmesh.find_corridor(start, goal)
+    assert walked_cost(navmesh, corridor, start, goal) == pytest.approx(6.076, abs=1e-3)
@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.core.half_edge_ds import Vertex
+from src.core.half_edge_builder import HalfEdgeBuilder
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.algorithms.parallel_paths import ParallelPathExecutor, edge_costs
+
+
+def build_square(weight=None):
+    """Unit square 0-1-2-3 with the 0-2 diagonal."""
+    vertices = [Vertex(0, 0), Vertex(1, 0), Vertex(1, 1), Vertex(0, 1)]
+    builder = HalfEdgeBuilder()
+    for a, b in [(0, 1), (1, 2), (2, 3), (3, 0)]:
+        builder.add_edge(vertices[a], vertices[b])
+    builder.add_edge(vertices[0], vertices[2], weight=weight)
+    _, edges = builder.build()
+    return vertices, edges
+
+
+def test_snapshot_matches_objects():
+    vertices, edges = build_square()
+    arrays = HalfEdgeArrays.from_half_edges(edges, vertices)
+
+    assert arrays.n_vertices == 4
+    assert arrays.n_half_edges == 10
+    assert np.array_equal(arrays.twin[arrays.twin], np.arange(10))
+    assert np.array_equal(arrays.vertex_ids, [v.Vertex_id for v in vertices])
+    offsets, _ = arrays.csr
+    assert np.diff(offsets).tolist() == [3, 2, 3, 2]
+    with pytest.raises(ValueError):
+        arrays.origin[0] = 1
+
+
+def test_edge_costs_prefer_explicit_weight():
+    vertices, edges = build_square(weight=5.0)
+    arrays = HalfEdgeArrays.from_half_edges(edges, vertices)
+    costs = edge_costs(arrays)
+
+    diagonal = np.isin(arrays.origin, [0, 2]) & np.isin(arrays.target, [0, 2])
+    assert costs[diagonal].tolist() == [5.0, 5.0]
+    assert np.allclose(costs[~diagonal], 1.0)
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_distance_matrix(processes):
+    vertices, edges = build_square()
+    arrays = HalfEdgeArrays.from_half_edges(edges, vertices)
+
+    with ParallelPathExecutor(arrays, processes=processes) as executor:
+        dist = executor.distance_matrix([0, 1, 2, 3], chunk_size=1)
+
+    assert dist.shape == (4, 4)
+    assert np.allclose(dist[0], [0, 1, math.sqrt(2), 1])
+    assert np.allclose(dist[1], [1, 0, 1, 2])
+    assert np.allclose(dist, dist.T)
@@ -0,0 +1,127 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.core.half_edge_ds import Vertex
+from src.core.half_edge_builder import HalfEdgeBuilder
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.algorithms.pathfinding import (dijkstra, a_star, reconstruct_path,
+                                        dijkstra_arrays, a_star_arrays, edge_costs)
+from src.algorithms.weights import EdgeWeights, weights_for
+from benchmarks.common import grid_triangulation
+
+
+@pytest.fixture
+def grid():
+    """5 x 5 grid triangulation with unit spacing."""
+    return grid_triangulation(5, 5, jitter=0)
+
+
+def test_path_edges_and_cost(grid):
+    result = dijkstra_arrays(grid, 0, 24)
+    path = result.path_to(24)
+
+    assert path.vertices.tolist() == [0, 6, 12, 18, 24]
+    assert grid.origin[path.half_edges].tolist() == path.vertices[:-1].tolist()
+    assert grid.target[path.half_edges].tolist() == path.vertices[1:].tolist()
+    assert np.allclose(path.cost, [0, 1 * math.sqrt(2), 2 * math.sqrt(2), 3 * math.sqrt(2), 4 * math.sqrt(2)])
+    assert path.total_cost == pytest.approx(4 * math.sqrt(2))
+    assert path.points.tolist() == [[0, 0], [1, 1], [2, 2], [3, 3], [4, 4]]
+
+
+def test_a_star_matches_dijkstra(grid):
+    full = dijkstra_arrays(grid, 3)
+    for target in range(grid.n_vertices):
+        path = a_star_arrays(grid, 3, target).path_to(target)
+        assert path.total_cost == pytest.approx(full.distance[target])
+
+
+def test_a_star_with_cheap_weights(grid):
+    costs = edge_costs(grid) * 0.1
+    path = a_star_arrays(grid, 0, 24, costs=costs).path_to(24)
+    assert path.total_cost == pytest.approx(0.4 * math.sqrt(2))
+
+
+def test_unreachable():
+    arrays = HalfEdgeArrays.from_edge_list([(0, 0), (1, 0), (5, 5)], [(0, 1)])
+    result = dijkstra_arrays(arrays, 0)
+    assert result.path_to(2) is None
+    assert result.path_to(0).vertices.tolist() == [0]
+
+
+def build_square(diagonal_weight=None):
+    vertices = [Vertex(0, 0), Vertex(1, 0), Vertex(1, 1), Vertex(0, 1)]
+    builder = HalfEdgeBuilder()
+    for a, b in [(0, 1), (1, 2), (2, 3), (3, 0)]:
+        builder.add_edge(vertices[a], vertices[b])
+    builder.add_edge(vertices[0], vertices[2], weight=diagonal_weight)
+    _, edges = builder.build()
+    return vertices, edges
+
+
+@pytest.mark.parametrize('search', [dijkstra, a_star])
+@pytest.mark.parametrize('diagonal_weight, expected', [(None, 2), (3.0, 3)])
+def test_object_search_uses_lengths(search, diagonal_weight, expected):
+    vertices, edges = build_square(diagonal_weight)
+    start = next(e for e in edges if e.V is vertices[0])
+    target = next(e for e in edges if e.S.V is vertices[2]).Sym()
+
+    came_from = search(start, target)
+    path = reconstruct_path(came_from, vertices[0].Vertex_id, vertices[2].Vertex_id)
+
+    assert len(path) == expected
+    assert vertices[2].distance == pytest.approx(math.sqrt(2) if diagonal_weight is None else 2.0)
+
+
+def test_edge_weights_update_only_affected_entries(grid):
+    weights = EdgeWeights(grid)
+    seen = []
+
+    def doubled(w, half_edges):
+        seen.append(len(half_edges))
+        return 2 * w.lengths[half_edges]
+
+    assert np.allclose(weights.costs(doubled), 2 * grid.lengths)
+    weights.set_weight([0], 7.0)
+    weights.move_vertices([24], [(5.0, 4.0)])
+    costs = weights.costs()
+    doubled_costs = weights.costs(doubled)
+
+    assert seen == [grid.n_half_edges, 2 + 2 * 3]
+    assert costs[0] == costs[grid.twin[0]] == 7.0
+    moved = (grid.origin == 24) | (grid.target == 24)
+    assert np.allclose(weights.lengths[~moved], grid.lengths[~moved])
+    assert weights.lengths[(grid.origin == 23) & (grid.target == 24)] == pytest.approx(2.0)
+    assert np.allclose(doubled_costs, 2 * weights.lengths)
+
+
+def test_search_with_weight_function(grid):
+    weights = weights_for(grid)
+
+    def avoid_diagonals(w, half_edges):
+        return np.where(w.lengths[half_edges] > 1.01, 100.0, w.lengths[half_edges])
+
+    path = dijkstra_arrays(grid, 0, 24, costs=weights, weight_fn=avoid_diagonals).path_to(24)
+    assert path.total_cost == pytest.approx(8.0)
+    assert dijkstra_arrays(grid, 0, 24).path_to(24).total_cost == pytest.approx(4 * math.sqrt(2))
+
+
+def test_per_query_weight_functions_are_not_kept(grid):
+    weights = EdgeWeights(grid, max_cached=2)
+    weights.costs()
+    calls = []
+    for i in range(10):
+        def scaled(w, half_edges, i=i):
+            calls.append(len(half_edges))
+            return (i + 1) * w.lengths[half_edges]
+        path = dijkstra_arrays(grid, 0, 24, costs=weights, weight_fn=scaled).path_to(24)
+        assert path.total_cost == pytest.approx((i + 1) * 4 * math.sqrt(2))
+    # Evaluated once per query, and only the two latest stay cached
+    assert calls == [grid.n_half_edges] * 10
+    assert len(weights._cache) == 3
+
+    calls.clear()
+    weights.move_vertices([24], [(5.0, 4.0)])
+    weights.costs()
+    assert len(calls) == 2
@@ -0,0 +1,130 @@
+import numpy as np
+
+from src.algorithms.incremental_delaunay import IncrementalDelaunay, triangulate
+from src.visualization.playback import TriangulationPlayer
+
+
+def recorded(n=300, seed=0):
+    coords = np.random.default_rng(seed).uniform(0, 100, (n, 2))
+    dt = IncrementalDelaunay(coords, record=True).insert_all()
+    dt.finish()
+    return dt
+
+
+def pair_set(pairs):
+    return set(map(tuple, np.sort(pairs, axis=1).tolist()))
+
+
+def test_replay_ends_at_the_triangulation():
+    dt = recorded()
+    player = TriangulationPlayer(dt.log, events_per_frame=7)
+    shown = set()
+    for frame in player.frames():
+        removed, added = pair_set(frame.removed), pair_set(frame.added)
+        assert removed <= shown and not added & shown
+        shown = (shown - removed) | added
+        assert pair_set(player.edges()) == shown
+    assert shown == pair_set(dt.edges())
+    assert player.frame_count == -(-len(dt.log) // 7)
+
+
+def test_frames_hold_net_changes():
+    dt = recorded(50)
+    one = TriangulationPlayer(dt.log, events_per_frame=len(dt.log)).advance(len(dt.log))
+    # Edges created and flipped away inside the frame are not reported
+    assert len(one.removed) == 0
+    assert pair_set(one.added) == pair_set(dt.edges())
+    assert sorted(one.points.tolist()) == list(range(50))
+    assert one.segments().shape == (len(dt.edges()), 4)
+
+
+def test_enclosing_edges_are_hidden_unless_asked():
+    _, log = triangulate(np.random.default_rng(1).uniform(0, 1, (20, 2)), record=True)
+    hidden = TriangulationPlayer(log).advance(2)
+    shown = TriangulationPlayer(log, show_enclosing=True).advance(2)
+    assert len(hidden.added) == 0 and len(shown.added) == 3
+    assert (TriangulationPlayer(log, show_enclosing=True).edges() >= 20).all()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        assert seconds > 0
+        self.now += seconds
+
+
+def test_play_keeps_speed_with_a_slow_visualizer():
+    dt = recorded(200)
+    total = len(dt.log)
+
+    clock = FakeClock()
+    fast = TriangulationPlayer(dt.log, events_per_frame=10)
+    frames = fast.play(lambda frame: None, fps=10, clock=clock, sleep=clock.sleep)
+    assert frames == -(-total // 10)
+    assert abs(clock.now - (frames - 1) / 10) < 1e-9
+
+    # Every draw takes four frame periods: frames cover four times more events
+    clock = FakeClock()
+    slow = TriangulationPlayer(dt.log, events_per_frame=10)
+    sizes = []
+
+    def draw(frame):
+        sizes.append(frame.stop - frame.start)
+        clock.now += 0.4
+
+    frames = slow.play(draw, fps=10, clock=clock, sleep=clock.sleep)
+    assert slow.position == total
+    assert frames < total / 20
+    assert max(sizes[1:-1]) >= 30
+    assert pair_set(slow.edges()) == pair_set(dt.edges())
+
+
+def test_for_duration():
+    dt = recorded(100)
+    player = TriangulationPlayer.for_duration(dt.log, seconds=2, fps=25)
+    assert len(list(player.frames())) <= 50
+
+
+def test_visualizers_draw_frames(make_visualizer):
+    import matplotlib
+    matplotlib.use('Agg')
+    from src.visualization.mpl_visualizer import MatplotlibVisualizer
+
+    dt = recorded(40)
+    turtle = make_visualizer()
+    mpl = MatplotlibVisualizer()
+    try:
+        for frame in TriangulationPlayer(dt.log, events_per_frame=25).frames():
+            turtle.draw_frame(frame)
+            mpl.draw_frame(frame)
+            assert len(mpl.edges.get_segments()) == len(frame.player.edges())
+        strokes = turtle.turtle.strokes
+        assert turtle.screen.updates == -(-len(dt.log) // 25)
+        # The last stroke over every final edge is black
+        last = {frozenset((a, b)): color for color, a, b in strokes}
+        coords = dt.log.coords
+        for a, b in dt.edges().tolist():
+            assert last[frozenset((tuple(coords[a]), tuple(coords[b])))] == "black"
+    finally:
+        mpl.close()
+
+
+def test_turtle_frames_redraw_edges_at_erased_ends(make_visualizer):
+    dt = recorded(60)
+    turtle = make_visualizer()
+    coords = dt.log.coords
+    for frame in TriangulationPlayer(dt.log, events_per_frame=5).frames():
+        turtle.turtle.strokes.clear()
+        turtle.draw_frame(frame)
+        strokes = turtle.turtle.strokes
+        erased_ends = {p for color, a, b in strokes if color == "white" for p in (a, b)}
+        black = {frozenset((a, b)) for color, a, b in strokes if color == "black"}
+        for a, b in frame.player.edges().tolist():
+            ends = (tuple(coords[a]), tuple(coords[b]))
+            if erased_ends & set(ends):
+                assert frozenset(ends) in black
@@ -0,0 +1,105 @@
+import struct
+import zlib
+
+import numpy as np
+
+from src.algorithms.pathfinding import dijkstra_arrays
+from src.visualization import raster
+from src.visualization.raster import RasterImage, clip_segments, encode_png, render_mesh
+from benchmarks.common import grid_triangulation
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+def drawn(image):
+    """(x, y) of the pixels that are not background."""
+    ys, xs = np.nonzero((image.pixels != 255).any(axis=2))
+    return set(zip(xs.tolist(), ys.tolist()))
+
+
+def decode_png(data):
+    """Pixels of an 8-bit RGB PNG with unfiltered rows."""
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    pos, chunks = 8, {}
+    while pos < len(data):
+        length, = struct.unpack('>I', data[pos:pos + 4])
+        kind = data[pos + 4:pos + 8]
+        body = data[pos + 8:pos + 8 + length]
+        assert struct.unpack('>I', data[pos + 8 + length:pos + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b'') + body
+        pos += 12 + length
+    width, height = struct.unpack('>II', chunks[b'IHDR'][:8])
+    rows = np.frombuffer(zlib.decompress(chunks[b'IDAT']), dtype=np.uint8).reshape(height, -1)
+    assert (rows[:, 0] == 0).all()
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def test_lines_cover_one_pixel_per_step():
+    image = RasterImage(10, 10)
+    image.draw_segments(np.array([[1.5, 2.5, 7.5, 2.5], [0.5, 0.5, 5.5, 5.5]]), BLACK)
+    expected = {(x, 2) for x in range(1, 8)} | {(k, k) for k in range(6)}
+    assert drawn(image) == expected
+
+
+def test_wide_lines_and_colors_per_segment():
+    image = RasterImage(10, 10)
+    image.draw_segments(np.array([[2.5, 5.5, 6.5, 5.5], [8.5, 0.5, 8.5, 2.5]]),
+                        np.array([[255, 0, 0], [0, 255, 0]]), width=3)
+    red = (image.pixels == [255, 0, 0]).all(axis=2)
+    green = (image.pixels == [0, 255, 0]).all(axis=2)
+    # Every sample is stamped with a 3x3 square, so ends grow by a pixel
+    assert red.sum() == 7 * 3 and red[4:7, 1:8].all()
+    assert green.sum() == 3 * 4 and green[0:4, 7:10].all()
+
+
+def test_clipping_keeps_long_segments_cheap():
+    segments = np.array([[-1e6, 5.0, 1e6, 5.0], [-5.0, -5.0, -1.0, -1.0], [20.0, 0.0, 30.0, 0.0]])
+    clipped, index = clip_segments(segments, 10, 10)
+    assert index.tolist() == [0]
+    assert np.allclose(clipped, [[0, 5, 10, 5]])
+
+    image = RasterImage(10, 10)
+    image.draw_segments(segments, BLACK)
+    assert drawn(image) == {(x, 5) for x in range(10)}
+
+
+def test_fill_triangles_either_orientation():
+    for corners in ([(0, 0), (8, 0), (0, 8)], [(0, 0), (0, 8), (8, 0)]):
+        image = RasterImage(10, 10)
+        image.fill_triangles(np.array([corners], dtype=float), BLACK)
+        # Pixel centers (x + 0.5, y + 0.5) with x + y + 1 <= 8
+        assert drawn(image) == {(x, y) for x in range(8) for y in range(8) if x + y <= 7}
+
+
+def test_chunks_give_the_same_image(monkeypatch):
+    arrays = grid_triangulation(20, 20)
+    full = render_mesh(arrays, 64, face_color=(200, 200, 200)).pixels.copy()
+    monkeypatch.setattr(raster, 'CHUNK_PIXELS', 7)
+    assert (render_mesh(arrays, 64, face_color=(200, 200, 200)).pixels == full).all()
+
+
+def test_render_mesh_fits_with_margin():
+    arrays = grid_triangulation(10, 5)
+    image = render_mesh(arrays, 100, 60, margin=4)
+    xs, ys = zip(*drawn(image))
+    assert min(xs) >= 4 and max(xs) <= 95
+    assert min(ys) >= 4 and max(ys) <= 55
+    # The wide mesh is fitted to the width, not to the smaller height
+    assert max(xs) - min(xs) >= 90
+
+
+def test_path_overlay():
+    arrays = grid_triangulation(10, 10, jitter=0.0)
+    path = dijkstra_arrays(arrays, 0, 9).path_to(9)
+    image = render_mesh(arrays, 100, edge_color=None, paths=[path])
+    row = image.view.apply(arrays.coords[:1])[0, 1]
+    orange = (image.pixels == [255, 165, 0]).all(axis=2)
+    assert orange.any() and set(np.nonzero(orange)[0].tolist()) <= {int(row) - 1, int(row), int(row) + 1}
+
+
+def test_png_round_trip(tmp_path):
+    image = render_mesh(grid_triangulation(8, 8), 40, 30, face_color=(10, 200, 30))
+    assert (decode_png(image.to_png()) == image.pixels).all()
+    image.save(tmp_path / 'mesh.png')
+    assert (tmp_path / 'mesh.png').read_bytes() == encode_png(image.pixels)
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt6.QtWidgets import QApplication
+
+from src.algorithms.spatial_index import EdgeGrid, segment_distances
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.visualization.gui import HalfEdgeCanvas
+from benchmarks.common import grid_triangulation
+
+
+def test_segment_distances():
+    segments = np.array([[0, 0, 2, 0], [0, 0, 0, 0], [0, 1, 0, 3]], dtype=float)
+    assert np.allclose(segment_distances((1, 1), segments), [1, np.sqrt(2), 1])
+    assert np.allclose(segment_distances((3, 4), segments), [np.sqrt(17), 5, np.sqrt(10)])
+
+
+def test_nearest_matches_brute_force():
+    arrays = grid_triangulation(30, 20)
+    grid = EdgeGrid.from_arrays(arrays)
+    assert len(grid) == arrays.n_half_edges // 2
+    rng = np.random.default_rng(1)
+    for point in rng.uniform(-10, 40, (200, 2)):
+        edge, distance = grid.nearest(tuple(point))
+        brute = segment_distances(tuple(point), grid.segments)
+        assert distance == pytest.approx(brute.min())
+        a, b = arrays.coords[arrays.origin[edge]], arrays.coords[arrays.target[edge]]
+        assert segment_distances(tuple(point), np.hstack([a, b])[None])[0] == pytest.approx(distance)
+
+
+def test_few_candidates_per_query():
+    grid = EdgeGrid.from_arrays(grid_triangulation(100, 100))
+    sizes = [len(grid.candidates((x + 0.3, x * 0.7 + 0.2), grid.cell_size / 2)) for x in range(1, 90, 7)]
+    assert max(sizes) < 50
+
+
+def test_max_distance_and_long_segments():
+    segments = [(0, 0, 1, 0), (5, 5, 5.5, 5), (2, 2, 2.5, 2), (-100, 50, 100, 50)]
+    grid = EdgeGrid(np.array(segments, dtype=float), cell_size=1.0)
+    assert grid.long_segments.tolist() == [3]
+    assert grid.nearest((0.5, 0.1)) == (0, pytest.approx(0.1))
+    assert grid.nearest((0, 49)) == (3, pytest.approx(1.0))
+    assert grid.nearest((3, 20), max_distance=5) == (-1, np.inf)
+    assert grid.nearest((300, 300))[0] == 3
+
+
+def test_empty_grid():
+    assert EdgeGrid(np.empty((0, 4))).nearest((0, 0)) == (-1, np.inf)
+
+
+def test_canvas_picks_edge_through_index():
+    app = QApplication.instance() or QApplication([])
+    arrays = HalfEdgeArrays.from_edge_list([(0, 0), (100, 0), (0, 100)], [(0, 1), (1, 2), (2, 0)])
+    vertices, edges = arrays.to_half_edges()
+    canvas = HalfEdgeCanvas()
+    canvas.set_data(vertices, edges)
+    picked = []
+    canvas.edge_selected.connect(picked.append)
+    canvas.select_nearest_edge((50, 3))
+    assert {picked[0].V.getxy(), picked[0].S.V.getxy()} == {(0, 0), (100, 0)}
+    canvas.select_nearest_edge((300, 300))
+    assert len(picked) == 1
+    # replacing the edge list rebuilds the index
+    canvas.edges = edges[:2]
+    assert len(canvas.edge_scene()) == 2
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.core.half_edge_ds import Vertex
+from src.core.half_edge_builder import HalfEdgeBuilder
+from src.core.half_edge_arrays import HalfEdgeArrays
+from src.algorithms.traversal import bfs, bfs_layers, connected_components
+from benchmarks.common import grid_triangulation
+
+
+@pytest.fixture
+def grid():
+    return grid_triangulation(6, 6, jitter=0)
+
+
+def test_hop_layers(grid):
+    result = bfs_layers(grid, 0)
+    x, y = grid.coords[:, 0].astype(int), grid.coords[:, 1].astype(int)
+
+    # with one diagonal per cell, the hop distance from the corner is max(x, y)
+    assert np.array_equal(result.hops, np.maximum(x, y))
+    assert [len(layer) for layer in result.layers] == [1, 3, 5, 7, 9, 11]
+    path = result.path_to(35)
+    assert path.vertices.tolist() == [0, 7, 14, 21, 28, 35]
+    assert path.cost.tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_multi_source_and_depth_limit(grid):
+    result = bfs_layers(grid, [0, 35], max_hops=2)
+    assert result.hops[0] == result.hops[35] == 0
+    assert result.hops[14] == 2 and result.hops[21] == 2
+    assert (result.hops == -1).sum() == 36 - 9 - 9
+    assert result.path_to(21).vertices[0] == 35
+
+
+def test_connected_components():
+    block = grid_triangulation(3, 3, jitter=0)
+    first = np.arange(block.n_half_edges) < block.twin
+    edges = np.column_stack([block.origin[first], block.target[first]])
+    arrays = HalfEdgeArrays.from_edge_list(np.vstack([block.coords, block.coords + (10, 0), [(50, 50)]]),
+                                           np.vstack([edges, edges + 9]))
+
+    count, labels = connected_components(arrays)
+    assert count == 3
+    assert len(set(labels[:9])) == 1 and len(set(labels[9:18])) == 1
+    assert labels[0] != labels[9] != labels[18]
+    assert bfs_layers(arrays, 0).path_to(10) is None
+
+
+def test_object_bfs_reaches_every_vertex():
+    vertices = [Vertex(0, 0), Vertex(1, 0), Vertex(1, 1), Vertex(0, 1)]
+    builder = HalfEdgeBuilder()
+    for a, b in [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]:
+        builder.add_edge(vertices[a], vertices[b])
+    _, edges = builder.build()
+
+    explored = bfs(edges[0])
+    assert sorted(e.V.Vertex_id for e in explored) == sorted(v.Vertex_id for v in vertices)
+    assert not any(v.visited for v in vertices)
@@ -0,0 +1,92 @@
+import pytest
+
+from src.core.half_edge_ds import HalfEdge, Vertex
+from src.visualization.turtle_visualizer import delaunay_inserter, drawing_plan, edge_key
+from src.visualization.view_transform import ViewTransform
+from benchmarks.common import grid_triangulation
+
+
+def mesh(n=4):
+    vertices, edges = grid_triangulation(n, n).to_half_edges()
+    return vertices, edges
+
+
+def test_plan_lists_every_edge_and_vertex_once():
+    vertices, edges = mesh()
+    with_twins = edges + [e.S for e in edges] + edges[:5]
+    unique, labelled = drawing_plan(with_twins)
+    assert len(unique) == len(edges)
+    assert len({edge_key(e) for e in unique}) == len(edges)
+    assert sorted(v.Vertex_id for v in labelled) == sorted(v.Vertex_id for v in vertices)
+
+
+def test_draw_strokes_each_edge_once_and_updates_once(make_visualizer):
+    vertices, edges = mesh()
+    visualizer = make_visualizer()
+    visualizer.set_edges(edges)
+    visualizer.draw_delaunay_triangulation(vertices)
+
+    assert len(visualizer.turtle.strokes) == len(edges)
+    assert sorted(visualizer.turtle.labels) == sorted(v.Vertex_id for v in vertices)
+    assert visualizer.screen.updates == 1
+
+
+def test_update_draws_only_changed_edges(make_visualizer):
+    vertices, edges = mesh()
+    visualizer = make_visualizer()
+    visualizer.draw_edges(edges)
+    visualizer.turtle.strokes.clear()
+
+    # Drop one edge and add one to a new vertex
+    new = Vertex(10.0, 10.0)
+    added = HalfEdge(vertices[0], new)
+    visualizer.update_edges(edges[1:] + [added])
+
+    colors = [color for color, _, _ in visualizer.turtle.strokes]
+    assert colors.count("white") == 1
+    erased = [stroke for stroke in visualizer.turtle.strokes if stroke[0] == "white"][0]
+    assert set(erased[1:]) == {edges[0].V.getxy(), edges[0].S.V.getxy()}
+    # The new edge plus the kept edges at the two vertices of the erased one
+    ends = {edges[0].V.Vertex_id, edges[0].S.V.Vertex_id}
+    kept = [e for e in edges[1:] if e.V.Vertex_id in ends or e.S.V.Vertex_id in ends]
+    assert colors.count("black") == 1 + len(kept)
+    assert new.Vertex_id in visualizer.turtle.labels
+    assert visualizer.screen.updates == 2
+    assert edge_key(edges[0]) not in visualizer._drawn
+
+
+def test_view_maps_mesh_to_screen_and_clicks_back(make_visualizer):
+    vertices, edges = mesh()
+    coords = [v.getxy() for v in vertices]
+    view = ViewTransform.fit(coords, screen_center=(0.0, 0.0))
+    visualizer = make_visualizer(view)
+    visualizer.draw_edges(edges)
+
+    # The vertices keep their mesh coordinates; only the strokes are moved
+    screen = {tuple(p) for p in view.apply(coords).tolist()}
+    assert {p for _, start, end in visualizer.turtle.strokes for p in (start, end)} == screen
+    assert [v.getxy() for v in vertices] == coords
+
+    inserted = []
+    visualizer.insert_point = lambda vertex: inserted.append(vertex.getxy()) or edges
+    visualizer.add_point(*view.apply(coords[5]))
+    assert inserted[0] == pytest.approx(coords[5])
+
+
+def test_add_point_redraws_the_triangulation_diff(make_visualizer):
+    vertices = [Vertex(x, y) for x, y in [(0, 0), (100, 0), (100, 100), (0, 100)]]
+    visualizer = make_visualizer()
+    visualizer.insert_point = delaunay_inserter(vertices)
+    visualizer.add_point(30.0, 60.0)
+    # 5 points with 4 on the hull: 3 * 5 - 3 - 4 edges
+    assert len(visualizer._drawn) == 8
+
+    before = set(visualizer._drawn)
+    visualizer.turtle.strokes.clear()
+    visualizer.add_point(70.0, 20.0)
+    after = set(visualizer._drawn)
+    assert len(after) == 11
+    colors = [color for color, _, _ in visualizer.turtle.strokes]
+    assert colors.count("white") == len(before - after)
+    assert len(after - before) <= colors.count("black") < len(after)
+    assert len(vertices) == 4